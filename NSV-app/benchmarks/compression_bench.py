@@ -0,0 +1,90 @@
+"""
+Bytes on the wire and CPU cost per response for each compression level.
+
+Payloads are built from the scraped sample in article_text.txt:
+- a single article (GET /articles/<id>)
+- the latest five articles (GET /latest-articles)
+- a 200 article listing (GET /articles)
+Listing articles reuse the sample's sentences in shuffled order, so the listing
+ratios are optimistic compared to a table of unrelated articles.
+
+Usage: python benchmarks/compression_bench.py [--repeat 20]
+"""
+import json
+import os
+import random
+
+from harness import REPO_ROOT, argument_parser, time_each
+from compression import brotli, brotli_compressor, gzip_compressor
+
+SAMPLE_FILE = os.path.join(REPO_ROOT, 'article_text.txt')
+
+
+def make_article(article_id, content):
+    return {
+        'article_id': article_id,
+        'url': f'https://www.bbc.com/news/articles/{article_id}',
+        'title': 'The truth behind your $12 dress',
+        'content': content,
+        'author': 'BBC',
+        'publish_date': '2024-11-12T00:00:00',
+        'ml_model_prediction': 1.0,
+        'source_credibility': 0.0,
+        'sentiment_subjectivity': 0.57,
+        'content_consistency': 0.85,
+        'trust_score': 0.84,
+        'status': 'verified',
+        'created_at': '2024-11-12T10:00:00',
+        'updated_at': '2024-11-12T10:00:00',
+    }
+
+
+def build_payloads():
+    with open(SAMPLE_FILE, encoding='utf-8') as file:
+        sentences = file.read().split('. ')
+
+    def content(article_id):
+        # Shuffled sentences so a listing is not just the same article repeated
+        shuffled = list(sentences)
+        random.Random(article_id).shuffle(shuffled)
+        return '. '.join(shuffled)
+
+    return {
+        'single article': json.dumps(make_article(1, content(1))).encode('utf-8'),
+        'latest-articles (5)': json.dumps([make_article(i, content(i)) for i in range(5)]).encode('utf-8'),
+        'listing (200)': json.dumps([make_article(i, content(i)) for i in range(200)]).encode('utf-8'),
+    }
+
+
+def measure(body, factory, level, repeat):
+    def compress_once(_):
+        compress, _, finish = factory(level)
+        return compress(body) + finish()
+
+    compressed, seconds = time_each(compress_once, range(repeat))
+    return len(compressed[-1]), 1000 * sum(seconds) / repeat
+
+
+def main():
+    parser = argument_parser(__doc__)
+    parser.add_argument('--repeat', type=int, default=20)
+    args = parser.parse_args()
+
+    encoders = [('gzip', gzip_compressor, range(1, 10))]
+    if brotli is not None:
+        encoders.append(('br', brotli_compressor, range(0, 12)))
+    else:
+        print('brotli is not installed, only gzip is measured\n')
+
+    for name, body in build_payloads().items():
+        print(f'{name}: {len(body):,} bytes uncompressed')
+        print(f'  {"encoding":<8} {"level":>5} {"bytes":>12} {"ratio":>7} {"ms/response":>12}')
+        for encoding, factory, levels in encoders:
+            for level in levels:
+                size, ms = measure(body, factory, level, args.repeat)
+                print(f'  {encoding:<8} {level:>5} {size:>12,} {len(body) / size:>6.1f}x {ms:>12.3f}')
+        print()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,89 @@
+"""
+Load time and peak RSS of the GloVe text parser vs. the memory-mapped binary store.
+
+Each variant runs in a fresh interpreter so peak RSS (ru_maxrss) is not shared:
+- text:   the old line-by-line parse into a dict of NumPy arrays
+- binary: GloveStore.load (memory map) + get_embedding_matrix-style gather of the tokenizer vocabulary
+
+Without --embedding-file a synthetic GloVe-format file is generated.
+
+Usage: python NSV-app/benchmarks/glove_bench.py [--embedding-file glove.6B.50d.txt] [--words 400000]
+"""
+import os
+import random
+import tempfile
+
+from harness import argument_parser, run_snippet
+
+TEXT_SNIPPET = """
+import json, time
+import numpy as np
+start = time.perf_counter()
+word_to_vector = {{}}
+with open({path!r}, encoding='utf-8') as f:
+    for line in f:
+        values = line.split()
+        word_to_vector[values[0]] = np.asarray(values[1:], dtype='float32')
+matrix = np.zeros(({vocab}, {dim}))
+for i, word in enumerate(list(word_to_vector)[:{vocab}]):
+    matrix[i] = word_to_vector[word]
+seconds = time.perf_counter() - start
+from harness import max_rss_mb
+print(json.dumps([seconds, max_rss_mb()]))
+"""
+
+BINARY_SNIPPET = """
+import json, time
+from glove_store import GloveStore, store_prefix
+start = time.perf_counter()
+store = GloveStore.load(store_prefix({path!r}))
+word_to_index = {{word: i for i, word in enumerate(store.words[:{vocab}])}}
+matrix = store.gather(word_to_index, {vocab})
+seconds = time.perf_counter() - start
+from harness import max_rss_mb
+print(json.dumps([seconds, max_rss_mb()]))
+"""
+
+
+def write_synthetic_glove(path, words, dim, seed=18):
+    rng = random.Random(seed)
+    with open(path, 'w', encoding='utf-8') as file:
+        for i in range(words):
+            values = ' '.join(f'{rng.uniform(-1, 1):.5f}' for _ in range(dim))
+            file.write(f'word{i} {values}\n')
+
+
+def run(snippet):
+    measured, error = run_snippet(snippet)
+    if error:
+        raise RuntimeError(error)
+    return measured
+
+
+def main():
+    parser = argument_parser(__doc__)
+    parser.add_argument('--embedding-file')
+    parser.add_argument('--words', type=int, default=400000, help='synthetic vocabulary size')
+    parser.add_argument('--dim', type=int, default=50)
+    parser.add_argument('--vocab', type=int, default=20000, help='tokenizer vocabulary size (MAX_VOCAB_SIZE)')
+    args = parser.parse_args()
+
+    from glove_store import convert_glove
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = args.embedding_file
+        if path is None:
+            path = os.path.join(tmp, 'glove.synthetic.txt')
+            write_synthetic_glove(path, args.words, args.dim)
+        convert_glove(path)
+
+        text_seconds, text_rss = run(TEXT_SNIPPET.format(path=path, vocab=args.vocab, dim=args.dim))
+        binary_seconds, binary_rss = run(BINARY_SNIPPET.format(path=path, vocab=args.vocab))
+
+    print(f'{"variant":<8} {"load s":>8} {"peak RSS MB":>12}')
+    print(f'{"text":<8} {text_seconds:>8.3f} {text_rss:>12.1f}')
+    print(f'{"binary":<8} {binary_seconds:>8.3f} {binary_rss:>12.1f}')
+
+
+if __name__ == '__main__':
+    main()
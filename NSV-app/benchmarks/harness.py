@@ -0,0 +1,88 @@
+"""
+What the benchmark scripts share: repository paths, the command line, timing loops, latency
+percentiles and running a measurement in a fresh interpreter. Each *_bench.py keeps only its workload.
+
+A measurement that runs in a fresh interpreter (so imports and peak RSS are its own) is a Python
+snippet or script that prints one JSON object as its last line of output.
+"""
+import argparse
+import json
+import os
+import resource
+import subprocess
+import sys
+import time
+
+import numpy as np
+
+BENCHMARKS_DIR = os.path.abspath(os.path.dirname(__file__))
+APP_DIR = os.path.dirname(BENCHMARKS_DIR)
+REPO_ROOT = os.path.dirname(APP_DIR)
+MODELS_DIR = os.path.join(APP_DIR, 'models')
+MODEL_PREP_DIR = os.path.join(REPO_ROOT, 'model_prep')
+
+# Import roots of the benchmarked code, in this interpreter and in every snippet
+IMPORT_PATHS = [MODELS_DIR, MODEL_PREP_DIR, APP_DIR, REPO_ROOT, BENCHMARKS_DIR]
+sys.path[:0] = [path for path in IMPORT_PATHS if path not in sys.path]
+
+SNIPPET_PRELUDE = f"import sys\nsys.path[:0] = {IMPORT_PATHS!r}\n"
+
+
+def argument_parser(doc):
+    """A parser described by the first line of the benchmark's module docstring."""
+    return argparse.ArgumentParser(description=doc.strip().splitlines()[0])
+
+
+def timed(call):
+    """call() -> (its result, seconds it took)."""
+    start = time.perf_counter()
+    result = call()
+    return result, time.perf_counter() - start
+
+
+def time_each(call, items):
+    """call(item) for every item -> (the results, the seconds each call took)."""
+    results, seconds = [], []
+    for item in items:
+        start = time.perf_counter()
+        results.append(call(item))
+        seconds.append(time.perf_counter() - start)
+    return results, seconds
+
+
+def batches(items, batch_size):
+    return [items[offset:offset + batch_size] for offset in range(0, len(items), batch_size)]
+
+
+def latency_summary(seconds):
+    """
+    p50/p95/p99 and mean of a list of durations, in milliseconds.
+    """
+    milliseconds = 1000 * np.asarray(seconds)
+    return {
+        "p50_ms": float(np.percentile(milliseconds, 50)),
+        "p95_ms": float(np.percentile(milliseconds, 95)),
+        "p99_ms": float(np.percentile(milliseconds, 99)),
+        "mean_ms": float(milliseconds.mean()),
+    }
+
+
+def max_rss_mb():
+    """Peak resident set size of this process (ru_maxrss is in KiB on Linux)."""
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def run_python(*args):
+    """
+    Runs a fresh interpreter with args from the repository root -> (its last output line as JSON, None),
+    or (None, the last line of stderr) if it failed.
+    """
+    result = subprocess.run([sys.executable, *args], cwd=REPO_ROOT, capture_output=True, text=True)
+    if result.returncode != 0:
+        return None, result.stderr.strip().splitlines()[-1]
+    return json.loads(result.stdout.strip().splitlines()[-1]), None
+
+
+def run_snippet(snippet):
+    """run_python on a source snippet, with the benchmark import paths already on its sys.path."""
+    return run_python('-c', SNIPPET_PRELUDE + snippet)
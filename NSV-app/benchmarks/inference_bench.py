@@ -0,0 +1,179 @@
+"""
+Speed and accuracy of both fake-news models across runtime backends, as a JSON report.
+
+Backends: tfidf (model_testing.predict_news_batch), keras (MLModel on the .h5), tflite and tflite-int8
+(MLModel on exported flatbuffers, see model_prep/export_model.py). Each backend runs in a fresh
+interpreter on the same corpus and reports load time, peak RSS, single-article latency percentiles,
+batched latency and throughput, accuracy and ROC AUC.
+
+With --baseline, the run is compared to an earlier report and exits non-zero when latency or
+throughput regress by more than --max-regression or accuracy/AUC drop by more than --max-accuracy-drop.
+
+Run from the repository root:
+    python NSV-app/benchmarks/inference_bench.py [--dataset model_prep/news.csv --limit 2000]
+        [--keras model_prep/fake_news_model.h5] [--tflite model_prep/fake_news_model.tflite]
+        [--tflite-int8 model_prep/fake_news_model.int8.tflite] [--vocab tokenizer_vocab.json]
+        [--output report.json] [--baseline previous.json]
+"""
+import argparse
+import json
+import os
+import platform
+import sys
+import tempfile
+from datetime import datetime
+
+from harness import (MODEL_PREP_DIR, argument_parser, batches, latency_summary, max_rss_mb, run_python, time_each,
+                     timed)
+
+# Metrics checked against --baseline; throughput, accuracy and auc are higher-is-better
+COMPARED = ('single_p95_ms', 'batch_p95_ms', 'max_rss_mb', 'throughput', 'accuracy', 'auc')
+LOWER_IS_BETTER = {'single_p95_ms', 'batch_p95_ms', 'max_rss_mb'}
+
+
+def load_scorer(backend, model_path, vocab_path):
+    """
+    Returns score(texts) -> P(real) per text for one backend.
+    """
+    if backend == 'tfidf':
+        from model_testing import predict_news_batch
+        return lambda texts: predict_news_batch(texts, parallel=False)["probabilities"]
+    from ml_model import MLModel
+    model = MLModel()
+    model.load_tokenizer(vocab_path)
+    model.load_model(model_path)
+    if model.model is None:
+        raise RuntimeError(f"Could not load {model_path}.")
+    return model.predict_probabilities
+
+
+def run_worker(args):
+    import numpy as np
+    from evaluation import accuracy, roc_auc
+
+    with open(args.corpus, encoding='utf-8') as file:
+        corpus = json.load(file)
+    texts, labels = corpus['texts'], np.asarray(corpus['labels'])
+
+    def load():
+        score = load_scorer(args.worker, args.model_path, args.vocab)
+        score(texts[:2])  # first call pays lazy loads (WordNet, interpreter allocation)
+        return score
+
+    score, load_seconds = timed(load)
+    _, single = time_each(lambda text: score([text]), texts[:args.single])
+    scores, batch_seconds = time_each(score, batches(texts, args.batch_size))
+    probabilities = [float(p) for batch in scores for p in batch]
+
+    single_summary, batch_summary = latency_summary(single), latency_summary(batch_seconds)
+    print(json.dumps({
+        "load_seconds": load_seconds,
+        "max_rss_mb": max_rss_mb(),
+        "imports_tensorflow": 'tensorflow' in sys.modules,
+        **{f"single_{key}": value for key, value in single_summary.items()},
+        **{f"batch_{key}": value for key, value in batch_summary.items()},
+        "throughput": len(texts) / sum(batch_seconds),
+        "accuracy": accuracy(labels, probabilities),
+        "auc": roc_auc(labels, probabilities),
+    }))
+
+
+def compare(report, baseline, max_regression, max_accuracy_drop):
+    """
+    Lists the metrics of report that regressed against baseline beyond the tolerances.
+    """
+    regressions = []
+    for backend, metrics in report['backends'].items():
+        previous = baseline.get('backends', {}).get(backend)
+        if not previous or 'error' in metrics or 'error' in previous:
+            continue
+        for metric in COMPARED:
+            old, new = previous.get(metric), metrics.get(metric)
+            if old is None or new is None:
+                continue
+            if metric in ('accuracy', 'auc'):
+                regressed = old - new > max_accuracy_drop
+            elif metric in LOWER_IS_BETTER:
+                regressed = new > old * (1 + max_regression)
+            else:
+                regressed = new < old * (1 - max_regression)
+            if regressed:
+                regressions.append(f"{backend}.{metric}: {old:.4f} -> {new:.4f}")
+    return regressions
+
+
+def main():
+    parser = argument_parser(__doc__)
+    parser.add_argument('--dataset', help='labelled CSV (title, text, target); a generated corpus otherwise')
+    parser.add_argument('--limit', type=int, default=2000)
+    parser.add_argument('--keras', default=os.path.join(MODEL_PREP_DIR, 'fake_news_model.h5'))
+    parser.add_argument('--tflite', default=os.path.join(MODEL_PREP_DIR, 'fake_news_model.tflite'))
+    parser.add_argument('--tflite-int8', default=os.path.join(MODEL_PREP_DIR, 'fake_news_model.int8.tflite'))
+    parser.add_argument('--vocab', default=os.path.join(MODEL_PREP_DIR, 'tokenizer_vocab.json'))
+    parser.add_argument('--single', type=int, default=200, help='single-article calls per backend')
+    parser.add_argument('--batch-size', type=int, default=32)
+    parser.add_argument('--output', help='write the JSON report here (stdout otherwise)')
+    parser.add_argument('--baseline', help='earlier JSON report to compare against')
+    parser.add_argument('--max-regression', type=float, default=0.10)
+    parser.add_argument('--max-accuracy-drop', type=float, default=0.005)
+    parser.add_argument('--worker', help=argparse.SUPPRESS)
+    parser.add_argument('--model-path', help=argparse.SUPPRESS)
+    parser.add_argument('--corpus', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        return run_worker(args)
+
+    from evaluation import generated_corpus, load_labelled_csv
+    if args.dataset:
+        texts, labels = load_labelled_csv(args.dataset, args.limit)
+    else:
+        from model_testing import fake_news, real_news
+        texts, labels = generated_corpus(args.limit, fake_news, real_news)
+
+    backends = [('tfidf', None)] + [(name, path) for name, path in
+                                    (('keras', args.keras), ('tflite', args.tflite), ('tflite-int8', args.tflite_int8))
+                                    if os.path.exists(path)]
+    report = {
+        "meta": {
+            "created_at": datetime.utcnow().isoformat(),
+            "python": platform.python_version(),
+            "machine": platform.machine(),
+            "cpu_count": os.cpu_count(),
+            "corpus": args.dataset or 'generated',
+            "documents": len(texts),
+            "batch_size": args.batch_size,
+        },
+        "backends": {},
+    }
+    with tempfile.TemporaryDirectory() as tmp:
+        corpus_path = os.path.join(tmp, 'corpus.json')
+        with open(corpus_path, 'w', encoding='utf-8') as file:
+            json.dump({"texts": list(texts), "labels": [int(label) for label in labels]}, file)
+        for name, path in backends:
+            command = [os.path.abspath(__file__), '--worker', name, '--corpus', corpus_path,
+                       '--vocab', args.vocab, '--single', str(args.single), '--batch-size', str(args.batch_size)]
+            if path:
+                command += ['--model-path', path]
+            metrics, error = run_python(*command)
+            report['backends'][name] = {"error": error} if error else metrics
+            print(f'{name}: {report["backends"][name]}', file=sys.stderr)
+
+    output = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as file:
+            file.write(output + '\n')
+    else:
+        print(output)
+
+    if args.baseline:
+        with open(args.baseline, encoding='utf-8') as file:
+            regressions = compare(report, json.load(file), args.max_regression, args.max_accuracy_drop)
+        for regression in regressions:
+            print(f'REGRESSION {regression}', file=sys.stderr)
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,72 @@
+"""
+Startup, peak RSS and latency of the Keras model vs. its TFLite exports (float and int8 dynamic-range).
+
+Each backend runs in a fresh interpreter so imports and RSS (ru_maxrss) are not shared:
+- keras:  tensorflow.keras load_model(fake_news_model.h5)
+- tflite: MLModel's LiteModel on the exported flatbuffer(s)
+
+Exports are produced with model_prep/export_model.py first if they do not exist.
+
+Usage: python NSV-app/benchmarks/lite_bench.py [--model model_prep/fake_news_model.h5] [--runs 50]
+"""
+import os
+import subprocess
+import sys
+
+from harness import MODEL_PREP_DIR, argument_parser, run_snippet
+
+SNIPPET = """
+import json, time
+start = time.perf_counter()
+import numpy as np
+{load}
+load_seconds = time.perf_counter() - start
+from harness import latency_summary, max_rss_mb, time_each
+rng = np.random.default_rng(18)
+latencies = {{}}
+for batch_size in (1, 32):
+    sequences = rng.integers(0, 20000, size=(batch_size, {maxlen})).astype(np.int32)
+    model.predict_on_batch(sequences)
+    _, runs = time_each(lambda _: model.predict_on_batch(sequences), range({runs}))
+    latencies[batch_size] = latency_summary(runs)['p50_ms']
+print(json.dumps([load_seconds, max_rss_mb(), latencies[1], latencies[32], 'tensorflow' in sys.modules]))
+"""
+
+KERAS_LOAD = """
+from tensorflow.keras.models import load_model
+model = load_model({path!r})
+"""
+
+LITE_LOAD = """
+from lite_model import LiteModel
+model = LiteModel({path!r})
+"""
+
+
+def main():
+    parser = argument_parser(__doc__)
+    parser.add_argument('--model', default=os.path.join(MODEL_PREP_DIR, 'fake_news_model.h5'))
+    parser.add_argument('--maxlen', type=int, default=100)
+    parser.add_argument('--runs', type=int, default=50)
+    args = parser.parse_args()
+
+    root = os.path.splitext(args.model)[0]
+    variants = [('keras', KERAS_LOAD.format(path=args.model))]
+    for name, path, flags in [('tflite', root + '.tflite', []), ('tflite-int8', root + '.int8.tflite', ['--quantize'])]:
+        if not os.path.exists(path):
+            subprocess.run([sys.executable, os.path.join(MODEL_PREP_DIR, 'export_model.py'), args.model,
+                            '--output', path, *flags], cwd=MODEL_PREP_DIR, check=True)
+        variants.append((name, LITE_LOAD.format(path=path)))
+
+    print(f'{"backend":<12} {"load s":>8} {"peak RSS MB":>12} {"p50 b=1 ms":>11} {"p50 b=32 ms":>12} {"imports TF":>11}')
+    for name, load in variants:
+        measured, error = run_snippet(SNIPPET.format(load=load, maxlen=args.maxlen, runs=args.runs))
+        if error:
+            print(f'{name:<12} failed: {error}')
+            continue
+        seconds, rss, batch1, batch32, tensorflow = measured
+        print(f'{name:<12} {seconds:>8.3f} {rss:>12.1f} {batch1:>11.2f} {batch32:>12.2f} {str(tensorflow):>11}')
+
+
+if __name__ == '__main__':
+    main()
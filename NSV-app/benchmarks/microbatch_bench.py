@@ -0,0 +1,97 @@
+"""
+Latency and throughput of MLModel predictions with and without micro-batching, across concurrency.
+
+Every client thread sends --requests predictions. "direct" calls the model one text at a time
+(callers serialize on the singleton); "batched" goes through MicroBatcher.
+
+With --model (and --vocab-file) the real Keras model is used. Without it a synthetic model
+stands in: a fixed per-call overhead plus a per-item cost, the shape of Keras predict at small batches.
+
+Usage: python NSV-app/benchmarks/microbatch_bench.py [--model fake_news_model.h5 --vocab-file tokenizer_vocab.json]
+       [--concurrency 1 2 4 8 16 32 64] [--max-batch-size 32] [--max-wait-ms 5]
+"""
+import threading
+import time
+
+from harness import argument_parser, latency_summary, time_each, timed
+from batching import MicroBatcher
+
+SAMPLE_TEXT = "The cathedral has been rebuilt and renovated, offering a stunning new look while preserving its charm."
+
+
+class SyntheticModel:
+    def __init__(self, call_overhead_ms=20.0, per_item_ms=0.2):
+        self.call_overhead = call_overhead_ms / 1000.0
+        self.per_item = per_item_ms / 1000.0
+        self.lock = threading.Lock()
+
+    def predict_batch(self, texts, max_sequence_length):
+        with self.lock:
+            time.sleep(self.call_overhead + self.per_item * len(texts))
+        return [{"raw_prediction": 0.5} for _ in texts]
+
+
+def load_real_model(model_path, vocab_file):
+    from ml_model import MLModel
+    model = MLModel()
+    model.load_tokenizer(vocab_file)
+    model.load_model(model_path)
+    return model
+
+
+def run_clients(call, concurrency, requests):
+    latencies = []
+    lock = threading.Lock()
+
+    def client():
+        _, local = time_each(lambda _: call(), range(requests))
+        with lock:
+            latencies.extend(local)
+
+    def run_all():
+        threads = [threading.Thread(target=client) for _ in range(concurrency)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+    _, elapsed = timed(run_all)
+    return dict(latency_summary(latencies), throughput=len(latencies) / elapsed)
+
+
+def main():
+    parser = argument_parser(__doc__)
+    parser.add_argument('--model')
+    parser.add_argument('--vocab-file', default='tokenizer_vocab.json')
+    parser.add_argument('--max-sequence-length', type=int, default=100)
+    parser.add_argument('--concurrency', type=int, nargs='+', default=[1, 2, 4, 8, 16, 32, 64])
+    parser.add_argument('--requests', type=int, default=20, help='requests per client thread')
+    parser.add_argument('--max-batch-size', type=int, default=32)
+    parser.add_argument('--max-wait-ms', type=float, default=5.0)
+    args = parser.parse_args()
+
+    model = load_real_model(args.model, args.vocab_file) if args.model else SyntheticModel()
+    maxlen = args.max_sequence_length
+    direct_lock = threading.Lock()
+
+    def direct():
+        with direct_lock:
+            model.predict_batch([SAMPLE_TEXT], maxlen)
+
+    batcher = MicroBatcher(lambda texts: model.predict_batch(texts, maxlen),
+                           args.max_batch_size, args.max_wait_ms)
+
+    print(f'{"clients":>7} | {"direct req/s":>12} {"p50 ms":>8} {"p95 ms":>8} | '
+          f'{"batched req/s":>13} {"p50 ms":>8} {"p95 ms":>8} {"mean batch":>10}')
+    for concurrency in args.concurrency:
+        plain = run_clients(direct, concurrency, args.requests)
+        batcher.batches = batcher.items = 0
+        batched = run_clients(lambda: batcher.predict(SAMPLE_TEXT), concurrency, args.requests)
+        print(f'{concurrency:>7} | {plain["throughput"]:>12.1f} {plain["p50_ms"]:>8.1f} {plain["p95_ms"]:>8.1f} | '
+              f'{batched["throughput"]:>13.1f} {batched["p50_ms"]:>8.1f} {batched["p95_ms"]:>8.1f} '
+              f'{batcher.mean_batch_size:>10.1f}')
+    batcher.close()
+
+
+if __name__ == '__main__':
+    main()
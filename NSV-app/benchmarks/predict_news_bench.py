@@ -0,0 +1,46 @@
+"""
+Throughput (docs/sec) of the sklearn fake-news model at batch sizes 1, 32 and 512.
+
+Documents are built by shuffling the sentences of the fake_news / real_news samples
+in model_testing. The per-document loop through predict_news is reported as a
+reference for the old one-call-per-article path.
+
+Run from the repository root (the model pickles are loaded relative to it):
+    python NSV-app/benchmarks/predict_news_bench.py [--documents 2048]
+"""
+import random
+
+from harness import argument_parser, batches, time_each
+from model_prep.model_testing import fake_news, predict_news, predict_news_batch, real_news
+
+BATCH_SIZES = (1, 32, 512)
+
+
+def build_corpus(count, seed=18):
+    rng = random.Random(seed)
+    sentences = [sentence for text in (fake_news, real_news) for sentence in text.split('. ')]
+    return ['. '.join(rng.sample(sentences, 8)) for _ in range(count)]
+
+
+def docs_per_second(run, corpus, batch_size):
+    _, seconds = time_each(run, batches(corpus, batch_size))
+    return len(corpus) / sum(seconds)
+
+
+def main():
+    parser = argument_parser(__doc__)
+    parser.add_argument('--documents', type=int, default=2048)
+    args = parser.parse_args()
+
+    corpus = build_corpus(args.documents)
+    predict_news_batch(corpus[:BATCH_SIZES[-1]])  # warm the lemmatizer cache and the process pool
+
+    loop = docs_per_second(lambda batch: [predict_news(text) for text in batch], corpus, 1)
+    print(f'{"predict_news loop":<24} {loop:>10.1f} docs/sec')
+    for batch_size in BATCH_SIZES:
+        rate = docs_per_second(predict_news_batch, corpus, batch_size)
+        print(f'{f"predict_news_batch({batch_size})":<24} {rate:>10.1f} docs/sec')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,86 @@
+"""
+Training-data preprocessing: the old row-by-row DataFrame.apply (stopwords as a list) vs. the stage in
+model_prep/preprocessing.py (text_cleaning with a stopword set; single process and process pool) vs. a cache hit.
+
+Without --dataset a synthetic news.csv-shaped file is generated. The outputs are checked to be identical.
+
+Usage: python NSV-app/benchmarks/preprocessing_bench.py [--dataset model_prep/news.csv] [--rows 20000] [--workers 4]
+"""
+import os
+import random
+import re
+import tempfile
+
+import pandas as pd
+
+from harness import argument_parser, timed
+import preprocessing
+
+WORDS = ("the president said on monday that a new law would be passed by congress after the "
+         "election and officials in washington did not respond to requests for comment").split()
+
+
+def write_synthetic_news(path, rows, seed=18):
+    rng = random.Random(seed)
+    records = []
+    for i in range(rows):
+        body = ' '.join(rng.choice(WORDS) for _ in range(rng.randint(150, 600)))
+        if i % 2:
+            body = 'WASHINGTON (Reuters) - ' + body
+        records.append({'title': ' '.join(rng.choice(WORDS) for _ in range(10)).title(),
+                        'text': body, 'target': 'FAKE' if i % 2 == 0 else 'TRUE'})
+    pd.DataFrame(records).to_csv(path)
+
+
+def row_by_row(data, stop):
+    """The model_creation.py code this stage replaced (stopwords as a list)."""
+    stop = list(stop)
+
+    def extract_text(text):
+        regex = re.search(r"(?<=\(Reuters\)\s\-\s).*", text)
+        return regex.group(0) if regex else text
+
+    def clean_text(text):
+        text = text.lower()
+        text = ' '.join(word for word in text.split() if word not in stop)
+        return re.sub(r'[^a-z]', ' ', text)
+
+    final_news = (data['title'] + ' ' + data['text'].apply(extract_text)).apply(clean_text)
+    return pd.DataFrame({'final_news': final_news.to_numpy(),
+                         'target': data['target'].apply(lambda x: 0 if x == 'FAKE' else 1).astype('int8').to_numpy()})
+
+
+def main():
+    parser = argument_parser(__doc__)
+    parser.add_argument('--dataset')
+    parser.add_argument('--rows', type=int, default=20000)
+    parser.add_argument('--workers', type=int, default=os.cpu_count())
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = args.dataset
+        if path is None:
+            path = os.path.join(tmp, 'news.csv')
+            write_synthetic_news(path, args.rows)
+        preprocessing.CACHE_DIR = os.path.join(tmp, 'cache')
+        data = pd.read_csv(path)
+        stop = preprocessing.load_stopwords()
+
+        baseline, baseline_seconds = timed(lambda: row_by_row(data, stop))
+        single, single_seconds = timed(lambda: preprocessing.preprocess(data, stop))
+        pooled, pooled_seconds = timed(lambda: preprocessing.preprocess(data, stop, args.workers))
+        preprocessing.load_training_data(path)
+        cached, cached_seconds = timed(lambda: preprocessing.load_training_data(path))
+
+    for result in (single, pooled, cached):
+        pd.testing.assert_frame_equal(result.reset_index(drop=True), baseline)
+    print(f'{len(data)} rows')
+    print(f'{"variant":<22} {"seconds":>8}')
+    print(f'{"row-by-row apply":<22} {baseline_seconds:>8.2f}')
+    print(f'{"single process":<22} {single_seconds:>8.2f}')
+    print(f'{f"process pool ({args.workers})":<22} {pooled_seconds:>8.2f}')
+    print(f'{"cache hit":<22} {cached_seconds:>8.2f}')
+
+
+if __name__ == '__main__':
+    main()
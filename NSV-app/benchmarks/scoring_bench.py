@@ -0,0 +1,41 @@
+"""
+Scalar vs vectorized trust scoring with the ScoringStrategy hierarchy.
+
+"scalar" is calculate_trust_score on one object at a time (through the Aspect decorators), measured on
+--scalar-rows rows and extrapolated; "columns" passes a dict of component arrays to calculate_batch;
+"matrix" passes an (n, 4) array, which linear strategies score with one matrix-vector product.
+
+Usage: python NSV-app/benchmarks/scoring_bench.py [--rows 1000000] [--scalar-rows 10000]
+"""
+from types import SimpleNamespace
+
+import numpy as np
+
+from harness import argument_parser, timed
+from ScoringStrategy_Article import SimpleAverageStrategy, WeightedAverageStrategy
+from trust_weights import TRUST_COMPONENTS
+
+
+def main():
+    parser = argument_parser(__doc__)
+    parser.add_argument('--rows', type=int, default=1_000_000)
+    parser.add_argument('--scalar-rows', type=int, default=10_000)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(18)
+    matrix = rng.random((args.rows, len(TRUST_COMPONENTS)))
+    columns = {key: matrix[:, i].copy() for i, key in enumerate(TRUST_COMPONENTS)}
+    articles = [SimpleNamespace(**dict(zip(TRUST_COMPONENTS, row))) for row in matrix[:args.scalar_rows].tolist()]
+
+    for strategy in (SimpleAverageStrategy(), WeightedAverageStrategy()):
+        scalar, scalar_seconds = timed(lambda: [strategy.calculate_trust_score(article) for article in articles])
+        by_columns, column_seconds = timed(lambda: strategy.calculate_batch(columns))
+        by_matrix, matrix_seconds = timed(lambda: strategy.calculate_batch(matrix))
+        assert np.allclose(scalar, by_matrix[:args.scalar_rows]) and np.allclose(by_columns, by_matrix)
+        print(f'{type(strategy).__name__}: scalar {scalar_seconds * args.rows / len(articles):.2f} s '
+              f'(extrapolated), columns {column_seconds * 1000:.1f} ms, matrix {matrix_seconds * 1000:.1f} ms '
+              f'for {args.rows} rows')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,54 @@
+"""
+Worker startup time: import cost of the analysis modules, then the per-asset warmup breakdown.
+
+Each import is timed in a fresh interpreter so earlier imports do not hide the cost.
+Nothing heavy should be loaded (and no network touched) until the warmup step.
+
+Usage: python NSV-app/benchmarks/startup_bench.py [--repeat 3]
+"""
+import json
+
+from harness import argument_parser, run_snippet, timed
+
+MODULES = ['resource_registry', 'nlp_analyzer', 'model_prep.model_testing', 'article']
+
+IMPORT_SNIPPET = """
+import time
+start = time.perf_counter()
+import {module}
+print(time.perf_counter() - start)
+"""
+
+
+def time_import(module):
+    (seconds, error), wall = timed(lambda: run_snippet(IMPORT_SNIPPET.format(module=module)))
+    return seconds, wall, error
+
+
+def main():
+    parser = argument_parser(__doc__)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    print(f'{"module":<28} {"import s":>9} {"process s":>10}')
+    for module in MODULES:
+        runs = [time_import(module) for _ in range(args.repeat)]
+        errors = [error for _, _, error in runs if error]
+        if errors:
+            print(f'{module:<28} failed: {errors[0]}')
+            continue
+        best_import = min(seconds for seconds, _, _ in runs)
+        best_wall = min(wall for _, wall, _ in runs)
+        print(f'{module:<28} {best_import:>9.3f} {best_wall:>10.3f}')
+
+    from resource_registry import registry
+    import nlp_analyzer  # noqa: F401  registers the VADER analyzer
+    import model_prep.model_testing  # noqa: F401  registers the sklearn model and vectorizer
+
+    report, seconds = timed(registry.warmup)
+    print(f'\nwarmup: {seconds:.3f} s')
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,77 @@
+"""
+Epoch time and peak RSS of LSTM training: in-memory NumPy arrays vs. the tf.data pipeline.
+
+Each variant trains the model_creation.py architecture for --epochs on the same synthetic corpus
+in a fresh interpreter (so ru_maxrss is per variant):
+- memory: encode the cleaned frame into one array, model.fit on arrays
+- tfdata: model_prep/data_pipeline.make_datasets on the same frame (parallel map, file cache, prefetch)
+Both start from preprocessing.load_training_data. The first tfdata epoch fills the cache; later epochs
+show the steady state.
+
+Usage: python NSV-app/benchmarks/tfdata_bench.py [--rows 50000] [--epochs 3]
+"""
+import os
+import tempfile
+
+from harness import argument_parser, run_snippet
+from preprocessing_bench import write_synthetic_news
+
+SNIPPET = """
+import json, time
+import tensorflow as tf
+import model_config, preprocessing
+from data_pipeline import dataset_cache_key, fit_word_index, make_datasets
+from text_encoder import TextEncoder
+from harness import max_rss_mb
+preprocessing.CACHE_DIR = {cache!r}
+data = preprocessing.load_training_data([{path!r}])
+encoder = TextEncoder(fit_word_index(data['final_news']), model_config.MAX_VOCAB_SIZE)
+
+inputs = tf.keras.Input(shape=(model_config.MAX_SEQUENCE_LENGTH,))
+x = tf.keras.layers.Embedding(model_config.MAX_VOCAB_SIZE, model_config.EMBEDDING_DIM)(inputs)
+x = tf.keras.layers.Bidirectional(tf.keras.layers.LSTM(15, return_sequences=True))(x)
+x = tf.keras.layers.GlobalMaxPool1D()(x)
+model = tf.keras.Model(inputs, tf.keras.layers.Dense(1, activation='sigmoid')(x))
+model.compile(loss='binary_crossentropy', optimizer='adam', metrics=['accuracy'])
+
+class EpochTimer(tf.keras.callbacks.Callback):
+    def on_epoch_begin(self, epoch, logs=None):
+        self.start = time.perf_counter()
+    def on_epoch_end(self, epoch, logs=None):
+        epochs.append(time.perf_counter() - self.start)
+
+epochs = []
+if {variant!r} == 'memory':
+    X = encoder.encode(list(data['final_news']), model_config.MAX_SEQUENCE_LENGTH)
+    model.fit(X, data['target'].to_numpy(), batch_size=model_config.BATCH_SIZE, epochs={epochs},
+              validation_split=model_config.VALIDATION_SPLIT, callbacks=[EpochTimer()], verbose=0)
+else:
+    datasets = make_datasets(data, encoder, cache_key=dataset_cache_key([{path!r}], encoder))
+    model.fit(datasets['train'], validation_data=datasets['validation'], epochs={epochs},
+              callbacks=[EpochTimer()], verbose=0)
+print(json.dumps({{"epochs": epochs, "max_rss_mb": max_rss_mb()}}))
+"""
+
+
+def main():
+    parser = argument_parser(__doc__)
+    parser.add_argument('--rows', type=int, default=50000)
+    parser.add_argument('--epochs', type=int, default=3)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'news.csv')
+        write_synthetic_news(path, args.rows)
+        print(f'{"variant":<10} {"peak RSS MB":>12}  epoch seconds')
+        for variant in ('memory', 'tfdata'):
+            report, error = run_snippet(SNIPPET.format(cache=os.path.join(tmp, 'cache'), path=path, variant=variant,
+                                                       epochs=args.epochs))
+            if error:
+                print(f'{variant:<10} failed: {error}')
+                continue
+            epochs = ' '.join(f'{seconds:.1f}' for seconds in report['epochs'])
+            print(f'{variant:<10} {report["max_rss_mb"]:>12.1f}  {epochs}')
+
+
+if __name__ == '__main__':
+    main()
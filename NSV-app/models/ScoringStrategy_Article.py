@@ -1,39 +1,36 @@
-from abc import ABC, abstractmethod
+from abc import ABC
 from aop_wrapper import Aspect
+from scoring_formula import FormulaStrategy, LinearFormulaStrategy
 
-class ScoringStrategy(ABC):
-    """Abstract base class for scoring strategy."""
-    @abstractmethod
+class ScoringStrategy(FormulaStrategy, ABC):
+    """
+    Abstract base class for scoring strategy. Subclasses declare formula() once and get
+    calculate_trust_score (one article) and calculate_batch (columnar arrays) from it.
+    """
     @Aspect.log_execution
     @Aspect.measure_time
     @Aspect.handle_exceptions
     def calculate_trust_score(self, article):
-        pass
+        return self.score(article)
 
-class SimpleAverageStrategy(ScoringStrategy):
-    """Strategy for calculating trust score as a simple average."""
-    @Aspect.log_execution
     @Aspect.measure_time
-    @Aspect.handle_exceptions
-    def calculate_trust_score(self, article):
-        # Calculate the simple average of the metrics
-        return (
-            (article.ml_model_prediction +
-             article.source_credibility +
-             article.sentiment_subjectivity +
-             article.content_consistency) / 4
-        )
+    def calculate_batch(self, components):
+        return super().calculate_batch(components)
+
+class SimpleAverageStrategy(ScoringStrategy, LinearFormulaStrategy):
+    """Strategy for calculating trust score as a simple average."""
+    WEIGHTS = {
+        'ml_model_prediction': 0.25,
+        'source_credibility': 0.25,
+        'sentiment_subjectivity': 0.25,
+        'content_consistency': 0.25,
+    }
 
-class WeightedAverageStrategy(ScoringStrategy):
+class WeightedAverageStrategy(ScoringStrategy, LinearFormulaStrategy):
     """Strategy for calculating trust score as a weighted average."""
-    @Aspect.log_execution
-    @Aspect.measure_time
-    @Aspect.handle_exceptions
-    def calculate_trust_score(self, article):
-        # Calculate the weighted average based on predefined weights
-        return (
-            (0.6 * article.ml_model_prediction +
-             0.2 * article.source_credibility +
-             0.1 * article.sentiment_subjectivity +
-             0.1 * article.content_consistency)
-        )
+    WEIGHTS = {
+        'ml_model_prediction': 0.6,
+        'source_credibility': 0.2,
+        'sentiment_subjectivity': 0.1,
+        'content_consistency': 0.1,
+    }
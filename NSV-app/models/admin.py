@@ -3,6 +3,7 @@ import os
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '.')))
 from user import User
 from aop_wrapper import Aspect
+from trust_weights import validate_trust_weights
 
 # Define a monitoring rule for input validation
 
@@ -46,13 +47,25 @@ class Admin(User):
     @Aspect.log_execution
     @Aspect.measure_time
     @Aspect.handle_exceptions
-    def edit_trustscore_parameters(self, parameters: dict):
-        """Edit the trust score parameters for the platform."""       
-        # Basic implementation
+    def edit_trustscore_parameters(self, parameters: dict, current: dict = None, save=None):
+        """
+        Edit the trust score parameters for the platform.
+        The parameters are validated (unknown keys are rejected) and merged over the current weights
+        (the defaults if not given); save(weights) -> version persists them as a new weights version
+        (e.g. the trust_weights table).
+        """
+        if not parameters:
+            return {"success": False, "message": "No trust score parameters given."}
+        try:
+            weights = validate_trust_weights(parameters, base=current)
+        except ValueError as e:
+            return {"success": False, "message": str(e)}
+        if save is not None:
+            weights["version"] = save(weights)
         return {
             "success": True,
             "message": "Trust score parameters updated",
-            "new_parameters": parameters
+            "new_parameters": weights
         }
 
 # main
@@ -1,42 +1,73 @@
-from flask import Flask, request, jsonify
+from flask import Flask, request, jsonify, g
 from flask_sqlalchemy import SQLAlchemy
 from datetime import datetime
 import os
 from collections import Counter
 
-from sqlalchemy import desc
+from sqlalchemy import desc, event, func, inspect
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import load_only, undefer
 
 from aop_wrapper import Aspect
 import re
 import sys
+import threading
 import mop
 from flask_cors import CORS
+from compression import ResponseCompression
 
 app = Flask(__name__)
 CORS(app)
-
-from tensorflow.keras.preprocessing.text import Tokenizer
-from tensorflow.keras.preprocessing.sequence import pad_sequences
-from tensorflow.keras.models import Sequential, Model
-from tensorflow.keras.layers import Embedding, LSTM, Dense, Conv1D, MaxPooling1D, Bidirectional, GlobalMaxPool1D, Input, \
-    Dropout
-from tensorflow.keras.models import load_model
-from nltk.corpus import stopwords
+ResponseCompression(app)
 
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../../")))
-from model_prep.model_testing import fake_news_det, predict_news
+from model_prep.model_testing import fake_news_det, predict_news_batch, model_registry, news_cascade, fake_news, real_news, lstm_real_news_probabilities
+from resource_registry import registry
+from warmup import WarmupRunner
+from background_job import BackgroundJob
 from nlp_analyzer import KeywordExtractor
+from latest_cache import LatestArticlesCache
+from http_cache import collection_etag, conditional_json, row_etag
+from lexicon_matcher import Lexicon, LexiconMatcher
+from trust_weights import DEFAULT_TRUST_WEIGHTS, TRUST_PARAMETERS
+from rescoring import recompute_from_features, rescore_articles, score_article
+from article_features import FEATURE_COLUMNS, FEATURE_SCHEMA_VERSION, consistency_features, content_consistency
+import source_stats
+from simhash import SimHashIndex, simhash, to_signed, to_unsigned
+from corroboration import CorroborationIndex, is_reputable
+from keyword_index import keyword_rows, page_arguments, query_terms
+from admin import Admin
 
 keyword_extractor = KeywordExtractor()
+# Admin operations triggered through the API run as this system account
+trust_admin = Admin(0, "system", "system@news-source-verifier")
+latest_articles_cache = LatestArticlesCache(size=5)
+# NSV_DUPLICATE_SIMILARITY: SimHash similarity (0-1) from which a scraped article reuses an earlier article's scores
+duplicate_index = SimHashIndex(float(os.environ.get('NSV_DUPLICATE_SIMILARITY', '0.95')))
+duplicate_prime_lock = threading.Lock()
+# Recent articles of reputable sources; NSV_CORROBORATION_WINDOW_DAYS: how far apart in time corroborating articles may be
+corroboration_index = CorroborationIndex(window_days=int(os.environ.get('NSV_CORROBORATION_WINDOW_DAYS', '3')))
+corroboration_prime_lock = threading.Lock()
+CORROBORATION_TOP_K = 5
+# Misinformation terms and reputable sources; NSV_LEXICON_FILE points to a JSON lexicon to override them
+lexicon_matcher = LexiconMatcher(Lexicon.load(os.environ.get('NSV_LEXICON_FILE')))
+
+# Load and exercise every model and analyzer on the built-in samples before reporting ready
+warmup_runner = WarmupRunner()
+warmup_runner.add_step('resources', registry.warmup)
+warmup_runner.add_step('sklearn_model', lambda: predict_news_batch([fake_news, real_news], parallel=False))
+warmup_runner.add_step('keyword_extractor', lambda: keyword_extractor.extract_keywords(real_news))
+warmup_runner.add_step('document_sentiment', lambda: keyword_extractor.new_context().document_polarity(fake_news))
+if news_cascade is not None:
+    # registry.warmup only loads the LSTM; one prediction also builds its graph / interpreter tensors
+    warmup_runner.add_step('lstm_model', lambda: lstm_real_news_probabilities([fake_news]))
 
 app.config['SQLALCHEMY_DATABASE_URI'] = 'xxxxxx'
 app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
+app.config['CACHE_CONTROL'] = os.environ.get('NSV_CACHE_CONTROL', 'public, max-age=60')
 
 db = SQLAlchemy(app)
 
-model = load_model('model_prep/fake_news_model.h5')
-stop = stopwords.words('english')
-
 
 @mop.monitor(
     lambda req: req.method in ['GET', 'POST', 'PUT', 'DELETE'] and
@@ -85,7 +116,6 @@ def monitor_request():
     """
 
 
-from textblob import TextBlob
 import logging
 
 from scraper_engine import BeautifulSoupScraper
@@ -133,6 +163,10 @@ class Article(db.Model):
     content_consistency = db.Column(db.Float, nullable=True)
     trust_score = db.Column(db.Float, nullable=True)
     status = db.Column(db.String, nullable=True)
+    model_version = db.Column(db.String(64), nullable=True)
+    trust_weights_version = db.Column(db.Integer, nullable=True)
+    simhash = db.Column(db.BigInteger, nullable=True)
+    duplicate_of = db.Column(db.Integer, nullable=True)
     created_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
     updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
 
@@ -153,6 +187,9 @@ class Article(db.Model):
             'content_consistency': self.content_consistency,
             'trust_score': self.trust_score,
             'status': self.status,
+            'model_version': self.model_version,
+            'trust_weights_version': self.trust_weights_version,
+            'duplicate_of': self.duplicate_of,
             'created_at': self.created_at.isoformat(),
             'updated_at': self.updated_at.isoformat()
         }
@@ -162,23 +199,29 @@ class Article(db.Model):
     @Aspect.handle_exceptions
     @log_method_call
 
-    def analyze_sentiment(self, url):
+    def analyze_sentiment(self, url, context=None):
 
+        context = context or keyword_extractor.new_context()
 
-        result = keyword_extractor.process_article_and_keywords(url)  # VADER score (-1 to 1)
+        result = keyword_extractor.process_article_and_keywords(url, context=context)  # VADER score (-1 to 1)
 
         print(result)
 
         result_normalized = (result + 1) / 2  # Converts -1 to 1 range into 0 to 1
 
-        blob = TextBlob(self.content)
-
-        blob_sentiment = blob.sentiment.polarity  # Sentiment polarity (-1 to 1)
+        blob_sentiment = context.document_polarity(self.content)  # Sentiment polarity (-1 to 1), shared with check_consistency
 
         blob_sentiment_normalized = (blob_sentiment + 1) / 2
 
         self.sentiment_subjectivity = (0.3 * result_normalized) + (0.7 * blob_sentiment_normalized)
 
+        # Per-keyword frequency/sentiment for the keyword index (article_keywords)
+        self.keywords = context.keywords
+
+        # Raw scores for the feature store (see check_consistency)
+        self.features = dict(getattr(self, 'features', None) or {}, keyword_sentiment=result,
+                             sentiment_polarity=blob_sentiment)
+
         print("Sentiment subjectivity score: ")
 
         return self.sentiment_subjectivity
@@ -199,59 +242,30 @@ class Article(db.Model):
     @Aspect.measure_time
     @Aspect.handle_exceptions
     @log_method_call
-    def check_consistency(self):
+    def check_consistency(self, context=None):
         """
         Checks the consistency of the content to assess credibility.
-        - Checks for factual alignment with other reputable sources.
+        - Checks for factual alignment with other reputable sources (similar recent articles from
+          reputable domains, see corroboration.py).
         - Checks for the presence of keywords indicating potential misinformation.
         - Checks for the length of the content.
         """
-        # Keywords indicating potential misinformation
-        misinformation_keywords = ['fake', 'misinformation', 'conspiracy', 'false', 'debunked', 'fraud',
-                                   'scam', 'unverified', 'unreliable', 'unsubstantiated', 'rumor', 'fabricated',
-                                   'rau', 'fals', 'neadevarat', 'dezinformare', 'conspiratie', 'frauda',
-                                   'escrocherie', 'nemotivat', 'nerecunoscut', 'nejustificat', 'zvon', 'fabricat']
-        reputable_sources = ['bbc', 'cnn', 'reuters', 'nytimes', 'theguardian',
-                             'washingtonpost', 'wsj', 'bloomberg', 'apnews', 'npr',
-                             'digi24', 'stirileprotv', 'antena3',
-                             'realitatea', 'gandul', 'adevarul', 'ziare']
-
-        # Check for misinformation keywords in title and content
-        if any(keyword in self.title.lower() for keyword in misinformation_keywords) or \
-                any(keyword in self.content.lower() for keyword in misinformation_keywords):
-            content_consistency = 0.3
-        else:
-            content_consistency = 0.9
-
-        # Check for reputable sources in the content
-        if any(self.url in self.content.lower() for source in reputable_sources):
-            content_consistency += 0.1
-
-        # Check for content length
-        if len(self.content) < 500:
-            content_consistency -= 0.1
-
-        blob = TextBlob(self.content)
-        sentiment_score = blob.sentiment.polarity
-        if sentiment_score < -0.5:
-            sentiment_consistency = 0.4
-        elif sentiment_score > 0.5:
-            sentiment_consistency = 1.0
-        else:
-            sentiment_consistency = 0.8
-
-        words = self.content.lower().split()
-        word_counts = Counter(words)
-        # Check for repetitive words = 5 times or more means that the article is not consistent
-        repetitive_words = [word for word, count in word_counts.items() if count > 5]
-        if repetitive_words:
-            content_consistency -= 0.1
-
-        # 5. mean between content and sentiment consistency
-        self.content_consistency = (content_consistency + sentiment_consistency) / 2.0
-
-        # Ensure consistency score is within bounds
-        self.content_consistency = max(0.0, min(self.content_consistency, 1.0))
+        # One pass over title and content for misinformation keywords and reputable sources
+        matches = lexicon_matcher.scan(self.title, self.content)
+        self.lexicon_matches = matches
+
+        # Raw signals (misinformation/source hits, length, repetition, polarity) are kept on the article
+        # and stored in article_features, so the score below can be recomputed without re-analyzing
+        context = context or keyword_extractor.new_context()
+        self.corroborated_by = find_corroborating_articles(self)
+        corroboration = self.corroborated_by[0][1] if self.corroborated_by else 0.0
+        self.features = consistency_features(matches, self.content, context.document_polarity(self.content),
+                                             corroboration)
+
+        # 0.3/0.9 by misinformation terms, +0.1 for reputable sources, +0.1 if corroborated by a reputable
+        # article, -0.1 each for short content and repetitive words (any word more than 5 times),
+        # averaged with a sentiment consistency, within [0, 1]
+        self.content_consistency = float(content_consistency(self.features))
 
         if self.content_consistency < 0.6:
             self.status = "unverified"
@@ -283,37 +297,350 @@ class Article(db.Model):
         return f"Title: {self.title}, Author: {self.author}, Status: {self.status}"
 
 
+class TrustWeights(db.Model):
+    """One immutable version of the trust score weights; the highest version is in effect."""
+    __tablename__ = 'trust_weights'
+
+    version = db.Column(db.Integer, primary_key=True)
+    ml_model_prediction = db.Column(db.Float, nullable=False)
+    source_credibility = db.Column(db.Float, nullable=False)
+    sentiment_subjectivity = db.Column(db.Float, nullable=False)
+    content_consistency = db.Column(db.Float, nullable=False)
+    verified_threshold = db.Column(db.Float, nullable=False)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
+
+    def to_dict(self):
+        weights = {key: getattr(self, key) for key in TRUST_PARAMETERS}
+        weights['version'] = self.version
+        weights['created_at'] = self.created_at.isoformat() if self.created_at else None
+        return weights
+
+
+class ArticleFeatures(db.Model):
+    """Raw analysis signals of one article (see article_features.FEATURE_COLUMNS), for recomputing its scores."""
+    __tablename__ = 'article_features'
+
+    article_id = db.Column(db.Integer, db.ForeignKey('articles.article_id', ondelete='CASCADE'), primary_key=True)
+    schema_version = db.Column(db.Integer, nullable=False, default=FEATURE_SCHEMA_VERSION)
+    misinformation_hits = db.Column(db.Integer, nullable=False)
+    reputable_source_hits = db.Column(db.Integer, nullable=False)
+    content_length = db.Column(db.Integer, nullable=False)
+    max_word_repetition = db.Column(db.Integer, nullable=False)
+    sentiment_polarity = db.Column(db.Float, nullable=False)
+    keyword_sentiment = db.Column(db.Float, nullable=True)
+    corroboration = db.Column(db.Float, nullable=True)
+    extracted_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+
+
+class SourceStats(db.Model):
+    """
+    Running aggregates of the articles of one domain (Welford mean/M2 per score), kept in step with
+    the articles table by the mapper events below; `flask rebuild-source-stats` recomputes it.
+    """
+    __tablename__ = 'source_stats'
+
+    domain = db.Column(db.String(255), primary_key=True)
+    article_count = db.Column(db.Integer, nullable=False, default=0)
+    unverified_count = db.Column(db.Integer, nullable=False, default=0)
+    ml_mean = db.Column(db.Float, nullable=False, default=0.0)
+    ml_m2 = db.Column(db.Float, nullable=False, default=0.0)
+    trust_mean = db.Column(db.Float, nullable=False, default=0.0)
+    trust_m2 = db.Column(db.Float, nullable=False, default=0.0)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+
+    def to_dict(self):
+        stats = {column.name: getattr(self, column.name) for column in self.__table__.columns}
+        stats['updated_at'] = self.updated_at.isoformat() if self.updated_at else None
+        stats['ml_variance'] = source_stats.variance(stats, 'ml_model_prediction')
+        stats['trust_variance'] = source_stats.variance(stats, 'trust_score')
+        stats['source_credibility'] = source_stats.credibility(stats)
+        return stats
+
+
+SOURCE_STATS_FIELDS = ('url', 'ml_model_prediction', 'trust_score', 'status')
+
+
+def _stats_contribution(article, previous=False):
+    values = []
+    for key in SOURCE_STATS_FIELDS:
+        history = inspect(article).attrs[key].history
+        values.append(history.deleted[0] if previous and history.deleted else getattr(article, key))
+    return source_stats.contribution(*values)
+
+
+@event.listens_for(Article, 'after_insert')
+def _source_stats_after_insert(mapper, connection, article):
+    source_stats.record_change(connection, SourceStats.__table__, after=_stats_contribution(article))
+
+
+@event.listens_for(Article, 'after_update')
+def _source_stats_after_update(mapper, connection, article):
+    if any(inspect(article).attrs[key].history.has_changes() for key in SOURCE_STATS_FIELDS):
+        source_stats.record_change(connection, SourceStats.__table__,
+                                   before=_stats_contribution(article, previous=True),
+                                   after=_stats_contribution(article))
+
+
+@event.listens_for(Article, 'after_delete')
+def _source_stats_after_delete(mapper, connection, article):
+    source_stats.record_change(connection, SourceStats.__table__, before=_stats_contribution(article, previous=True))
+
+
+def source_credibility_of(url):
+    """source_credibility for an article from its domain's aggregates (one primary key lookup)."""
+    domain = source_stats.domain_of(url)
+    stats = SourceStats.query.get(domain) if domain else None
+    return source_stats.credibility(stats.to_dict() if stats else None)
+
+
+def rebuild_source_stats():
+    with db.engine.begin() as connection:
+        return source_stats.rebuild(connection, Article.__table__, SourceStats.__table__)
+
+
+class ArticleKeyword(db.Model):
+    """
+    Inverted keyword index: one row per (keyword, article) for the top keywords of each analyzed article.
+    The primary key leads with keyword, so a search is an index range scan per term.
+    """
+    __tablename__ = 'article_keywords'
+
+    keyword = db.Column(db.String(100), primary_key=True)
+    article_id = db.Column(db.Integer, db.ForeignKey('articles.article_id', ondelete='CASCADE'), primary_key=True,
+                           index=True)
+    frequency = db.Column(db.Integer, nullable=False)
+    vader_score = db.Column(db.Float, nullable=True)
+    sentiment = db.Column(db.String(16), nullable=True)
+
+
+def store_article_keywords(article):
+    """Adds the keyword index rows of an analyzed article to the session; needs article_id."""
+    keywords = getattr(article, 'keywords', None)
+    if keywords:
+        db.session.bulk_insert_mappings(ArticleKeyword, keyword_rows(article.article_id, keywords))
+
+
+def store_article_features(article):
+    """Adds (or replaces) the feature row of an analyzed article to the session; needs article_id."""
+    features = getattr(article, 'features', None)
+    if features:
+        db.session.merge(ArticleFeatures(article_id=article.article_id, schema_version=FEATURE_SCHEMA_VERSION, **features))
+
+
+def current_trust_weights():
+    """The newest stored weights version, or version 0 (the built-in defaults) if none was saved."""
+    latest = TrustWeights.query.order_by(desc(TrustWeights.version)).first()
+    return latest.to_dict() if latest else dict(DEFAULT_TRUST_WEIGHTS)
+
+
+def save_trust_weights(weights, attempts=5):
+    """
+    Stores weights as the next version and returns its number. Two concurrent saves can pick the
+    same number; the loser gets a primary key violation and retries with the next one.
+    """
+    for attempt in range(attempts):
+        version = (db.session.query(func.max(TrustWeights.version)).scalar() or 0) + 1
+        db.session.add(TrustWeights(version=version, **{key: weights[key] for key in TRUST_PARAMETERS}))
+        try:
+            db.session.commit()
+            return version
+        except IntegrityError:
+            db.session.rollback()
+            if attempt == attempts - 1:
+                raise
+
+
+def rescore_all_articles(weights=None, progress=None):
+    """Recomputes trust_score/status of every article in bulk with the given (default: current) weights."""
+    weights = weights or current_trust_weights()
+    with db.engine.begin() as connection:
+        result = rescore_articles(connection, Article.__table__, weights, progress=progress)
+    # Bulk updates bypass the mapper events that maintain source_stats
+    rebuild_source_stats()
+    prime_latest_articles()
+    return result
+
+
 @app.route('/articles', methods=['GET'])
 def get_all_articles():
     """Get all articles."""
-    articles = Article.query.all()
-    return jsonify([article.to_dict() for article in articles]), 200
+    # Aggregates are enough to tell whether the listing changed since the client's copy; the row count
+    # changes on a delete. No Last-Modified: a delete does not move max(updated_at), so If-Modified-Since
+    # alone would keep answering 304 with the deleted article still in the client's copy
+    count, max_id, max_updated_at = db.session.query(
+        func.count(Article.article_id), func.max(Article.article_id), func.max(Article.updated_at)
+    ).one()
+    etag = collection_etag(count, max_id, max_updated_at)
+    return conditional_json(lambda: [article.to_dict() for article in Article.query.all()], etag)
+
+
+def prime_latest_articles():
+    """Loads the newest articles into the in-process cache."""
+    # Selectăm ultimele articole ordonate descrescător după created_at
+    latest_articles = Article.query.order_by(desc(Article.created_at)).limit(latest_articles_cache.size).all()
+    latest_articles_cache.prime([article.to_dict() for article in latest_articles])
+
+
+def article_date(article):
+    return article.publish_date or article.created_at or datetime.utcnow()
+
+
+def prime_corroboration_index():
+    """
+    Loads the reputable-source articles still within the index's retention period, once:
+    concurrent callers wait for the first one instead of indexing the table again.
+    """
+    if corroboration_index.primed:
+        return
+    with corroboration_prime_lock:
+        if corroboration_index.primed:
+            return
+        since = datetime.utcnow() - corroboration_index.retention - corroboration_index.window
+        rows = (db.session.query(Article.article_id, Article.url, Article.content, Article.publish_date, Article.created_at)
+                .filter(func.coalesce(Article.publish_date, Article.created_at) >= since)
+                .order_by(Article.article_id).yield_per(1000))
+        reputable = set(lexicon_matcher.lexicon.reputable_sources)
+        corroboration_index.prime(
+            (article_id, source_stats.domain_of(url), content, publish_date or created_at)
+            for article_id, url, content, publish_date, created_at in rows
+            if is_reputable(source_stats.domain_of(url), reputable)
+        )
+
+
+def find_corroborating_articles(article):
+    """[(article_id, similarity)] of recent reputable articles from other domains similar to this one."""
+    prime_corroboration_index()
+    return corroboration_index.query(article.content, article_date(article), k=CORROBORATION_TOP_K,
+                                     exclude_domain=source_stats.domain_of(article.url))
+
+
+def index_reputable_article(article):
+    """Adds a stored article to the corroboration index if it comes from a reputable source."""
+    domain = source_stats.domain_of(article.url)
+    if is_reputable(domain, set(lexicon_matcher.lexicon.reputable_sources)):
+        corroboration_index.add(article.article_id, domain, article.content, article_date(article))
+
+
+def prime_duplicate_index():
+    """
+    Loads the SimHash fingerprints of all stored articles into the near-duplicate index, once:
+    concurrent callers wait for the first one instead of loading the fingerprints again.
+    """
+    if duplicate_index.primed:
+        return
+    with duplicate_prime_lock:
+        if duplicate_index.primed:
+            return
+        rows = db.session.query(Article.article_id, Article.simhash).filter(Article.simhash.isnot(None)).yield_per(10000)
+        duplicate_index.prime((article_id, to_unsigned(fingerprint)) for article_id, fingerprint in rows)
+
+
+def reuse_duplicate_scores(article, fingerprint):
+    """
+    If a stored article is a near duplicate of this one (syndicated copy), copies its ML prediction,
+    sentiment and consistency (and features) and returns it; None means the article needs the full analysis.
+    """
+    prime_duplicate_index()
+    match = duplicate_index.query(fingerprint)
+    original = Article.query.get(match[0]) if match else None
+    if original is None or original.content_consistency is None:
+        return None
+    article.duplicate_of = original.duplicate_of or original.article_id
+    article.ml_model_prediction = original.ml_model_prediction
+    article.model_version = original.model_version
+    article.sentiment_subjectivity = original.sentiment_subjectivity
+    article.content_consistency = original.content_consistency
+    features = ArticleFeatures.query.get(original.article_id)
+    if features is not None and features.schema_version == FEATURE_SCHEMA_VERSION:
+        article.features = {key: getattr(features, key) for key in FEATURE_COLUMNS}
+    article.keywords = {row.keyword: {"frequency": row.frequency, "vader_score": row.vader_score,
+                                      "sentiment": row.sentiment}
+                        for row in ArticleKeyword.query.filter_by(article_id=original.article_id)}
+    logging.info(f"Article {article.url} is a near duplicate ({match[1]:.3f}) of article {original.article_id}")
+    return original
 
 
 @app.route('/latest-articles', methods=['GET'])
 def get_latest_articles():
-    # Selectăm ultimele 5 articole ordonate descrescător după created_at
-    latest_articles = Article.query.order_by(desc(Article.created_at)).limit(5).all()
-    articles_list = [article.to_dict() for article in latest_articles]
-    return jsonify(articles_list), 200
+    """Get the latest articles from the cache; repeat polls with If-None-Match get a 304."""
+    if not latest_articles_cache.primed:
+        prime_latest_articles()
+    body, etag = latest_articles_cache.snapshot()
+    response = app.response_class(body, status=200, mimetype='application/json')
+    response.set_etag(etag)
+    response.cache_control.no_cache = True
+    return response.make_conditional(request)
+
+
+def validator_columns():
+    """Loads only the validator columns; a 200 response then loads the rest with full_article_dict."""
+    return load_only(Article.article_id, Article.updated_at)
+
+
+def full_article_dict(article):
+    """
+    to_dict of an article loaded with validator_columns(): the whole row is reloaded in one query,
+    instead of one lazy SELECT per deferred column.
+    """
+    article = db.session.get(Article, article.article_id, populate_existing=True, options=[undefer('*')])
+    return article.to_dict()
+
+
+@app.route('/articles/search', methods=['GET'])
+def search_articles():
+    """
+    Articles whose keywords match ?q= (KeywordExtractor keywords), ranked by the number of matched
+    terms and then by their total frequency, newest first on ties; paginated with page/per_page.
+    """
+    terms = query_terms(request.args.get('q'), keyword_extractor.stop_words)
+    if not terms:
+        return jsonify({"error": "Query parameter q with at least one keyword is required"}), 400
+    try:
+        page, per_page = page_arguments(request.args)
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+
+    matches = (db.session.query(ArticleKeyword.article_id.label('article_id'),
+                                func.count(ArticleKeyword.keyword).label('matched'),
+                                func.sum(ArticleKeyword.frequency).label('score'))
+               .filter(ArticleKeyword.keyword.in_(terms))
+               .group_by(ArticleKeyword.article_id)
+               .subquery())
+    total = db.session.query(func.count()).select_from(matches).scalar()
+    rows = (db.session.query(Article, matches.c.matched, matches.c.score)
+            .join(matches, Article.article_id == matches.c.article_id)
+            .order_by(desc(matches.c.matched), desc(matches.c.score), desc(Article.article_id))
+            .offset((page - 1) * per_page)
+            .limit(per_page)
+            .all())
+    return jsonify({
+        "query": terms,
+        "page": page,
+        "per_page": per_page,
+        "total": total,
+        "results": [dict(article.to_dict(), matched_keywords=matched, keyword_score=int(score))
+                    for article, matched, score in rows],
+    }), 200
 
 
 @app.route('/articles/<int:article_id>', methods=['GET'])
 def get_article(article_id):
     """Get a single article by ID."""
-    article = Article.query.get(article_id)
+    article = Article.query.options(validator_columns()).get(article_id)
     if article is None:
         return jsonify({"error": "Article not found"}), 404
-    return jsonify(article.to_dict()), 200
+    return conditional_json(lambda: full_article_dict(article), row_etag(article.article_id, article.updated_at),
+                            article.updated_at)
 
 
 @app.route('/articles/<path:url>', methods=['GET'])
 def get_article_url(url):
     """Get a single article by URL."""
-    article = Article.query.filter_by(url=url).first()
+    article = Article.query.options(validator_columns()).filter_by(url=url).first()
     if article is None:
         return jsonify({"error": "Article not found"}), 404
-    return jsonify(article.to_dict()), 200
+    return conditional_json(lambda: full_article_dict(article), row_etag(article.article_id, article.updated_at),
+                            article.updated_at)
 
 
 @app.route('/articles', methods=['POST'])
@@ -341,7 +668,9 @@ def create_article():
 
         db.session.add(article)
         db.session.commit()
-        return jsonify(article.to_dict()), 201
+        article_dict = article.to_dict()
+        latest_articles_cache.push(article_dict)
+        return jsonify(article_dict), 201
     except Exception as e:
         db.session.rollback()
         return jsonify({"error": str(e)}), 400
@@ -350,6 +679,20 @@ def create_article():
 scraper = BeautifulSoupScraper()
 
 
+def get_analysis_context():
+    """Returns the analysis context shared by every analyzer call in the current request."""
+    if 'analysis_context' not in g:
+        g.analysis_context = keyword_extractor.new_context()
+    return g.analysis_context
+
+
+@app.teardown_request
+def log_analysis_invocations(exception=None):
+    context = g.pop('analysis_context', None)
+    if context is not None:
+        logging.info(f"Analyzer invocations for {request.method} {request.path}: {context.report()}")
+
+
 @app.route('/articles/scrape', methods=['POST'])
 def scrape_and_create_article():
     """
@@ -384,35 +727,58 @@ def scrape_and_create_article():
             author=article_data.get('author'),
             publish_date=publish_date,
             ml_model_prediction=0.0,
-            source_credibility=0.0,
+            source_credibility=source_credibility_of(article_data.get('url') or url),
             sentiment_subjectivity=0.0,
             content_consistency=0.0,
             trust_score=None,
             status="unverified"
         )
 
-        # aici se pot adăuga metode pentru analiza sentimentului și verificarea consistenței - astea sunt doar asa de test
+        # Syndicated copies (near-identical content) reuse the scores of the stored original;
+        # only source credibility and the trust score are recomputed for them
+        fingerprint = simhash(article.content)
+        article.simhash = to_signed(fingerprint)
+        if reuse_duplicate_scores(article, fingerprint) is None:
+            # aici se pot adăuga metode pentru analiza sentimentului și verificarea consistenței - astea sunt doar asa de test
         
     
-        article.check_consistency()
-
-        article_content_no_paragraphs = article.content.replace('\n', ' ').replace('\r', ' ')
-        #print(f"Content without paragraphs: {article_content_no_paragraphs}")
-
-        # Preprocess the article content for prediction
-        prediction = predict_news(article_content_no_paragraphs)
-        #print(prediction)
-        article.ml_model_prediction = prediction
+            context = get_analysis_context()
+            article.check_consistency(context)
+
+            article_content_no_paragraphs = article.content.replace('\n', ' ').replace('\r', ' ')
+            #print(f"Content without paragraphs: {article_content_no_paragraphs}")
+
+            # Preprocess the article content for prediction (cascade mode: the LSTM only for uncertain articles)
+            if news_cascade is not None:
+                prediction = news_cascade.predict([article_content_no_paragraphs])
+            else:
+                prediction = predict_news_batch([article_content_no_paragraphs], parallel=False)
+            #print(prediction)
+            article.ml_model_prediction = int(prediction["labels"][0])
+            article.model_version = prediction["version"]
         
-        result = article.analyze_sentiment(url)
-        print(result)
-        article.sentiment_subjectivity = result
-        article.trust_score = 0.5 * article.ml_model_prediction + 0.3 * article.sentiment_subjectivity + 0.2 * article.content_consistency
+            result = article.analyze_sentiment(url, context)
+            print(result)
+            article.sentiment_subjectivity = result
+
+        # Same weights (and formula) as the bulk rescoring job
+        weights = current_trust_weights()
+        article.trust_score, article.status = score_article(article, weights)
+        article.trust_weights_version = weights['version']
 
         db.session.add(article)
+        db.session.flush()  # assigns article_id for the feature row
+        store_article_features(article)
+        store_article_keywords(article)
         db.session.commit()
+        duplicate_index.add(article.article_id, fingerprint)
+        index_reputable_article(article)
 
-        return jsonify(article.to_dict()), 201
+        article_dict = article.to_dict()
+        latest_articles_cache.push(article_dict)
+        corroborated_by = [{"article_id": article_id, "similarity": round(similarity, 4)}
+                           for article_id, similarity in getattr(article, 'corroborated_by', None) or []]
+        return jsonify(dict(article_dict, corroborated_by=corroborated_by)), 201
 
     except Exception as e:
         db.session.rollback()
@@ -439,7 +805,9 @@ def update_article(article_id):
         article.trust_score = data.get('trust_score', article.trust_score)
         article.status = data.get('status', article.status)
         db.session.commit()
-        return jsonify(article.to_dict()), 200
+        article_dict = article.to_dict()
+        latest_articles_cache.update(article_dict)
+        return jsonify(article_dict), 200
     except Exception as e:
         db.session.rollback()
         return jsonify({"error": str(e)}), 400
@@ -452,8 +820,12 @@ def delete_article(article_id):
     if not article:
         return jsonify({"error": "Article not found"}), 404
     try:
+        ArticleFeatures.query.filter_by(article_id=article_id).delete()
+        ArticleKeyword.query.filter_by(article_id=article_id).delete()
         db.session.delete(article)
         db.session.commit()
+        duplicate_index.remove(article_id)
+        latest_articles_cache.remove(article_id)
         return jsonify({"message": "Article deleted successfully"}), 200
     except Exception as e:
         db.session.rollback()
@@ -473,7 +845,7 @@ def analyze_article():
 
             return jsonify({"error": "URL is required"}), 400
 
-        result = keyword_extractor.process_article_and_keywords(url)
+        result = keyword_extractor.process_article_and_keywords(url, context=get_analysis_context())
 
         return jsonify({'score': result}), 200
 
@@ -484,6 +856,122 @@ def analyze_article():
 
 
 
+def _rescore_to_current_weights(progress):
+    with app.app_context():
+        weights = current_trust_weights()
+        progress(version=weights['version'], total=db.session.query(func.count(Article.article_id)).scalar())
+        return dict(rescore_all_articles(weights, progress), version=weights['version'])
+
+
+# Rescoring after a weights update runs off the request; a version saved while it runs triggers one more pass
+rescore_job = BackgroundJob('rescore-trust', _rescore_to_current_weights)
+
+
+@app.route('/trust-weights', methods=['GET'])
+def get_trust_weights():
+    """The trust score weights in effect and the progress of the background rescore ("rescore")."""
+    return jsonify(dict(current_trust_weights(), rescore=rescore_job.status())), 200
+
+
+@app.route('/trust-weights', methods=['PUT'])
+def update_trust_weights():
+    """
+    Stores {"parameters": {...}} as a new weights version (merged over the current one) and returns
+    202: every article is rescored with it by a background job, whose progress GET /trust-weights reports.
+    """
+    data = request.json or {}
+    result = trust_admin.edit_trustscore_parameters(data.get('parameters', {}), current=current_trust_weights(),
+                                                    save=save_trust_weights)
+    if not result or not result['success']:
+        return jsonify({"error": result['message'] if result else "Could not update trust weights"}), 400
+    rescore_job.start()
+    result['rescore'] = rescore_job.status()
+    return jsonify(result), 202
+
+
+@app.cli.command('rescore-trust')
+def rescore_trust_command():
+    """Recomputes trust_score/status of all articles with the current trust weights."""
+    print(rescore_all_articles())
+
+
+@app.cli.command('recompute-features')
+def recompute_features_command():
+    """Recomputes consistency, subjectivity and trust scores of all articles from their stored features."""
+    with db.engine.begin() as connection:
+        print(recompute_from_features(connection, Article.__table__, ArticleFeatures.__table__, current_trust_weights()))
+    rebuild_source_stats()
+    prime_latest_articles()
+
+
+@app.cli.command('rebuild-source-stats')
+def rebuild_source_stats_command():
+    """Recomputes the per-domain source_stats table from all articles in one pass."""
+    print(rebuild_source_stats())
+
+
+@app.route('/sources/<string:domain>', methods=['GET'])
+def get_source_stats(domain):
+    """Aggregates and credibility of one source domain."""
+    stats = SourceStats.query.get(source_stats.domain_of(domain))
+    if not stats:
+        return jsonify({"error": "Source not found"}), 404
+    return jsonify(stats.to_dict()), 200
+
+
+@app.route('/ready', methods=['GET'])
+def readiness():
+    """Readiness probe: 503 until the warmup finished, 200 afterwards (right away with NSV_WARMUP=off)."""
+    status = warmup_runner.status()
+    status['resources'] = registry.report()
+    return jsonify(status), 200 if status['ready'] else 503
+
+
+@app.route('/model', methods=['GET'])
+def model_status():
+    """Active model version, the published CURRENT one, the last failed activation and cascade escalations."""
+    status = model_registry.status()
+    status['cascade'] = news_cascade.stats() if news_cascade is not None else None
+    return jsonify(status), 200
+
+
+# NSV_WARMUP: "background" (default) warms up in a thread, "sync" blocks startup, "off" skips it
+# (models then load on first use and /ready reports ready right away)
+warmup_mode = os.environ.get('NSV_WARMUP', 'background')
+# NSV_MODEL_WATCH_SECONDS > 0: poll for a newly published model version (CURRENT) and activate it
+# without a restart; 0 (default) turns the watcher off
+model_watch_seconds = float(os.environ.get('NSV_MODEL_WATCH_SECONDS', '0'))
+_services_lock = threading.Lock()
+_services_started = False
+
+
+def start_background_services():
+    """
+    Starts the warmup and the (opt-in) model watcher; called when the server starts (the __main__
+    block, or the first request under a WSGI server), never on import, so CLI commands and tests
+    do not spawn threads.
+    """
+    global _services_started
+    with _services_lock:
+        if _services_started:
+            return
+        _services_started = True
+    if warmup_mode == 'sync':
+        warmup_runner.run()
+    elif warmup_mode == 'background':
+        warmup_runner.start_background()
+    else:
+        warmup_runner.skip()
+    if model_watch_seconds > 0:
+        model_registry.watch(model_watch_seconds)
+
+
+@app.before_request
+def ensure_background_services():
+    if not _services_started:
+        start_background_services()
+
+
 if __name__ == "__main__":
     # article = Article("https://example.com", "Sample Title", "This content could contain misinformation.", "Author Name", "2024-11-11")
     # print(article.analyze_sentiment())
@@ -493,4 +981,10 @@ if __name__ == "__main__":
     # În exemplul de mai jos, trebuie definită strategia înainte de a o folosi
     # print(article.calculate_trust_score(strategy))
     # print(article)
+    with app.app_context():
+        db.create_all()  # creates missing tables (trust_weights, article_features, source_stats, article_keywords); existing tables are left as they are
+        prime_latest_articles()
+        prime_duplicate_index()
+        prime_corroboration_index()
+    start_background_services()
     app.run(debug=True)
\ No newline at end of file
@@ -0,0 +1,64 @@
+from collections import Counter
+
+import numpy as np
+
+# Bump whenever a feature is removed or computed differently; rows of older versions are not recomputed.
+# A new nullable feature (missing = not computed, no effect on the scores) does not need a bump.
+FEATURE_SCHEMA_VERSION = 1
+# Raw signals of check_consistency / analyze_sentiment, stored per article in the article_features table
+FEATURE_COLUMNS = (
+    'misinformation_hits',    # misinformation term matches in title + content
+    'reputable_source_hits',  # reputable source mentions in title + content
+    'content_length',         # characters of content
+    'max_word_repetition',    # count of the most repeated (lowercased) word
+    'sentiment_polarity',     # TextBlob polarity of the content, -1 to 1
+    'keyword_sentiment',      # aggregate VADER score of the keywords, -1 to 1 (None if not analyzed)
+    'corroboration',          # best cosine similarity to a recent reputable article of another domain (None if not checked)
+)
+
+SHORT_CONTENT_LENGTH = 500
+REPETITION_LIMIT = 5
+# Similarity from which an article counts as corroborated by a reputable source (see corroboration.py)
+CORROBORATION_THRESHOLD = 0.35
+
+
+def consistency_features(matches, content, sentiment_polarity, corroboration=None):
+    """
+    The check_consistency signals of one article: LexiconMatches of title + content, the content,
+    its polarity and its corroboration similarity.
+    """
+    word_counts = Counter(content.lower().split())
+    return {
+        'misinformation_hits': sum(matches.misinformation_hits.values()),
+        'reputable_source_hits': sum(matches.source_hits.values()),
+        'content_length': len(content),
+        'max_word_repetition': max(word_counts.values(), default=0),
+        'sentiment_polarity': float(sentiment_polarity),
+        'keyword_sentiment': None,
+        'corroboration': None if corroboration is None else float(corroboration),
+    }
+
+
+def content_consistency(features):
+    """
+    content_consistency from features; works on one article's features (scalars) and on columns (arrays).
+    """
+    polarity = np.asarray(features['sentiment_polarity'], dtype=np.float64)
+    score = np.where(np.asarray(features['misinformation_hits']) > 0, 0.3, 0.9)
+    score = score + np.where(np.asarray(features['reputable_source_hits']) > 0, 0.1, 0.0)
+    score = score - np.where(np.asarray(features['content_length']) < SHORT_CONTENT_LENGTH, 0.1, 0.0)
+    score = score - np.where(np.asarray(features['max_word_repetition']) > REPETITION_LIMIT, 0.1, 0.0)
+    corroboration = np.asarray(features.get('corroboration'), dtype=np.float64)  # None/NaN: not checked
+    score = score + np.where(np.nan_to_num(corroboration, nan=0.0) >= CORROBORATION_THRESHOLD, 0.1, 0.0)
+    sentiment = np.where(polarity < -0.5, 0.4, np.where(polarity > 0.5, 1.0, 0.8))
+    return np.clip((score + sentiment) / 2.0, 0.0, 1.0)
+
+
+def sentiment_subjectivity(features):
+    """
+    sentiment_subjectivity from features: 30% keyword VADER score, 70% document polarity, both scaled to 0-1.
+    NaN where keyword_sentiment is missing.
+    """
+    keyword = np.asarray(features['keyword_sentiment'], dtype=np.float64)
+    polarity = np.asarray(features['sentiment_polarity'], dtype=np.float64)
+    return 0.3 * ((keyword + 1) / 2) + 0.7 * ((polarity + 1) / 2)
@@ -0,0 +1,79 @@
+import logging
+import threading
+import time
+
+
+class BackgroundJob:
+    """
+    Runs one job at a time in a daemon thread and tracks its progress for a status endpoint.
+    A start() while the job is running is not lost: the job runs once more when the current run
+    ends (any number of such starts coalesce into that one extra run).
+    """
+
+    def __init__(self, name, job):
+        """
+        job: callable(progress) -> result dict; progress(**values) publishes intermediate counters.
+        """
+        self.name = name
+        self._job = job
+        self._lock = threading.Lock()
+        self._thread = None
+        self._pending = False
+        self.running = False
+        self.runs = 0
+        self.progress_values = {}
+        self.result = None
+        self.error = None
+        self.started_at = None
+        self.finished_at = None
+
+    def start(self):
+        """
+        Starts the job in the background; returns False if it was already running (it then reruns).
+        """
+        with self._lock:
+            if self.running:
+                self._pending = True
+                return False
+            self.running = True
+            self._thread = threading.Thread(target=self._loop, name=self.name, daemon=True)
+            self._thread.start()
+            return True
+
+    def join(self, timeout=None):
+        thread = self._thread
+        if thread is not None:
+            thread.join(timeout)
+
+    def progress(self, **values):
+        self.progress_values = dict(self.progress_values, **values)
+
+    def _loop(self):
+        while True:
+            self.progress_values = {}
+            self.error = None
+            self.started_at, self.finished_at = time.time(), None
+            try:
+                self.result = self._job(self.progress)
+            except Exception as e:
+                self.error = f"{type(e).__name__}: {e}"
+                logging.error(f"Background job {self.name} failed: {self.error}")
+            self.finished_at = time.time()
+            with self._lock:
+                self.runs += 1
+                if not self._pending:
+                    self.running = False
+                    return
+                self._pending = False
+
+    def status(self):
+        return {
+            "running": self.running,
+            "queued": self._pending,
+            "runs": self.runs,
+            "progress": self.progress_values,
+            "result": self.result,
+            "error": self.error,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+        }
@@ -0,0 +1,102 @@
+import logging
+import queue
+import threading
+import time
+from concurrent.futures import Future
+
+_STOP = object()
+
+
+class MicroBatcher:
+    """
+    Dynamic micro-batching in front of a batch predict function.
+    Callers submit single items and get a Future; a worker thread collects items for up to
+    max_wait_ms or max_batch_size items, runs one batched call and resolves every Future.
+    """
+
+    def __init__(self, predict_batch, max_batch_size=32, max_wait_ms=5.0, name="micro-batcher"):
+        """
+        predict_batch: callable taking a list of items and returning a list of results in order.
+        """
+        if max_batch_size < 1:
+            raise ValueError("max_batch_size must be at least 1.")
+        self.predict_batch = predict_batch
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait_ms / 1000.0
+        self.batches = 0
+        self.items = 0
+        self._queue = queue.Queue()
+        self._lock = threading.Lock()
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name=name, daemon=True)
+        self._thread.start()
+
+    def submit(self, item):
+        """
+        Queues one item and returns a Future with its result. Raises RuntimeError once closed.
+        """
+        future = Future()
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("MicroBatcher is closed.")
+            self._queue.put((item, future))
+        return future
+
+    def predict(self, item, timeout=None):
+        """
+        Blocking convenience wrapper around submit().
+        """
+        return self.submit(item).result(timeout)
+
+    def close(self):
+        """
+        Stops the worker after the queued items are served; later submits raise RuntimeError.
+        """
+        with self._lock:
+            if not self._closed:
+                self._closed = True
+                self._queue.put(_STOP)
+        self._thread.join()
+
+    @property
+    def mean_batch_size(self):
+        return self.items / self.batches if self.batches else 0.0
+
+    def _collect(self, first):
+        batch = [first]
+        deadline = time.monotonic() + self.max_wait
+        while len(batch) < self.max_batch_size:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                entry = self._queue.get(timeout=remaining)
+            except queue.Empty:
+                break
+            if entry is _STOP:
+                self._queue.put(_STOP)
+                break
+            batch.append(entry)
+        return batch
+
+    def _run(self):
+        while True:
+            first = self._queue.get()
+            if first is _STOP:
+                return
+            batch = self._collect(first)
+            items = [item for item, _ in batch]
+            futures = [future for _, future in batch]
+            try:
+                results = self.predict_batch(items)
+                if len(results) != len(items):
+                    raise ValueError(f"predict_batch returned {len(results)} results for {len(items)} items.")
+            except Exception as e:
+                logging.error(f"Batch of {len(items)} failed: {e}")
+                for future in futures:
+                    future.set_exception(e)
+                continue
+            self.batches += 1
+            self.items += len(items)
+            for future, result in zip(futures, results):
+                future.set_result(result)
@@ -0,0 +1,63 @@
+import threading
+
+
+class CascadeClassifier:
+    """
+    Two-stage fake-news scoring: every text goes through the cheap model, and only texts whose
+    cheap P(real) falls inside the uncertainty band [low, high] are re-scored by the expensive one.
+    Both stages must return P(real) so the final label is simply probability >= 0.5.
+    """
+
+    def __init__(self, cheap, expensive, low: float, high: float):
+        """
+        cheap: callable(texts) -> dict with "probabilities" (P(real) per text) and optionally "version".
+        expensive: callable(texts) -> P(real) per text; only ever called with the escalated texts.
+        """
+        if not 0.0 <= low <= high <= 1.0:
+            raise ValueError("The uncertainty band must satisfy 0 <= low <= high <= 1.")
+        self.cheap = cheap
+        self.expensive = expensive
+        self.low = low
+        self.high = high
+        self.scored = 0
+        self.escalated = 0
+        self._lock = threading.Lock()
+
+    def is_uncertain(self, probability):
+        return self.low <= probability <= self.high
+
+    def predict(self, texts):
+        """
+        Returns {"labels": 1 real / 0 fake, "probabilities": P(real), "escalated": per-text flags,
+        "version": the cheap model's version}.
+        """
+        texts = list(texts)
+        cheap_result = self.cheap(texts)
+        probabilities = [float(probability) for probability in cheap_result["probabilities"]]
+        escalated = [self.is_uncertain(probability) for probability in probabilities]
+        positions = [position for position, flag in enumerate(escalated) if flag]
+        if positions:
+            for position, probability in zip(positions, self.expensive([texts[position] for position in positions])):
+                probabilities[position] = float(probability)
+
+        with self._lock:
+            self.scored += len(texts)
+            self.escalated += len(positions)
+        return {
+            "labels": [int(probability >= 0.5) for probability in probabilities],
+            "probabilities": probabilities,
+            "escalated": escalated,
+            "version": cheap_result.get("version"),
+        }
+
+    @property
+    def escalation_fraction(self):
+        return self.escalated / self.scored if self.scored else 0.0
+
+    def stats(self):
+        return {
+            "band": [self.low, self.high],
+            "scored": self.scored,
+            "escalated": self.escalated,
+            "escalation_fraction": round(self.escalation_fraction, 4),
+        }
@@ -0,0 +1,107 @@
+import zlib
+
+from flask import request
+
+try:
+    import brotli
+except ImportError:  # brotli is optional, gzip is always available
+    brotli = None
+
+DEFAULT_MIMETYPES = ('application/json', 'text/html', 'text/plain', 'text/css', 'application/javascript')
+
+
+def gzip_compressor(level):
+    """
+    Returns a streaming gzip encoder as (compress, flush, finish); wbits=31 writes the gzip header
+    and trailer. flush() emits everything compressed so far (a sync flush), finish() ends the stream.
+    """
+    encoder = zlib.compressobj(level, zlib.DEFLATED, 31)
+    return encoder.compress, lambda: encoder.flush(zlib.Z_SYNC_FLUSH), encoder.flush
+
+
+def brotli_compressor(quality):
+    """
+    Returns a streaming brotli encoder as (compress, flush, finish), like gzip_compressor.
+    """
+    encoder = brotli.Compressor(quality=quality)
+    return encoder.process, encoder.flush, encoder.finish
+
+
+def compress_chunks(chunks, compress, flush, finish):
+    """
+    Compresses an iterable of byte chunks without buffering the whole body. Every non-empty chunk
+    is flushed, so the client receives it right away instead of when the encoder's window fills.
+    """
+    for chunk in chunks:
+        if isinstance(chunk, str):
+            chunk = chunk.encode('utf-8')
+        if not chunk:
+            continue
+        data = compress(chunk) + flush()
+        if data:
+            yield data
+    yield finish()
+
+
+class ResponseCompression:
+    """
+    Negotiates gzip / brotli compression for Flask responses.
+
+    Configuration (app.config):
+    - COMPRESS_MIN_SIZE: bodies smaller than this many bytes are sent as-is
+    - COMPRESS_LEVEL: gzip level, 1 (fastest) to 9 (smallest)
+    - COMPRESS_BROTLI_QUALITY: brotli quality, 0 to 11
+    - COMPRESS_MIMETYPES: content types that get compressed
+    """
+
+    def __init__(self, app=None):
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        app.config.setdefault('COMPRESS_MIN_SIZE', 1024)
+        app.config.setdefault('COMPRESS_LEVEL', 6)
+        app.config.setdefault('COMPRESS_BROTLI_QUALITY', 4)
+        app.config.setdefault('COMPRESS_MIMETYPES', DEFAULT_MIMETYPES)
+        self.app = app
+        app.after_request(self.after_request)
+
+    def choose_encoding(self):
+        offered = ['br', 'gzip'] if brotli is not None else ['gzip']
+        return request.accept_encodings.best_match(offered)
+
+    def after_request(self, response):
+        config = self.app.config
+        response.vary.add('Accept-Encoding')
+
+        if (response.status_code < 200 or response.status_code in (204, 304)
+                or response.direct_passthrough
+                or 'Content-Encoding' in response.headers
+                or response.mimetype not in config['COMPRESS_MIMETYPES']):
+            return response
+
+        encoding = self.choose_encoding()
+        if encoding is None:
+            return response
+
+        if encoding == 'br':
+            compress, flush, finish = brotli_compressor(config['COMPRESS_BROTLI_QUALITY'])
+        else:
+            compress, flush, finish = gzip_compressor(config['COMPRESS_LEVEL'])
+
+        if response.is_streamed:
+            # Size is unknown up front, so streamed bodies are always compressed chunk by chunk
+            response.response = compress_chunks(response.response, compress, flush, finish)
+            response.headers.pop('Content-Length', None)
+        else:
+            body = response.get_data()
+            if len(body) < config['COMPRESS_MIN_SIZE']:
+                return response
+            response.set_data(compress(body) + finish())
+
+        response.headers['Content-Encoding'] = encoding
+        # The compressed bytes are a different representation of the same resource
+        etag, weak = response.get_etag()
+        if etag and not weak:
+            response.set_etag(etag, weak=True)
+        return response
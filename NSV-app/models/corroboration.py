@@ -0,0 +1,132 @@
+import heapq
+import math
+import threading
+import zlib
+from array import array
+from collections import Counter
+from datetime import datetime, timedelta
+
+from lexicon_matcher import tokenize
+
+HASH_FEATURES = 1 << 20
+MIN_TOKEN_LENGTH = 3
+
+
+def is_reputable(domain, reputable_sources):
+    """True if a label of the domain is one of the reputable source names (e.g. "bbc" for bbc.co.uk)."""
+    return bool(domain) and any(label in reputable_sources for label in domain.split('.'))
+
+
+def day_of(published):
+    """The day of a date or datetime, clamped to today (UTC): a future-dated article counts as published today."""
+    day = published.date() if hasattr(published, 'date') else published
+    return min(day, datetime.utcnow().date())
+
+
+def term_counts(text, n_features=HASH_FEATURES):
+    """Hashed term frequencies of a text (the hashing trick: no vocabulary to store or grow)."""
+    tokens = [token for token in tokenize(text) if len(token) >= MIN_TOKEN_LENGTH and not token.isdigit()]
+    return Counter(zlib.crc32(token.encode('utf-8')) % n_features for token in tokens)
+
+
+class CorroborationIndex:
+    """
+    Incremental hashed TF-IDF index of articles from reputable sources, sharded by publish day.
+
+    Every day shard holds inverted postings (feature -> article ids and weights, in flat arrays) and its
+    own document frequencies, so a whole day can be dropped once it leaves the retention period.
+    A query scores only the shards within window_days of the article's date and only its top_terms
+    heaviest terms, and returns the most similar articles from other domains (cosine similarity).
+    """
+
+    def __init__(self, window_days=3, retention_days=30, top_terms=40, n_features=HASH_FEATURES):
+        self.window = timedelta(days=window_days)
+        self.retention = timedelta(days=retention_days)
+        self.top_terms = top_terms
+        self.n_features = n_features
+        self.shards = {}
+        self.document_frequency = Counter()
+        self.documents = 0
+        self.domains = {}
+        self.lock = threading.Lock()
+        self.primed = False
+
+    def __len__(self):
+        return self.documents
+
+    def _idf(self, feature):
+        return math.log((1 + self.documents) / (1 + self.document_frequency[feature])) + 1.0
+
+    def _vector(self, counts):
+        weights = {feature: (1.0 + math.log(count)) * self._idf(feature) for feature, count in counts.items()}
+        norm = math.sqrt(sum(weight * weight for weight in weights.values())) or 1.0
+        return {feature: weight / norm for feature, weight in weights.items()}
+
+    def add(self, article_id, domain, text, published):
+        """
+        Indexes one article under the day of published (a date or datetime). Days are clamped to
+        today, so one wrongly future-dated article cannot push every real shard out of retention.
+        """
+        day = day_of(published)
+        counts = term_counts(text, self.n_features)
+        if not counts:
+            return
+        with self.lock:
+            shard = self.shards.setdefault(day, {'postings': {}, 'document_frequency': Counter(), 'documents': 0})
+            shard['document_frequency'].update(counts.keys())
+            shard['documents'] += 1
+            self.document_frequency.update(counts.keys())
+            self.documents += 1
+            self.domains[article_id] = domain
+            for feature, weight in self._vector(counts).items():
+                postings = shard['postings'].get(feature)
+                if postings is None:
+                    postings = shard['postings'][feature] = (array('q'), array('f'))
+                postings[0].append(article_id)
+                postings[1].append(weight)
+            self._prune(max(self.shards) - self.retention)
+
+    def _prune(self, oldest):
+        expired = [day for day in self.shards if day < oldest]
+        if not expired:
+            return
+        for day in expired:
+            shard = self.shards.pop(day)
+            self.document_frequency.subtract(shard['document_frequency'])
+            self.documents -= shard['documents']
+            for ids, _ in shard['postings'].values():
+                for article_id in ids:
+                    self.domains.pop(article_id, None)
+        self.document_frequency += Counter()  # drops features whose count fell to zero
+
+    def prime(self, articles):
+        """Loads (article_id, domain, text, published) tuples, e.g. the recent reputable articles at startup."""
+        for article in articles:
+            self.add(*article)
+        self.primed = True
+
+    def query(self, text, published, k=5, exclude_domain=None):
+        """
+        Top-k (article_id, similarity) among indexed articles published within window_days of published,
+        from domains other than exclude_domain, most similar first.
+        """
+        day = day_of(published)
+        counts = term_counts(text, self.n_features)
+        if not counts:
+            return []
+        with self.lock:
+            vector = self._vector(counts)
+            terms = heapq.nlargest(self.top_terms, vector.items(), key=lambda item: item[1])
+            scores = Counter()
+            for shard_day, shard in self.shards.items():
+                if abs(shard_day - day) > self.window:
+                    continue
+                for feature, query_weight in terms:
+                    postings = shard['postings'].get(feature)
+                    if postings is None:
+                        continue
+                    for article_id, weight in zip(*postings):
+                        scores[article_id] += query_weight * weight
+            ranked = [(article_id, min(1.0, score)) for article_id, score in scores.items()
+                      if exclude_domain is None or self.domains.get(article_id) != exclude_domain]
+        return heapq.nlargest(k, ranked, key=lambda item: item[1])
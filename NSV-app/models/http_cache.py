@@ -0,0 +1,71 @@
+import hashlib
+import json
+from datetime import timezone
+
+from flask import current_app, jsonify, request
+
+DEFAULT_CACHE_CONTROL = "public, max-age=60"
+
+
+def row_etag(row_id, updated_at):
+    """
+    Builds an ETag from a row id and its last modification time.
+    """
+    stamp = updated_at.isoformat() if updated_at else ""
+    return hashlib.sha1(f"{row_id}:{stamp}".encode("utf-8")).hexdigest()
+
+
+def collection_etag(*parts):
+    """
+    Builds an ETag for a listing from cheap aggregates (count, max id, max updated_at).
+    The count is what changes on a delete; listings are served without Last-Modified, since
+    max(updated_at) does not move when a row is deleted.
+    """
+    key = ":".join(part.isoformat() if hasattr(part, "isoformat") else str(part) for part in parts)
+    return hashlib.sha1(key.encode("utf-8")).hexdigest()
+
+
+def payload_etag(payload):
+    """
+    Builds an ETag from a serialized payload, for tables without an updated_at column.
+    """
+    body = json.dumps(payload, sort_keys=True, default=str)
+    return hashlib.sha1(body.encode("utf-8")).hexdigest()
+
+
+def _http_date(value):
+    # Columns are stored as naive UTC; HTTP dates have a one second resolution
+    if value is None:
+        return None
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.replace(microsecond=0)
+
+
+def is_not_modified(etag, last_modified=None):
+    """
+    Checks the request validators. If-None-Match takes precedence over If-Modified-Since.
+    """
+    if request.if_none_match:
+        return request.if_none_match.contains_weak(etag)
+    last_modified = _http_date(last_modified)
+    if last_modified is not None and request.if_modified_since is not None:
+        return last_modified <= request.if_modified_since
+    return False
+
+
+def conditional_json(build_payload, etag, last_modified=None, status=200):
+    """
+    Returns a 304 when the client copy is still fresh; otherwise serializes build_payload().
+    The payload is built lazily so a revalidation never pays for to_dict or jsonify.
+    """
+    if is_not_modified(etag, last_modified):
+        response = current_app.response_class(status=304)
+    else:
+        response = jsonify(build_payload())
+        response.status_code = status
+    response.set_etag(etag)
+    if last_modified is not None:
+        response.last_modified = _http_date(last_modified)
+    response.headers["Cache-Control"] = current_app.config.get("CACHE_CONTROL", DEFAULT_CACHE_CONTROL)
+    return response
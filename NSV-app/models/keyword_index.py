@@ -0,0 +1,46 @@
+import re
+
+# Keywords stored per article (the most frequent ones), and the longest keyword kept
+KEYWORD_INDEX_LIMIT = 50
+MAX_KEYWORD_LENGTH = 100
+MAX_QUERY_TERMS = 10
+MAX_PER_PAGE = 100
+WORD_PATTERN = re.compile(r'\b\w+\b')
+
+
+def query_terms(query, stop_words=()):
+    """Search terms of a query, normalized like KeywordExtractor keywords (lowercase words, no stop words)."""
+    terms = []
+    for word in WORD_PATTERN.findall((query or '').lower()):
+        if word not in stop_words and word not in terms and len(word) <= MAX_KEYWORD_LENGTH:
+            terms.append(word)
+    return terms[:MAX_QUERY_TERMS]
+
+
+def keyword_rows(article_id, keywords, limit=KEYWORD_INDEX_LIMIT):
+    """
+    article_keywords rows for the top keywords of KeywordExtractor.extract_keywords output
+    ({keyword: {"frequency", "vader_score", "sentiment", ...}}), most frequent first.
+    """
+    ranked = sorted(((keyword, data) for keyword, data in keywords.items() if len(keyword) <= MAX_KEYWORD_LENGTH),
+                    key=lambda item: item[1]['frequency'], reverse=True)
+    return [
+        {
+            'keyword': keyword,
+            'article_id': article_id,
+            'frequency': int(data['frequency']),
+            'vader_score': float(data.get('vader_score', 0.0)),
+            'sentiment': data.get('sentiment'),
+        }
+        for keyword, data in ranked[:limit]
+    ]
+
+
+def page_arguments(args):
+    """(page, per_page) from request arguments: 1-based page, per_page capped at MAX_PER_PAGE."""
+    try:
+        page = max(1, int(args.get('page', 1)))
+        per_page = min(MAX_PER_PAGE, max(1, int(args.get('per_page', 20))))
+    except (TypeError, ValueError):
+        raise ValueError("page and per_page must be integers")
+    return page, per_page
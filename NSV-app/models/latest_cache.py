@@ -0,0 +1,80 @@
+import hashlib
+import json
+import threading
+from collections import deque
+
+
+class LatestArticlesCache:
+    """
+    In-process ring buffer holding the most recently created articles.
+    Serves /latest-articles without a database round trip on every poll.
+    """
+
+    def __init__(self, size=5):
+        self.size = size
+        self.primed = False
+        self._items = deque(maxlen=size)  # newest article first
+        self._lock = threading.Lock()
+        self._body = None
+        self._etag = None
+
+    def prime(self, articles):
+        """
+        Fills the buffer from already serialized articles ordered newest first.
+        """
+        with self._lock:
+            self._items.clear()
+            for article in reversed(articles[:self.size]):
+                self._items.appendleft(article)
+            self._invalidate()
+            self.primed = True
+
+    def push(self, article):
+        """
+        Write-through for a freshly inserted article; the oldest entry falls off.
+        """
+        with self._lock:
+            self._drop(article['article_id'])
+            self._items.appendleft(article)
+            self._invalidate()
+
+    def update(self, article):
+        """
+        Replaces a cached article in place after it was edited.
+        """
+        with self._lock:
+            for index, cached in enumerate(self._items):
+                if cached['article_id'] == article['article_id']:
+                    self._items[index] = article
+                    self._invalidate()
+                    return
+
+    def remove(self, article_id):
+        """
+        Drops a deleted article; the buffer is refilled from the database on next read.
+        """
+        with self._lock:
+            if self._drop(article_id):
+                self._invalidate()
+                self.primed = False
+
+    def snapshot(self):
+        """
+        Returns the serialized JSON body and its ETag, computed once per change.
+        """
+        with self._lock:
+            if self._body is None:
+                self._body = json.dumps(list(self._items)).encode('utf-8')
+                self._etag = hashlib.sha1(self._body).hexdigest()
+            return self._body, self._etag
+
+    def _drop(self, article_id):
+        for cached in list(self._items):
+            if cached['article_id'] == article_id:
+                self._items.remove(cached)
+                return True
+        return False
+
+    def _invalidate(self):
+        self._body = None
+        self._etag = None
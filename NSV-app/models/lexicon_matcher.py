@@ -0,0 +1,167 @@
+import json
+import re
+import unicodedata
+from collections import Counter, deque
+
+# Keywords indicating potential misinformation (English and Romanian, without diacritics)
+MISINFORMATION_TERMS = ['fake', 'misinformation', 'conspiracy', 'false', 'debunked', 'fraud',
+                        'scam', 'unverified', 'unreliable', 'unsubstantiated', 'rumor', 'fabricated',
+                        'rau', 'fals', 'neadevarat', 'dezinformare', 'conspiratie', 'frauda',
+                        'escrocherie', 'nemotivat', 'nerecunoscut', 'nejustificat', 'zvon', 'fabricat']
+
+REPUTABLE_SOURCES = ['bbc', 'cnn', 'reuters', 'nytimes', 'theguardian',
+                     'washingtonpost', 'wsj', 'bloomberg', 'apnews', 'npr',
+                     'digi24', 'stirileprotv', 'antena3',
+                     'realitatea', 'gandul', 'adevarul', 'ziare']
+
+TOKEN_PATTERN = re.compile(r'\w+')
+COMBINING_MARKS = re.compile(r'[\u0300-\u036f]')
+
+
+def normalize_text(text):
+    """
+    Lowercases the text and strips diacritics ("neadevărat" -> "neadevarat").
+    """
+    lowered = text.lower()
+    if lowered.isascii():
+        return lowered
+    return COMBINING_MARKS.sub('', unicodedata.normalize('NFKD', lowered))
+
+
+def tokenize(text):
+    """
+    Splits normalized text into word tokens; matching on tokens gives word boundaries for free.
+    """
+    return TOKEN_PATTERN.findall(normalize_text(text))
+
+
+class AhoCorasick:
+    """
+    Aho-Corasick automaton over token sequences.
+    Scanning is one pass over the tokens, independent of the number of phrases.
+    """
+
+    def __init__(self, phrases):
+        """
+        phrases: iterable of (key, tokens) pairs; a phrase may span several tokens.
+        """
+        self._goto = [{}]
+        self._fail = [0]
+        self._output = [[]]
+        for key, tokens in phrases:
+            self._add(key, tokens)
+        self._build_failure_links()
+
+    def _add(self, key, tokens):
+        if not tokens:
+            return
+        state = 0
+        for token in tokens:
+            next_state = self._goto[state].get(token)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto[state][token] = next_state
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append([])
+            state = next_state
+        self._output[state].append(key)
+
+    def _build_failure_links(self):
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for token, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fallback = self._fail[state]
+                while fallback and token not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                self._fail[next_state] = self._goto[fallback].get(token, 0)
+                # Shorter phrases ending here are reported through the failure state
+                self._output[next_state] = self._output[next_state] + self._output[self._fail[next_state]]
+
+    def count(self, tokens):
+        """
+        Returns a Counter of phrase key -> number of occurrences in tokens.
+        """
+        goto, fail, output = self._goto, self._fail, self._output
+        counts = Counter()
+        state = 0
+        for token in tokens:
+            while state and token not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(token, 0)
+            if output[state]:
+                counts.update(output[state])
+        return counts
+
+
+class Lexicon:
+    """
+    Misinformation terms and reputable source names used by check_consistency.
+    """
+
+    def __init__(self, misinformation_terms=None, reputable_sources=None):
+        self.misinformation_terms = list(misinformation_terms if misinformation_terms is not None
+                                         else MISINFORMATION_TERMS)
+        self.reputable_sources = list(reputable_sources if reputable_sources is not None
+                                      else REPUTABLE_SOURCES)
+
+    @classmethod
+    def load(cls, path=None):
+        """
+        Loads a lexicon from a JSON file with "misinformation_terms" and "reputable_sources" lists.
+        Missing keys (or no path at all) fall back to the built-in lists.
+        """
+        if not path:
+            return cls()
+        with open(path, encoding='utf-8') as file:
+            data = json.load(file)
+        return cls(data.get('misinformation_terms'), data.get('reputable_sources'))
+
+
+class LexiconMatches:
+    """
+    Per-term hit counts from one scan.
+    """
+
+    def __init__(self, misinformation_hits, source_hits):
+        self.misinformation_hits = misinformation_hits
+        self.source_hits = source_hits
+
+    @property
+    def has_misinformation_terms(self):
+        return bool(self.misinformation_hits)
+
+    @property
+    def has_reputable_sources(self):
+        return bool(self.source_hits)
+
+
+class LexiconMatcher:
+    """
+    Compiles a Lexicon into one automaton and scans text for both term groups in a single pass.
+    """
+
+    MISINFORMATION = 'misinformation'
+    SOURCE = 'source'
+
+    def __init__(self, lexicon=None):
+        self.lexicon = lexicon or Lexicon()
+        phrases = [((self.MISINFORMATION, term), tuple(tokenize(term)))
+                   for term in self.lexicon.misinformation_terms]
+        phrases += [((self.SOURCE, source), tuple(tokenize(source)))
+                    for source in self.lexicon.reputable_sources]
+        self.automaton = AhoCorasick(phrases)
+
+    def scan(self, *texts):
+        """
+        Scans one or more texts (e.g. title and content) and returns LexiconMatches.
+        """
+        counts = Counter()
+        for text in texts:
+            if text:
+                counts.update(self.automaton.count(tokenize(text)))
+        misinformation_hits = {term: hits for (group, term), hits in counts.items() if group == self.MISINFORMATION}
+        source_hits = {term: hits for (group, term), hits in counts.items() if group == self.SOURCE}
+        return LexiconMatches(misinformation_hits, source_hits)
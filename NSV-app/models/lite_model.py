@@ -0,0 +1,56 @@
+import threading
+
+import numpy as np
+
+
+def _interpreter_class():
+    """
+    Prefers the standalone runtimes (a few MB, no TensorFlow import); full TensorFlow is the last resort.
+    """
+    try:
+        from ai_edge_litert.interpreter import Interpreter
+        return Interpreter
+    except ImportError:
+        pass
+    try:
+        from tflite_runtime.interpreter import Interpreter
+        return Interpreter
+    except ImportError:
+        pass
+    import tensorflow as tf
+    return tf.lite.Interpreter
+
+
+class LiteModel:
+    """
+    A TFLite flatbuffer behind the subset of the Keras model API MLModel uses (predict, predict_on_batch).
+    The input tensor is resized to the batch shape on demand, so any batch size works.
+    An interpreter is not thread-safe, so invocations are serialized.
+    """
+
+    def __init__(self, model_path: str, num_threads: int = None):
+        self.model_path = model_path
+        self.interpreter = _interpreter_class()(model_path=model_path, num_threads=num_threads)
+        self.interpreter.allocate_tensors()
+        self._input = self.interpreter.get_input_details()[0]
+        self._output = self.interpreter.get_output_details()[0]
+        self._shape = tuple(self._input['shape'])
+        self._lock = threading.Lock()
+
+    @property
+    def input_length(self):
+        return int(self._input['shape_signature'][1])
+
+    def predict_on_batch(self, sequences):
+        sequences = np.asarray(sequences, dtype=self._input['dtype'])
+        with self._lock:
+            if sequences.shape != self._shape:
+                self.interpreter.resize_tensor_input(self._input['index'], sequences.shape)
+                self.interpreter.allocate_tensors()
+                self._shape = sequences.shape
+            self.interpreter.set_tensor(self._input['index'], sequences)
+            self.interpreter.invoke()
+            return self.interpreter.get_tensor(self._output['index']).copy()
+
+    def predict(self, sequences, **kwargs):
+        return self.predict_on_batch(sequences)
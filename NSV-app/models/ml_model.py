@@ -1,21 +1,18 @@
-import tensorflow as tf
 import numpy as np
 from abc import ABC
 import sys
 import os
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
-import re
-from models.ml_model_aop import Aspect
-from tensorflow.keras.preprocessing.text import Tokenizer
-from tensorflow.keras.preprocessing.sequence import pad_sequences
-from tensorflow.keras.models import Sequential, Model
-from tensorflow.keras.layers import Embedding, LSTM, Dense, Conv1D, MaxPooling1D, Bidirectional, GlobalMaxPool1D, Input, Dropout
-from tensorflow.keras.models import load_model
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../../model_prep')))
 import model_config
+from glove_store import load_glove
 import mop 
 from models.aop_wrapper import Aspect
+from models.batching import MicroBatcher
+from models.lite_model import LiteModel
+from models.text_cleaning import clean_article
+from models.text_encoder import TextEncoder
 
 
 class MLModel:
@@ -29,6 +26,7 @@ class MLModel:
     tokenizer = None  
     embedding_matrix = None  
     word_to_vector = None 
+    batcher = None
     
     def __new__(cls):
         """
@@ -41,17 +39,25 @@ class MLModel:
     def load_word_vectors(self, embedding_file: str, max_vocab_size: int, embedding_dim: int):
         """
         Loads word vectors and prepares embedding matrix.
+        The GloVe text file is converted once to a memory-mapped binary store (see glove_store).
         """
-        self.word_to_vector = {}
-        with open(embedding_file, encoding='utf-8') as f:
-            for line in f:
-                values = line.split()
-                word = values[0]
-                vec = np.asarray(values[1:], dtype='float32')
-                self.word_to_vector[word] = vec
+        self.word_to_vector = load_glove(embedding_file)
         
         print(f'Found {len(self.word_to_vector)} word vectors.')
-        self.tokenizer = Tokenizer(num_words=max_vocab_size)
+
+    @Aspect.log_execution
+    @Aspect.measure_time
+    @Aspect.handle_exceptions
+    @mop.monitor(
+        lambda vocab_path: isinstance(vocab_path, str) and os.path.exists(vocab_path),
+        lambda vocab_path: f"Vocabulary file {vocab_path} does not exist or invalid file path."
+    )
+    def load_tokenizer(self, vocab_path: str):
+        """
+        Loads the tokenizer vocabulary fitted during training (written by model_creation.py).
+        """
+        self.tokenizer = TextEncoder.load(vocab_path)
+        print(f'Loaded a vocabulary of {len(self.tokenizer)} words.')
     
     @Aspect.log_execution
     @Aspect.measure_time
@@ -62,8 +68,14 @@ class MLModel:
     )
     def load_model(self, model_path: str):
         """
-        Loads the TensorFlow model from a given path.
+        Loads the model from a given path.
+        A .tflite file (see model_prep/export_model.py) is served by the TFLite interpreter without
+        importing TensorFlow; anything else is loaded with Keras.
         """
+        if model_path.endswith('.tflite'):
+            self.model = LiteModel(model_path)
+            return
+        from tensorflow.keras.models import load_model
         self.model = load_model(model_path)
     
     @Aspect.log_execution
@@ -75,11 +87,11 @@ class MLModel:
     )
     def preprocess(self, article_text: str):
         """
-        Preprocesses raw article text for prediction.
+        Preprocesses raw article text for prediction: the training cleaning (text_cleaning.clean_article),
+        with the stopwords stored in the tokenizer vocabulary.
         """
-        article_text = article_text.lower()
-        article_text = re.sub(r'[^a-z\s]', '', article_text)
-        return article_text
+        stopwords = self.tokenizer.stopwords if self.tokenizer is not None else ()
+        return clean_article('', article_text, stopwords)
     
     @Aspect.log_execution
     @Aspect.measure_time
@@ -92,13 +104,7 @@ class MLModel:
         """
         Generates the embedding matrix from the word vectors.
         """
-        embedding_matrix = np.zeros((max_vocab_size, embedding_dim))
-        for word, i in word_to_index.items():
-            if i < max_vocab_size:
-                embedding_vector = self.word_to_vector.get(word)
-                if embedding_vector is not None:
-                    embedding_matrix[i] = embedding_vector
-        return embedding_matrix
+        return self.word_to_vector.gather(word_to_index, max_vocab_size)
     
     @Aspect.log_execution
     @Aspect.measure_time
@@ -115,18 +121,66 @@ class MLModel:
         if self.model is None:
             raise ValueError("Model has not been loaded. Please load the model before prediction.")
         
-        # Validăm dacă vectorii de cuvinte sunt încărcați
-        if self.word_to_vector is None:
-            raise ValueError("Word vectors have not been loaded. Please load word vectors before prediction.")
+        # Validăm dacă vocabularul tokenizer-ului este încărcat
+        if self.tokenizer is None:
+            raise ValueError("Tokenizer vocabulary has not been loaded. Please load it before prediction.")
 
         # Preprocesăm textul de intrare
         article_text = self.preprocess(article_text)
 
-        sequences = self.tokenizer.texts_to_sequences([article_text])
-        padded_sequences = pad_sequences(sequences, maxlen=max_sequence_length)
+        padded_sequences = self.tokenizer.encode([article_text], max_sequence_length)
         
         prediction = self.model.predict(padded_sequences)
         return {"raw_prediction": prediction[0][0]}  
+
+    def predict_batch(self, article_texts: list, max_sequence_length: int):
+        """
+        Runs one forward pass for many texts; returns one result dict per text, in order.
+        """
+        if self.model is None:
+            raise ValueError("Model has not been loaded. Please load the model before prediction.")
+        if self.tokenizer is None:
+            raise ValueError("Tokenizer vocabulary has not been loaded. Please load it before prediction.")
+
+        padded_sequences = self.tokenizer.encode([self.tokenizer.clean(text) for text in article_texts],
+                                                 max_sequence_length)
+
+        # predict_on_batch skips the per-call setup of model.predict, which dominates small batches
+        predictions = np.asarray(self.model.predict_on_batch(padded_sequences))
+        return [{"raw_prediction": prediction[0]} for prediction in predictions]
+
+    def predict_probabilities(self, article_texts: list, max_sequence_length: int = model_config.MAX_SEQUENCE_LENGTH):
+        """
+        P(real) per text (training labels are 1 for real news), e.g. as the second stage of a cascade.
+        """
+        return [float(result["raw_prediction"]) for result in self.predict_batch(article_texts, max_sequence_length)]
+
+    def _predict_requests(self, requests):
+        # Requests are (text, max_sequence_length) pairs; each length gets its own forward pass
+        results = [None] * len(requests)
+        by_length = {}
+        for position, (article_text, max_sequence_length) in enumerate(requests):
+            by_length.setdefault(max_sequence_length, []).append(position)
+        for max_sequence_length, positions in by_length.items():
+            batch = self.predict_batch([requests[position][0] for position in positions], max_sequence_length)
+            for position, result in zip(positions, batch):
+                results[position] = result
+        return results
+
+    def enable_batching(self, max_batch_size: int = model_config.MAX_BATCH_SIZE,
+                        max_wait_ms: float = model_config.MAX_BATCH_WAIT_MS):
+        """
+        Routes get_prediction through a micro-batcher: concurrent requests arriving within
+        max_wait_ms (up to max_batch_size of them) share one forward pass.
+        """
+        self.disable_batching()
+        self.batcher = MicroBatcher(self._predict_requests, max_batch_size, max_wait_ms, name="mlmodel-batcher")
+        return self.batcher
+
+    def disable_batching(self):
+        if self.batcher is not None:
+            self.batcher.close()
+            self.batcher = None
     
     @Aspect.log_execution
     @Aspect.measure_time
@@ -135,6 +189,8 @@ class MLModel:
         """
         Handles full prediction pipeline: preprocesses and predicts.
         """
+        if self.batcher is not None:
+            return self.batcher.predict((article_text, max_sequence_length))
         return self.predict(article_text, max_sequence_length)
 
 
@@ -142,12 +198,12 @@ def main():
     model = MLModel()
     
  
-    model.load_word_vectors(embedding_file=model_config.EMBEDDING_FILE, max_vocab_size=model_config.MAX_VOCAB_SIZE, embedding_dim=model_config.EMBEDDING_DIM)
+    model.load_tokenizer(model_config.TOKENIZER_VOCAB_FILE)
 
-    model.load_model("fake_news_model.h5")
+    model.load_model(sys.argv[1] if len(sys.argv) > 1 else "fake_news_model.h5")
 
     article_text = "Acesta este un text de test pentru modelul ML."
-    prediction = model.get_prediction(article_text, max_sequence_length=500)
+    prediction = model.get_prediction(article_text, max_sequence_length=model_config.MAX_SEQUENCE_LENGTH)
     print("Rezultatul predicției:", prediction)
 
     
@@ -0,0 +1,236 @@
+import argparse
+import hashlib
+import json
+import logging
+import os
+import shutil
+import threading
+import time
+from collections import namedtuple
+from datetime import datetime
+
+MANIFEST = 'manifest.json'
+CURRENT = 'CURRENT'
+
+# One immutable (version, bundle) pair: a request reads it once and keeps using it even if a swap happens
+ActiveModel = namedtuple('ActiveModel', ['version', 'bundle'])
+
+
+class ChecksumError(Exception):
+    pass
+
+
+def sha256_file(path, chunk_size=1 << 20):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as file:
+        for chunk in iter(lambda: file.read(chunk_size), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class ModelRegistry:
+    """
+    Versioned model artifacts with atomic hot-swap.
+
+    Layout: <root>/<version>/ holds the artifacts plus manifest.json (sha256 of every file);
+    <root>/CURRENT names the version workers should serve. A new version is verified and loaded
+    in the background, then swapped in with a single reference assignment, so in-flight requests
+    finish on the version they started with and no worker restart is needed.
+    """
+
+    def __init__(self, root, loader, fallback=None, on_swap=None):
+        """
+        loader: callable(version_dir) -> bundle (e.g. model and vectorizer).
+        fallback: optional (version, zero-argument loader) used when root has no CURRENT yet.
+        on_swap: optional callable(ActiveModel) run after every swap.
+        """
+        self.root = root
+        self.loader = loader
+        self.fallback = fallback
+        self.on_swap = on_swap
+        self.last_error = None
+        self._active = None
+        self._load_lock = threading.Lock()
+        self._watcher = None
+
+    def version_dir(self, version):
+        return os.path.join(self.root, version)
+
+    def versions(self):
+        if not os.path.isdir(self.root):
+            return []
+        return sorted(name for name in os.listdir(self.root)
+                      if os.path.isfile(os.path.join(self.root, name, MANIFEST)))
+
+    def current_version(self):
+        """
+        The version named by <root>/CURRENT, or None.
+        """
+        try:
+            with open(os.path.join(self.root, CURRENT), encoding='utf-8') as file:
+                return file.read().strip() or None
+        except FileNotFoundError:
+            return None
+
+    def verify(self, version):
+        """
+        Checks every artifact of a version against its manifest checksums.
+        """
+        directory = self.version_dir(version)
+        with open(os.path.join(directory, MANIFEST), encoding='utf-8') as file:
+            manifest = json.load(file)
+        for name, expected in manifest['files'].items():
+            actual = sha256_file(os.path.join(directory, name))
+            if actual != expected:
+                raise ChecksumError(f"{version}/{name}: sha256 {actual} does not match manifest {expected}.")
+        return manifest
+
+    def current(self):
+        """
+        The active model, loading CURRENT (or the fallback) on first use.
+        """
+        active = self._active
+        if active is None:
+            with self._load_lock:
+                if self._active is None:
+                    version = self.current_version()
+                    if version is not None:
+                        self._swap(ActiveModel(version, self._load(version)))
+                    elif self.fallback is not None:
+                        version, loader = self.fallback
+                        self._swap(ActiveModel(version, loader()))
+                    else:
+                        raise LookupError(f"No model version is published under {self.root}.")
+            active = self._active
+        return active
+
+    @property
+    def version(self):
+        active = self._active
+        return active.version if active is not None else None
+
+    def activate(self, version, background=True):
+        """
+        Verifies and loads a version, then swaps it in. Returns the loading thread when background=True.
+        A failed load keeps the old version active and is recorded in last_error.
+        """
+        if background:
+            thread = threading.Thread(target=self._activate, args=(version,), name=f'model-load-{version}', daemon=True)
+            thread.start()
+            return thread
+        return self._activate(version)
+
+    def _activate(self, version):
+        with self._load_lock:
+            if self.version == version:
+                return self._active
+            try:
+                bundle = self._load(version)
+            except Exception as e:
+                self.last_error = f"{version}: {e}"
+                logging.error(f"Model version {version} was not activated: {e}")
+                return None
+            self._swap(ActiveModel(version, bundle))
+            return self._active
+
+    def _load(self, version):
+        start = time.perf_counter()
+        self.verify(version)
+        bundle = self.loader(self.version_dir(version))
+        logging.info(f"Loaded model version {version} in {time.perf_counter() - start:.4f} seconds")
+        return bundle
+
+    def _swap(self, active):
+        previous = self._active
+        self._active = active
+        self.last_error = None
+        logging.info(f"Serving model version {active.version} (was {previous.version if previous else None})")
+        if self.on_swap is not None:
+            self.on_swap(active)
+
+    def poll(self):
+        """
+        Activates the CURRENT version if it changed since the last check.
+        """
+        version = self.current_version()
+        if version is not None and version != self.version:
+            return self.activate(version, background=False)
+        return None
+
+    def watch(self, interval=30.0):
+        """
+        Polls CURRENT in a daemon thread, so publishing a new version reaches every worker without a restart.
+        """
+        if self._watcher is not None:
+            return self._watcher
+
+        def loop():
+            while True:
+                time.sleep(interval)
+                try:
+                    self.poll()
+                except Exception as e:
+                    logging.error(f"Model registry poll failed: {e}")
+
+        self._watcher = threading.Thread(target=loop, name='model-registry-watch', daemon=True)
+        self._watcher.start()
+        return self._watcher
+
+    def status(self):
+        return {
+            "version": self.version,
+            "current": self.current_version(),
+            "available": self.versions(),
+            "last_error": self.last_error,
+        }
+
+
+def publish(root, version, files):
+    """
+    Copies artifacts into <root>/<version>/ and writes their manifest. Does not activate the version.
+    """
+    directory = os.path.join(root, version)
+    if os.path.exists(directory):
+        raise FileExistsError(f"Model version {version} already exists under {root}.")
+    staging = directory + '.tmp'
+    os.makedirs(staging)
+    checksums = {}
+    for path in files:
+        name = os.path.basename(path)
+        shutil.copyfile(path, os.path.join(staging, name))
+        checksums[name] = sha256_file(os.path.join(staging, name))
+    with open(os.path.join(staging, MANIFEST), 'w', encoding='utf-8') as file:
+        json.dump({"version": version, "created_at": datetime.utcnow().isoformat(), "files": checksums}, file, indent=2)
+    os.replace(staging, directory)
+    return directory
+
+
+def set_current(root, version):
+    """
+    Points CURRENT at a published version; the rename makes the switch atomic for readers.
+    """
+    if not os.path.isfile(os.path.join(root, version, MANIFEST)):
+        raise FileNotFoundError(f"Model version {version} is not published under {root}.")
+    staging = os.path.join(root, CURRENT + '.tmp')
+    with open(staging, 'w', encoding='utf-8') as file:
+        file.write(version + '\n')
+    os.replace(staging, os.path.join(root, CURRENT))
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Publish and activate versioned model artifacts.')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+    publish_parser = subparsers.add_parser('publish', help='copy artifacts into a new version directory')
+    publish_parser.add_argument('root')
+    publish_parser.add_argument('version')
+    publish_parser.add_argument('files', nargs='+')
+    activate_parser = subparsers.add_parser('activate', help='point CURRENT at a published version')
+    activate_parser.add_argument('root')
+    activate_parser.add_argument('version')
+    args = parser.parse_args()
+
+    if args.command == 'publish':
+        print(f'Published {publish(args.root, args.version, args.files)}')
+    else:
+        set_current(args.root, args.version)
+        print(f'{args.root}/CURRENT -> {args.version}')
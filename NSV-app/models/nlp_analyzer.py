@@ -2,17 +2,16 @@ import logging
 import requests
 import re
 from collections import Counter, defaultdict
-from nltk.corpus import stopwords
 from textblob import TextBlob
 from bs4 import BeautifulSoup
 from abc import ABC, abstractmethod
 from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
-import nltk
 from datetime import datetime
 from aop_wrapper import Aspect
 from statistics import median
+from resource_registry import registry
 
-nltk.download('stopwords')
+registry.register('vader_analyzer', SentimentIntensityAnalyzer)
 
 def get_class_name(instance):
     return instance.__class__.__name__
@@ -182,16 +181,25 @@ class ArticleParser:
         logging.info(f"Article text saved to {filename}")
 
 class KeywordExtractor:
-    def __init__(self):
-        self.sentiment_analyzers = [TextBlobSentimentAnalyzer(), VaderSentimentAnalyzer()]
-        self.stop_words = set(stopwords.words('english'))
+    def __init__(self, sentiment_analyzers=None):
+        self.sentiment_analyzers = sentiment_analyzers or [TextBlobSentimentAnalyzer(), VaderSentimentAnalyzer()]
+
+    @property
+    def stop_words(self):
+        # Loaded on first use (or in warmup), never at import
+        return registry.get('stopwords_en')
+
+    def new_context(self):
+        """Creates an analysis context over this extractor's analyzers."""
+        return AnalysisContext(self.sentiment_analyzers)
 
     @Aspect.log_execution
     @Aspect.measure_time
-    def extract_keywords(self, text):
+    def extract_keywords(self, text, context=None):
+        context = context or self.new_context()
         sentences = self.tokenize_text(text)
         word_freq = self.calculate_word_frequency(text)
-        keyword_sentiments = self.analyze_keyword_sentiments(sentences, word_freq)
+        keyword_sentiments = self.analyze_keyword_sentiments(sentences, word_freq, context)
 
         sorted_keywords = dict(sorted(
             keyword_sentiments.items(), 
@@ -200,6 +208,8 @@ class KeywordExtractor:
         ))
 
         self.validate_keywords(sorted_keywords)
+        # Kept for the caller of the request (e.g. the keyword index), which otherwise only sees the aggregate
+        context.keywords = sorted_keywords
         return sorted_keywords
 
     def tokenize_text(self, text):
@@ -209,11 +219,12 @@ class KeywordExtractor:
         words = [word for word in re.findall(r'\b\w+\b', text.lower()) if word not in self.stop_words]
         return Counter(words)
 
-    def analyze_keyword_sentiments(self, sentences, word_freq):
+    def analyze_keyword_sentiments(self, sentences, word_freq, context=None):
+        context = context or self.new_context()
         keyword_sentiments = defaultdict(lambda: {"frequency": 0, "vader_score": 0, "sentiment_counts": Counter()})
         for sentence in sentences:
             words = self.extract_words_from_sentence(sentence)
-            self.update_sentiments_for_sentence(sentence, words, keyword_sentiments)
+            self.update_sentiments_for_sentence(sentence, words, keyword_sentiments, context)
         self.finalize_sentiment_scores(keyword_sentiments)
         return keyword_sentiments
 
@@ -221,11 +232,15 @@ class KeywordExtractor:
         sentence = sentence.strip()
         return [word for word in re.findall(r'\b\w+\b', sentence.lower()) if word not in self.stop_words]
 
-    def update_sentiments_for_sentence(self, sentence, words, keyword_sentiments):
+    def update_sentiments_for_sentence(self, sentence, words, keyword_sentiments, context=None):
+        if not words:
+            return
+        # Every word of the sentence shares the sentence's sentiment, so each analyzer runs once per sentence
+        context = context or self.new_context()
+        results = context.analyze_all(sentence)
         for word in words:
             keyword_sentiments[word]["frequency"] += 1
-            for analyzer in self.sentiment_analyzers:
-                result = analyzer.analyze_text(sentence)
+            for result in results:
                 self.update_sentiment_data(word, result, keyword_sentiments)
 
     def update_sentiment_data(self, word, result, keyword_sentiments):
@@ -283,7 +298,7 @@ class KeywordExtractor:
 
         return weighted_average_vader_score
 
-    def process_article_and_keywords(self, url, output_text_filename="article_text.txt", output_keywords_filename="keywords_summary.txt"):
+    def process_article_and_keywords(self, url, output_text_filename="article_text.txt", output_keywords_filename="keywords_summary.txt", context=None):
         # Extract article text from the URL
         parser = ArticleParser()
         article_text = parser.extract_article_text(url)
@@ -294,7 +309,7 @@ class KeywordExtractor:
         Monitor.validate_article_content(article_text)
 
         # Extract keywords from article
-        keywords = self.extract_keywords(article_text)
+        keywords = self.extract_keywords(article_text, context)
         self.save_keywords_to_file(keywords, output_keywords_filename)
         print(f"Keywords and their sentiments saved to '{output_keywords_filename}'.")
 
@@ -351,8 +366,10 @@ class TextBlobSentimentAnalyzer(SentimentAnalyzer):
 
 
 class VaderSentimentAnalyzer(SentimentAnalyzer):
-    def __init__(self):
-        self.analyzer = SentimentIntensityAnalyzer()
+    @property
+    def analyzer(self):
+        # The VADER lexicon is read once per process, on first use
+        return registry.get('vader_analyzer')
 
     def analyze_text(self, text):
         sentiment_score = self.analyzer.polarity_scores(text)["compound"]
@@ -364,6 +381,60 @@ class VaderSentimentAnalyzer(SentimentAnalyzer):
         return {"sentiment": sentiment, "vader_score": sentiment_score}
 
 
+class AnalysisContext:
+    """
+    Per-document (per-request) memo of sentiment results.
+    Every consumer that analyzes the same text with the same analyzer shares one result,
+    and the number of real analyzer invocations is counted for instrumentation.
+    """
+
+    def __init__(self, sentiment_analyzers=None):
+        self.sentiment_analyzers = list(sentiment_analyzers or [TextBlobSentimentAnalyzer(), VaderSentimentAnalyzer()])
+        self.invocations = Counter()
+        self.lookups = Counter()
+        self._results = {}
+        # Per-keyword frequency/sentiment of the last extract_keywords run on this context
+        self.keywords = None
+
+    def analyze(self, analyzer, text):
+        """Returns analyzer.analyze_text(text), computing it at most once per context."""
+        name = get_class_name(analyzer)
+        key = (name, text)
+        self.lookups[name] += 1
+        if key not in self._results:
+            self.invocations[name] += 1
+            self._results[key] = analyzer.analyze_text(text)
+        return self._results[key]
+
+    def analyze_all(self, text):
+        """Returns the results of every analyzer for text, in analyzer order."""
+        return [self.analyze(analyzer, text) for analyzer in self.sentiment_analyzers]
+
+    def analyzer(self, analyzer_class):
+        for analyzer in self.sentiment_analyzers:
+            if isinstance(analyzer, analyzer_class):
+                return analyzer
+        analyzer = analyzer_class()
+        self.sentiment_analyzers.append(analyzer)
+        return analyzer
+
+    def document_polarity(self, text):
+        """TextBlob polarity (-1 to 1) of a whole document."""
+        return self.analyze(self.analyzer(TextBlobSentimentAnalyzer), text)["score"]
+
+    def document_vader_score(self, text):
+        """VADER compound score (-1 to 1) of a whole document."""
+        return self.analyze(self.analyzer(VaderSentimentAnalyzer), text)["vader_score"]
+
+    def report(self):
+        """Analyzer invocations vs. lookups, e.g. for logging at the end of a request."""
+        return {name: {"invocations": self.invocations[name], "lookups": self.lookups[name]}
+                for name in self.lookups}
+
+    def __repr__(self):
+        return f"AnalysisContext(invocations={dict(self.invocations)})"
+
+
 def main():
     url = "https://edition.cnn.com/2024/11/12/politics/trump-team-loyalists-analysis/index.html"
     keyword_extractor = KeywordExtractor()
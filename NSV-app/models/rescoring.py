@@ -0,0 +1,136 @@
+import logging
+import time
+
+import numpy as np
+from sqlalchemy import bindparam, select
+
+from article_features import FEATURE_COLUMNS, FEATURE_SCHEMA_VERSION, content_consistency, sentiment_subjectivity
+from scoring_formula import WeightsStrategy
+from trust_weights import TRUST_COMPONENTS
+
+RESCORE_CHUNK_SIZE = 10000
+
+
+def score_components(components, weights):
+    """
+    Vectorized trust score and status for an (n, 4) array of TRUST_COMPONENTS (NaN = missing = 0).
+    """
+    trust_scores = WeightsStrategy(weights).calculate_batch(components)
+    statuses = np.where(trust_scores >= weights['verified_threshold'], 'verified', 'unverified')
+    return trust_scores, statuses
+
+
+def score_article(article, weights):
+    """
+    Scalar counterpart of score_components for one freshly analyzed article.
+    """
+    components = np.array([[getattr(article, key) if getattr(article, key) is not None else np.nan
+                            for key in TRUST_COMPONENTS]], dtype=np.float64)
+    trust_scores, statuses = score_components(components, weights)
+    return float(trust_scores[0]), str(statuses[0])
+
+
+def _differs(old, new):
+    """Element-wise: the new float values differ from the stored ones (NaN = NULL on both sides counts as equal)."""
+    return ~np.isclose(old, new, rtol=0.0, atol=1e-12, equal_nan=True)
+
+
+def _keyset_chunks(connection, query, key, chunk_size):
+    """Runs query chunk by chunk in key order (keyset pagination); key must be the first selected column."""
+    last = 0
+    while True:
+        rows = connection.execute(query.where(key > last).order_by(key).limit(chunk_size)).fetchall()
+        if not rows:
+            return
+        yield rows
+        last = rows[-1][0]
+
+
+def rescore_articles(connection, table, weights, chunk_size=RESCORE_CHUNK_SIZE, progress=None):
+    """
+    Recomputes trust_score/status of every row of the articles table with the given weights.
+    Rows are read in primary-key order chunk by chunk (keyset pagination), scored with NumPy and
+    written back with one executemany UPDATE per chunk; rows whose values do not change are skipped.
+    progress(scanned=..., updated=...) is called after every chunk. Returns {"scanned", "updated", "seconds"}.
+    """
+    start = time.perf_counter()
+    columns = [table.c[key] for key in TRUST_COMPONENTS]
+    update = (table.update()
+              .where(table.c.article_id == bindparam('b_article_id'))
+              .values(trust_score=bindparam('b_trust_score'), status=bindparam('b_status'),
+                      trust_weights_version=bindparam('b_version')))
+    scanned, updated = 0, 0
+    query = select(table.c.article_id, table.c.trust_score, table.c.status, table.c.trust_weights_version, *columns)
+    for rows in _keyset_chunks(connection, query, table.c.article_id, chunk_size):
+        ids = np.array([row[0] for row in rows], dtype=np.int64)
+        components = np.array([row[4:] for row in rows], dtype=np.float64)
+        trust_scores, statuses = score_components(components, weights)
+
+        old_scores = np.array([row[1] for row in rows], dtype=np.float64)
+        old_statuses = np.array([row[2] for row in rows], dtype=object)
+        old_versions = np.array([row[3] for row in rows], dtype=object)
+        changed = _differs(old_scores, trust_scores) | (old_statuses != statuses) \
+            | (old_versions != weights['version'])
+        if changed.any():
+            connection.execute(update, [
+                {'b_article_id': int(article_id), 'b_trust_score': float(score), 'b_status': str(status),
+                 'b_version': weights['version']}
+                for article_id, score, status in zip(ids[changed], trust_scores[changed], statuses[changed])
+            ])
+        scanned += len(rows)
+        updated += int(changed.sum())
+        if progress is not None:
+            progress(scanned=scanned, updated=updated)
+
+    seconds = time.perf_counter() - start
+    logging.info(f"Rescored {scanned} articles ({updated} changed) with trust weights v{weights['version']} in {seconds:.2f} seconds")
+    return {"scanned": scanned, "updated": updated, "seconds": round(seconds, 3)}
+
+
+def recompute_from_features(connection, articles, features, weights, chunk_size=RESCORE_CHUNK_SIZE):
+    """
+    Recomputes content_consistency, sentiment_subjectivity (where the keyword sentiment was stored)
+    and then trust_score/status of every article that has features of the current FEATURE_SCHEMA_VERSION,
+    from the article_features table alone: no scraping or NLP. Same chunking as rescore_articles, and
+    like it only rows whose values change are written. Returns {"scanned", "updated", "seconds"}.
+    """
+    start = time.perf_counter()
+    update = (articles.update()
+              .where(articles.c.article_id == bindparam('b_article_id'))
+              .values(content_consistency=bindparam('b_consistency'), sentiment_subjectivity=bindparam('b_subjectivity'),
+                      trust_score=bindparam('b_trust_score'), status=bindparam('b_status'),
+                      trust_weights_version=bindparam('b_version')))
+    query = (select(features.c.article_id, articles.c.ml_model_prediction, articles.c.source_credibility,
+                    articles.c.sentiment_subjectivity, articles.c.content_consistency, articles.c.trust_score,
+                    articles.c.status, articles.c.trust_weights_version, *[features.c[key] for key in FEATURE_COLUMNS])
+             .join_from(features, articles, features.c.article_id == articles.c.article_id)
+             .where(features.c.schema_version == FEATURE_SCHEMA_VERSION))
+    scanned, updated = 0, 0
+    for rows in _keyset_chunks(connection, query, features.c.article_id, chunk_size):
+        scores = np.array([row[1:6] for row in rows], dtype=np.float64)  # None -> NaN
+        matrix = np.array([row[8:] for row in rows], dtype=np.float64)
+        columns = {key: matrix[:, i] for i, key in enumerate(FEATURE_COLUMNS)}
+        consistency = content_consistency(columns)
+        subjectivity = sentiment_subjectivity(columns)
+        subjectivity = np.where(np.isnan(subjectivity), scores[:, 2], subjectivity)
+        trust_scores, statuses = score_components(
+            np.column_stack([scores[:, 0], scores[:, 1], subjectivity, consistency]), weights)
+
+        old_statuses = np.array([row[6] for row in rows], dtype=object)
+        old_versions = np.array([row[7] for row in rows], dtype=object)
+        changed = _differs(scores[:, 3], consistency) | _differs(scores[:, 2], subjectivity) \
+            | _differs(scores[:, 4], trust_scores) | (old_statuses != statuses) | (old_versions != weights['version'])
+        if changed.any():
+            connection.execute(update, [
+                {'b_article_id': int(rows[i][0]), 'b_consistency': float(consistency[i]),
+                 'b_subjectivity': None if np.isnan(subjectivity[i]) else float(subjectivity[i]),
+                 'b_trust_score': float(trust_scores[i]), 'b_status': str(statuses[i]), 'b_version': weights['version']}
+                for i in np.flatnonzero(changed)
+            ])
+        scanned += len(rows)
+        updated += int(changed.sum())
+
+    seconds = time.perf_counter() - start
+    logging.info(f"Recomputed {scanned} articles ({updated} changed) from features v{FEATURE_SCHEMA_VERSION} "
+                 f"in {seconds:.2f} seconds")
+    return {"scanned": scanned, "updated": updated, "seconds": round(seconds, 3)}
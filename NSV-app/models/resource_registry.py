@@ -0,0 +1,115 @@
+import logging
+import threading
+import time
+
+
+class ResourceRegistry:
+    """
+    Process-wide registry of heavy assets (models, vectorizers, corpora, lexicons).
+    Assets are registered with a loader at import time, which is cheap, and loaded
+    on first use or in an explicit warmup phase. Load times are kept per asset.
+    """
+
+    def __init__(self):
+        self._loaders = {}
+        self._resources = {}
+        self._load_times = {}
+        self._locks = {}
+        self._lock = threading.Lock()
+
+    def register(self, name, loader):
+        """
+        Registers a zero-argument loader; re-registering an unloaded name replaces its loader.
+        """
+        with self._lock:
+            if name not in self._resources:
+                self._loaders[name] = loader
+                self._locks.setdefault(name, threading.Lock())
+
+    def get(self, name):
+        """
+        Returns the asset, loading it on first use. Concurrent first calls load it only once.
+        """
+        try:
+            return self._resources[name]
+        except KeyError:
+            pass
+        if name not in self._loaders:
+            raise KeyError(f"Resource '{name}' is not registered.")
+        with self._locks[name]:
+            if name not in self._resources:
+                start = time.perf_counter()
+                resource = self._loaders[name]()
+                self._load_times[name] = time.perf_counter() - start
+                self._resources[name] = resource
+                logging.info(f"Loaded resource {name} in {self._load_times[name]:.4f} seconds")
+        return self._resources[name]
+
+    def set(self, name, resource):
+        """
+        Replaces a loaded asset (e.g. after a model swap).
+        """
+        with self._lock:
+            self._locks.setdefault(name, threading.Lock())
+            self._resources[name] = resource
+
+    def unload(self, name):
+        """
+        Drops a loaded asset; the next get() loads it again.
+        """
+        with self._lock:
+            self._resources.pop(name, None)
+
+    def is_loaded(self, name):
+        return name in self._resources
+
+    def names(self):
+        return list(self._loaders)
+
+    def warmup(self, names=None):
+        """
+        Loads the given assets (all registered ones by default) and returns the load report.
+        """
+        for name in names or self.names():
+            self.get(name)
+        return self.report()
+
+    def report(self):
+        """
+        Per-asset load state and load time in seconds.
+        """
+        return {
+            name: {"loaded": name in self._resources, "seconds": round(self._load_times.get(name, 0.0), 4)}
+            for name in self._loaders
+        }
+
+
+def load_nltk_data(path, package):
+    """
+    Makes sure an NLTK data package is available, downloading it only if it is missing.
+    Only ever called from a loader, so importing a module never hits the network.
+    """
+    import nltk
+    try:
+        nltk.data.find(path)
+    except LookupError:
+        nltk.download(package, quiet=True)
+
+
+def _load_stopwords():
+    load_nltk_data('corpora/stopwords', 'stopwords')
+    from nltk.corpus import stopwords
+    return set(stopwords.words('english'))
+
+
+def _load_lemmatizer():
+    load_nltk_data('corpora/wordnet', 'wordnet')
+    from nltk.stem import WordNetLemmatizer
+    lemmatizer = WordNetLemmatizer()
+    lemmatizer.lemmatize('warmup')  # WordNet itself is read lazily by NLTK on the first call
+    return lemmatizer
+
+
+registry = ResourceRegistry()
+registry.register('stopwords_en', _load_stopwords)
+registry.register('wordnet_lemmatizer', _load_lemmatizer)
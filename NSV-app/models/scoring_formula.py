@@ -0,0 +1,73 @@
+from abc import ABC, abstractmethod
+
+import numpy as np
+
+from trust_weights import TRUST_COMPONENTS
+
+
+def component_columns(components):
+    """
+    Columnar trust components as four float64 arrays in TRUST_COMPONENTS order. Accepts a mapping of
+    component name -> sequence (e.g. a dict of NumPy arrays or a DataFrame) or an (n, 4) array.
+    Missing values (None/NaN) count as 0, as in the scrape endpoint.
+    """
+    if hasattr(components, 'keys'):
+        columns = [np.asarray(components[key], dtype=np.float64) for key in TRUST_COMPONENTS]
+    else:
+        matrix = np.asarray(components, dtype=np.float64)
+        if matrix.ndim != 2 or matrix.shape[1] != len(TRUST_COMPONENTS):
+            raise ValueError(f"Expected an (n, {len(TRUST_COMPONENTS)}) array of trust components.")
+        columns = list(matrix.T)
+    return tuple(np.nan_to_num(column, nan=0.0) for column in columns)
+
+
+class FormulaStrategy(ABC):
+    """
+    Base of scoring strategies: a subclass writes its formula once, in formula(), using arithmetic
+    and NumPy ufuncs only, and gets a scalar evaluation (score) for one article / TrustScore and a
+    vectorized one (calculate_batch) for columnar component arrays. A strategy without a formula
+    cannot be instantiated.
+    """
+
+    @abstractmethod
+    def formula(self, ml_model_prediction, source_credibility, sentiment_subjectivity, content_consistency):
+        """The trust score from the four components (scalars or equally shaped arrays)."""
+
+    def score(self, item):
+        """Evaluates the formula on the component attributes of one object."""
+        return float(self.formula(*(getattr(item, key) for key in TRUST_COMPONENTS)))
+
+    def calculate_batch(self, components):
+        """Trust scores for columnar components (see component_columns), as a float64 array."""
+        columns = component_columns(components)
+        return np.broadcast_to(np.asarray(self.formula(*columns), dtype=np.float64), columns[0].shape).copy()
+
+
+class LinearFormulaStrategy(FormulaStrategy):
+    """
+    Formula strategy for weighted sums: WEIGHTS maps each component to its weight. Batches given as
+    an (n, 4) array are scored with a single matrix-vector product.
+    """
+    WEIGHTS = {}
+
+    def weight_vector(self):
+        return np.array([self.WEIGHTS.get(key, 0.0) for key in TRUST_COMPONENTS], dtype=np.float64)
+
+    def formula(self, ml_model_prediction, source_credibility, sentiment_subjectivity, content_consistency):
+        values = (ml_model_prediction, source_credibility, sentiment_subjectivity, content_consistency)
+        return sum(weight * value for weight, value in zip(self.weight_vector(), values))
+
+    def calculate_batch(self, components):
+        if hasattr(components, 'keys'):
+            return super().calculate_batch(components)
+        matrix = np.nan_to_num(np.asarray(components, dtype=np.float64), nan=0.0)
+        if matrix.ndim != 2 or matrix.shape[1] != len(TRUST_COMPONENTS):
+            raise ValueError(f"Expected an (n, {len(TRUST_COMPONENTS)}) array of trust components.")
+        return matrix @ self.weight_vector()
+
+
+class WeightsStrategy(LinearFormulaStrategy):
+    """Linear strategy over a stored trust weights version (see trust_weights)."""
+
+    def __init__(self, weights):
+        self.WEIGHTS = {key: float(weights[key]) for key in TRUST_COMPONENTS}
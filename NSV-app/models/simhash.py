@@ -0,0 +1,114 @@
+import hashlib
+import re
+import threading
+from array import array
+
+FINGERPRINT_BITS = 64
+SHINGLE_SIZE = 3
+TOKEN_PATTERN = re.compile(r'\w+')
+MASK = (1 << FINGERPRINT_BITS) - 1
+
+
+def _feature_hash(feature):
+    return int.from_bytes(hashlib.blake2b(feature.encode('utf-8'), digest_size=8).digest(), 'big')
+
+
+def simhash(text, shingle_size=SHINGLE_SIZE):
+    """
+    64-bit SimHash of a text over its word shingles: near-identical texts get fingerprints a few bits apart.
+    """
+    tokens = TOKEN_PATTERN.findall(text.lower())
+    if len(tokens) < shingle_size:
+        shingles = [' '.join(tokens)] if tokens else []
+    else:
+        shingles = {' '.join(tokens[i:i + shingle_size]) for i in range(len(tokens) - shingle_size + 1)}
+    votes = [0] * FINGERPRINT_BITS
+    for shingle in shingles:
+        value = _feature_hash(shingle)
+        for bit in range(FINGERPRINT_BITS):
+            votes[bit] += 1 if value >> bit & 1 else -1
+    return sum(1 << bit for bit, vote in enumerate(votes) if vote > 0)
+
+
+def hamming(a, b):
+    return bin(a ^ b).count('1')
+
+
+def similarity(a, b):
+    """1.0 for identical fingerprints, down to 0.0 when every bit differs."""
+    return 1.0 - hamming(a, b) / FINGERPRINT_BITS
+
+
+def to_signed(fingerprint):
+    """Fingerprint as a signed 64-bit integer, for a BIGINT column."""
+    return fingerprint - (1 << FINGERPRINT_BITS) if fingerprint >> (FINGERPRINT_BITS - 1) else fingerprint
+
+
+def to_unsigned(value):
+    return value & MASK
+
+
+class SimHashIndex:
+    """
+    Near-duplicate lookup over SimHash fingerprints. The fingerprint is cut into max_distance + 1
+    blocks; two fingerprints within max_distance bits agree on at least one whole block (pigeonhole),
+    so only entries sharing a block value are compared. Fingerprints and ids are kept in flat arrays
+    (16 bytes per entry) and each block table maps a block value to an array of entry positions.
+    Inserts are incremental; removals are tombstones.
+    """
+
+    def __init__(self, min_similarity=0.95):
+        self.max_distance = int((1.0 - min_similarity) * FINGERPRINT_BITS + 1e-9)
+        blocks = self.max_distance + 1
+        bounds = [round(i * FINGERPRINT_BITS / blocks) for i in range(blocks + 1)]
+        self.blocks = [(start, (1 << (end - start)) - 1) for start, end in zip(bounds, bounds[1:])]
+        self.tables = [{} for _ in self.blocks]
+        self.fingerprints = array('Q')
+        self.ids = array('q')
+        self.removed = set()
+        self.lock = threading.Lock()
+        self.primed = False
+
+    def __len__(self):
+        return len(self.ids) - len(self.removed)
+
+    def add(self, item_id, fingerprint):
+        with self.lock:
+            position = len(self.ids)
+            self.fingerprints.append(fingerprint)
+            self.ids.append(item_id)
+            self.removed.discard(item_id)
+            for table, (shift, mask) in zip(self.tables, self.blocks):
+                key = fingerprint >> shift & mask
+                positions = table.get(key)
+                if positions is None:
+                    table[key] = array('I', (position,))
+                else:
+                    positions.append(position)
+
+    def prime(self, items):
+        """Loads (item_id, fingerprint) pairs, e.g. streamed from the database at startup."""
+        for item_id, fingerprint in items:
+            self.add(item_id, fingerprint)
+        self.primed = True
+
+    def remove(self, item_id):
+        with self.lock:
+            self.removed.add(item_id)
+
+    def query(self, fingerprint):
+        """(item_id, similarity) of the closest indexed fingerprint within max_distance bits, or None."""
+        best, best_distance = None, self.max_distance + 1
+        with self.lock:
+            seen = set()
+            for table, (shift, mask) in zip(self.tables, self.blocks):
+                for position in table.get(fingerprint >> shift & mask, ()):
+                    if position in seen:
+                        continue
+                    seen.add(position)
+                    distance = hamming(fingerprint, self.fingerprints[position])
+                    if distance < best_distance and self.ids[position] not in self.removed:
+                        best, best_distance = self.ids[position], distance
+        if best is None:
+            return None
+        return best, 1.0 - best_distance / FINGERPRINT_BITS
@@ -0,0 +1,146 @@
+import importlib
+import logging
+import time
+from urllib.parse import urlsplit
+
+from sqlalchemy import delete, insert, select
+from sqlalchemy.exc import IntegrityError
+
+# Credibility of a domain we know nothing about, and how many articles' worth of weight that prior carries
+CREDIBILITY_PRIOR = 0.5
+CREDIBILITY_PRIOR_WEIGHT = 5
+REBUILD_CHUNK_SIZE = 10000
+# Welford accumulators per stat: (mean, M2) columns of the source_stats table
+STATS = {
+    'ml_model_prediction': ('ml_mean', 'ml_m2'),
+    'trust_score': ('trust_mean', 'trust_m2'),
+}
+
+
+def domain_of(url):
+    """Lowercased host of an URL without port and leading "www.", or None."""
+    if not url:
+        return None
+    host = urlsplit(url if '//' in url else f'//{url}').hostname
+    if not host:
+        return None
+    return host[4:] if host.startswith('www.') else host
+
+
+def contribution(url, ml_model_prediction, trust_score, status):
+    """What one article adds to its domain's stats: (domain, {stat: value}, is_unverified). Missing scores count as 0."""
+    values = {'ml_model_prediction': float(ml_model_prediction or 0.0), 'trust_score': float(trust_score or 0.0)}
+    return domain_of(url), values, status != 'verified'
+
+
+def empty_stats(domain):
+    stats = {'domain': domain, 'article_count': 0, 'unverified_count': 0}
+    for mean, m2 in STATS.values():
+        stats[mean] = stats[m2] = 0.0
+    return stats
+
+
+def apply(stats, values, unverified, sign):
+    """
+    Adds (sign=1) or removes (sign=-1) one article from a domain's stats in place (Welford's update and its inverse).
+    """
+    count = stats['article_count'] + sign
+    for key, (mean_key, m2_key) in STATS.items():
+        value, mean, m2 = values[key], stats[mean_key], stats[m2_key]
+        if count <= 0:
+            stats[mean_key] = stats[m2_key] = 0.0
+        elif sign > 0:
+            new_mean = mean + (value - mean) / count
+            stats[mean_key], stats[m2_key] = new_mean, m2 + (value - mean) * (value - new_mean)
+        else:
+            new_mean = (mean * (count + 1) - value) / count
+            stats[mean_key], stats[m2_key] = new_mean, max(0.0, m2 - (value - new_mean) * (value - mean))
+    stats['article_count'] = max(0, count)
+    stats['unverified_count'] = max(0, stats['unverified_count'] + sign * int(unverified))
+    return stats
+
+
+def variance(stats, key):
+    """Sample variance of a stat (None below two articles)."""
+    count = stats['article_count']
+    return stats[STATS[key][1]] / (count - 1) if count > 1 else None
+
+
+def credibility(stats):
+    """
+    source_credibility of a domain: its mean trust score times its verified ratio, shrunk towards
+    CREDIBILITY_PRIOR while the domain has few articles.
+    """
+    if not stats or not stats['article_count']:
+        return CREDIBILITY_PRIOR
+    count = stats['article_count']
+    observed = stats['trust_mean'] * (1 - stats['unverified_count'] / count)
+    return (count * observed + CREDIBILITY_PRIOR_WEIGHT * CREDIBILITY_PRIOR) / (count + CREDIBILITY_PRIOR_WEIGHT)
+
+
+def _insert_missing(connection, table, domain):
+    """
+    Inserts an empty row for domain unless one exists, without failing when a concurrent
+    transaction inserts it first (so the SELECT ... FOR UPDATE after it always has a row to lock).
+    """
+    row = empty_stats(domain)
+    if connection.dialect.name in ('postgresql', 'sqlite'):
+        dialect_insert = importlib.import_module(f'sqlalchemy.dialects.{connection.dialect.name}').insert
+        connection.execute(dialect_insert(table).values(**row).on_conflict_do_nothing(index_elements=['domain']))
+        return
+    try:
+        with connection.begin_nested():
+            connection.execute(insert(table).values(**row))
+    except IntegrityError:
+        pass
+
+
+def _load(connection, table, domain):
+    _insert_missing(connection, table, domain)
+    row = connection.execute(select(table).where(table.c.domain == domain).with_for_update()).mappings().one()
+    return {key: row[key] for key in empty_stats(domain)}
+
+
+def record_change(connection, table, before=None, after=None):
+    """
+    Moves one article's contribution in the source_stats table: before/after are contribution() tuples
+    (None for an insert/delete). Runs on the flushing connection, so it commits with the article.
+    """
+    changes = {}
+    for item, sign in ((before, -1), (after, 1)):
+        if item is None or item[0] is None:
+            continue
+        domain, values, unverified = item
+        if domain not in changes:
+            changes[domain] = _load(connection, table, domain)
+        apply(changes[domain], values, unverified, sign)
+    for domain, stats in changes.items():
+        connection.execute(table.update().where(table.c.domain == domain).values(**stats))
+
+
+def rebuild(connection, articles, table, chunk_size=REBUILD_CHUNK_SIZE):
+    """
+    Recomputes the whole source_stats table in one pass over the articles (keyset chunks). Returns {"articles", "domains", "seconds"}.
+    """
+    start = time.perf_counter()
+    domains, last_id, scanned = {}, 0, 0
+    query = select(articles.c.article_id, articles.c.url, articles.c.ml_model_prediction,
+                   articles.c.trust_score, articles.c.status)
+    while True:
+        rows = connection.execute(query.where(articles.c.article_id > last_id)
+                                  .order_by(articles.c.article_id).limit(chunk_size)).fetchall()
+        if not rows:
+            break
+        for row in rows:
+            domain, values, unverified = contribution(*row[1:])
+            if domain is not None:
+                apply(domains.setdefault(domain, empty_stats(domain)), values, unverified, 1)
+        scanned += len(rows)
+        last_id = rows[-1][0]
+
+    connection.execute(delete(table))
+    if domains:
+        connection.execute(insert(table), list(domains.values()))
+    seconds = time.perf_counter() - start
+    logging.info(f"Rebuilt source stats of {len(domains)} domains from {scanned} articles in {seconds:.2f} seconds")
+    return {"articles": scanned, "domains": len(domains), "seconds": round(seconds, 3)}
@@ -0,0 +1,190 @@
+"""
+Offline evaluation of trust score weights over the stored articles, without writing anything.
+
+Component scores (and current statuses) of every article are loaded into NumPy arrays once; all
+candidate weight vectors are then scored in one matrix product per block of candidates. For each
+candidate the report gives the score distribution, how many articles would flip verified <-> unverified
+against their stored status and, for articles that a community-noted tweet links to, the agreement
+of the verified status with the note (NOT_MISLEADING = trustworthy).
+
+Candidates: the weights in effect, the SimpleAverage/WeightedAverage strategies, a JSON file of
+weights dicts (--candidates) and/or a grid of weight vectors summing to 1 (--grid STEP).
+
+Usage: python NSV-app/models/strategy_eval.py --database-url postgresql://... [--grid 0.1]
+       [--candidates weights.json] [--top 20] [--output report.json]
+"""
+import argparse
+import itertools
+import json
+import os
+import re
+import sys
+import time
+
+import numpy as np
+from sqlalchemy import MetaData, create_engine, desc, select
+
+sys.path.insert(0, os.path.abspath(os.path.dirname(__file__)))
+from trust_weights import DEFAULT_TRUST_WEIGHTS, TRUST_COMPONENTS, TRUST_PARAMETERS
+
+# Elements of the (articles x candidates) score matrix computed at once
+SWEEP_BLOCK_ELEMENTS = 16_000_000
+QUANTILES = (0.1, 0.25, 0.5, 0.75, 0.9)
+NOTE_LABELS = {'NOT_MISLEADING': 1, 'MISINFORMED_OR_POTENTIALLY_MISLEADING': 0}
+URL_PATTERN = re.compile(r'https?://[^\s"\'<>)\]]+')
+
+
+def normalize_url(url):
+    """Scheme-, www- and trailing-slash-insensitive form of an URL, for matching tweets to articles."""
+    url = re.sub(r'^https?://(www\.)?', '', url.strip().lower())
+    return url.split('#')[0].rstrip('/.,;')
+
+
+def load_components(connection, articles):
+    """
+    article_ids, an (n, 4) float64 matrix of TRUST_COMPONENTS (missing = 0) and the stored statuses
+    (1 = verified) of every article.
+    """
+    rows = connection.execute(
+        select(articles.c.article_id, articles.c.url, articles.c.status, *[articles.c[key] for key in TRUST_COMPONENTS])
+        .order_by(articles.c.article_id)
+    ).fetchall()
+    article_ids = np.array([row[0] for row in rows], dtype=np.int64)
+    components = np.nan_to_num(np.array([row[3:] for row in rows], dtype=np.float64).reshape(-1, len(TRUST_COMPONENTS)))
+    verified = np.array([row[2] == 'verified' for row in rows], dtype=bool)
+    urls = {normalize_url(row[1]): i for i, row in enumerate(rows) if row[1]}
+    return article_ids, components, verified, urls
+
+
+def load_note_labels(connection, tweets, article_urls):
+    """
+    {article row index: label} from community-noted tweets whose content or note summary links to an article.
+    An article linked by tweets with conflicting notes is left out.
+    """
+    rows = connection.execute(
+        select(tweets.c.content, tweets.c.summary, tweets.c.classification)
+        .where(tweets.c.classification.in_(list(NOTE_LABELS)))
+    ).fetchall()
+    labels = {}
+    for content, summary, classification in rows:
+        for url in URL_PATTERN.findall(f'{content or ""} {summary or ""}'):
+            index = article_urls.get(normalize_url(url))
+            if index is not None:
+                labels.setdefault(index, set()).add(NOTE_LABELS[classification])
+    return {index: values.pop() for index, values in labels.items() if len(values) == 1}
+
+
+def weight_grid(step):
+    """Every weight vector with components in multiples of step that sums to 1."""
+    units = int(round(1 / step))
+    for split in itertools.product(range(units + 1), repeat=len(TRUST_COMPONENTS) - 1):
+        if sum(split) <= units:
+            yield dict(zip(TRUST_COMPONENTS, [value / units for value in split] + [(units - sum(split)) / units]))
+
+
+def sweep(components, candidates, verified, labels=None, block_elements=SWEEP_BLOCK_ELEMENTS):
+    """
+    Evaluates every candidate ({component weights..., verified_threshold}) on the (n, 4) components.
+    verified holds the stored statuses; labels maps row index -> community note label.
+    Returns one result dict per candidate, in order.
+    """
+    if not len(components):
+        raise ValueError("No articles to evaluate.")
+    weights = np.array([[candidate[key] for key in TRUST_COMPONENTS] for candidate in candidates], dtype=np.float64)
+    thresholds = np.array([candidate['verified_threshold'] for candidate in candidates], dtype=np.float64)
+    labelled = np.array(sorted(labels or {}), dtype=np.int64)
+    truth = np.array([labels[index] for index in labelled], dtype=bool)
+    block = max(1, block_elements // max(1, len(components)))
+
+    results = []
+    for start in range(0, len(candidates), block):
+        scores = components @ weights[start:start + block].T  # (n, block)
+        now_verified = scores >= thresholds[start:start + block]
+        quantiles = np.quantile(scores, QUANTILES, axis=0)
+        means, stds = scores.mean(axis=0), scores.std(axis=0)
+        to_verified = (now_verified & ~verified[:, None]).sum(axis=0)
+        to_unverified = (~now_verified & verified[:, None]).sum(axis=0)
+        agreement = (now_verified[labelled] == truth[:, None]).mean(axis=0) if len(labelled) else None
+        for j in range(scores.shape[1]):
+            results.append({
+                "weights": {key: float(weights[start + j, i]) for i, key in enumerate(TRUST_COMPONENTS)},
+                "verified_threshold": float(thresholds[start + j]),
+                "mean": float(means[j]),
+                "std": float(stds[j]),
+                "quantiles": {f"p{int(q * 100)}": float(quantiles[i, j]) for i, q in enumerate(QUANTILES)},
+                "verified": int(now_verified[:, j].sum()),
+                "flips_to_verified": int(to_verified[j]),
+                "flips_to_unverified": int(to_unverified[j]),
+                "note_agreement": float(agreement[j]) if agreement is not None else None,
+            })
+    return results
+
+
+def current_weights(connection, metadata):
+    """The newest trust_weights row, or the built-in defaults."""
+    if 'trust_weights' not in metadata.tables:
+        return dict(DEFAULT_TRUST_WEIGHTS)
+    table = metadata.tables['trust_weights']
+    row = connection.execute(select(table).order_by(desc(table.c.version)).limit(1)).mappings().first()
+    return {key: row[key] for key in ('version',) + TRUST_PARAMETERS} if row else dict(DEFAULT_TRUST_WEIGHTS)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--database-url', default=os.environ.get('DATABASE_URL'), required='DATABASE_URL' not in os.environ)
+    parser.add_argument('--candidates', help='JSON list of weights dicts (missing keys keep the current value)')
+    parser.add_argument('--grid', type=float, help='also sweep all weight vectors in steps of GRID summing to 1')
+    parser.add_argument('--threshold', type=float, nargs='+', help='verified thresholds for the grid (default: current)')
+    parser.add_argument('--top', type=int, default=20, help='print this many candidates, best note agreement first')
+    parser.add_argument('--output', help='write every result as JSON here')
+    args = parser.parse_args()
+
+    from ScoringStrategy_Article import SimpleAverageStrategy, WeightedAverageStrategy
+
+    start = time.perf_counter()
+    engine = create_engine(args.database_url)
+    metadata = MetaData()
+    metadata.reflect(engine, only=lambda name, _: name in ('articles', 'twitter_data', 'trust_weights'))
+    with engine.connect() as connection:
+        current = current_weights(connection, metadata)
+        _, components, verified, urls = load_components(connection, metadata.tables['articles'])
+        labels = load_note_labels(connection, metadata.tables['twitter_data'], urls) \
+            if 'twitter_data' in metadata.tables else {}
+    loaded = time.perf_counter()
+
+    threshold = current['verified_threshold']
+    candidates = [dict(current, name=f"current (v{current['version']})")]
+    for strategy in (SimpleAverageStrategy, WeightedAverageStrategy):
+        candidates.append(dict(strategy.WEIGHTS, verified_threshold=threshold, name=strategy.__name__))
+    if args.candidates:
+        with open(args.candidates, encoding='utf-8') as file:
+            candidates += [{**current, 'name': f'file[{i}]', **candidate} for i, candidate in enumerate(json.load(file))]
+    if args.grid:
+        for weights in weight_grid(args.grid):
+            for value in args.threshold or [threshold]:
+                candidates.append(dict(weights, verified_threshold=value, name='grid'))
+
+    results = sweep(components, candidates, verified, labels)
+    for candidate, result in zip(candidates, results):
+        result['name'] = candidate['name']
+    swept = time.perf_counter()
+
+    print(f'{len(components)} articles ({len(labels)} with community notes), {len(candidates)} candidates; '
+          f'load {loaded - start:.2f} s, sweep {swept - loaded:.2f} s')
+    ranked = sorted(results, key=lambda result: -(result['note_agreement'] or 0.0))
+    print(f'{"candidate":<28} {"weights ml/src/sent/cons":<26} {"thr":>5} {"mean":>6} {"p50":>6} '
+          f'{"verified":>9} {"+ver":>7} {"-ver":>7} {"notes":>6}')
+    for result in results[:3] + [result for result in ranked if result['name'] == 'grid' or
+                                 result['name'].startswith('file')][:args.top]:
+        weights = '/'.join(f'{result["weights"][key]:.2f}' for key in TRUST_COMPONENTS)
+        agreement = f'{result["note_agreement"]:.3f}' if result['note_agreement'] is not None else '-'
+        print(f'{result["name"]:<28} {weights:<26} {result["verified_threshold"]:>5.2f} {result["mean"]:>6.3f} '
+              f'{result["quantiles"]["p50"]:>6.3f} {result["verified"]:>9} {result["flips_to_verified"]:>7} '
+              f'{result["flips_to_unverified"]:>7} {agreement:>6}')
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as file:
+            json.dump(results, file, indent=2)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,37 @@
+"""
+Text cleaning shared by training (model_prep/preprocessing.py) and serving (MLModel, TextEncoder),
+so the model always sees text cleaned the same way it was trained on.
+"""
+import re
+
+# Reuters articles start with a "CITY (Reuters) - " dateline; only the text after it is kept
+DATELINE = r"(?<=\(Reuters\)\s\-\s).*"
+_DATELINE = re.compile(DATELINE)
+_NOT_LETTER = re.compile(r'[^a-z]')
+
+
+def load_stopwords():
+    """NLTK English stopwords, as a set."""
+    from nltk.corpus import stopwords
+    return frozenset(stopwords.words('english'))
+
+
+def extract_body(text):
+    """
+    Drops everything up to the "(Reuters) - " dateline; a text without one is kept as it is.
+    """
+    match = _DATELINE.search(text)
+    return match.group(0) if match else text
+
+
+def clean_text(text, stop):
+    """
+    Lowercase, drop whitespace-separated tokens found in the stop set, single-space the rest,
+    then map every non a-z character to a space ("U.S." -> "u s").
+    """
+    return _NOT_LETTER.sub(' ', ' '.join(word for word in text.lower().split() if word not in stop))
+
+
+def clean_article(title, text, stop):
+    """The cleaned model input of one article: its title and its body after the dateline."""
+    return clean_text(f'{title} {extract_body(text)}', stop)
@@ -0,0 +1,81 @@
+import json
+import os
+import re
+import sys
+from itertools import chain
+
+import numpy as np
+
+sys.path.insert(0, os.path.abspath(os.path.dirname(__file__)))
+from text_cleaning import clean_article
+
+# text_cleaning.clean_text maps every non a-z character to a space before fitting,
+# so the vocabulary is exactly the runs of a-z
+_TOKEN = re.compile(r'[a-z]+')
+
+
+def pad_sequences(sequences, maxlen: int):
+    """
+    NumPy equivalent of the Keras pad_sequences defaults (pre-padding, pre-truncating, int32).
+    Rows are placed with one scatter instead of a Python loop over positions.
+    """
+    sequences = [sequence[-maxlen:] if maxlen else [] for sequence in sequences]
+    lengths = np.fromiter(map(len, sequences), dtype=np.int64, count=len(sequences))
+    padded = np.zeros((len(sequences), maxlen), dtype=np.int32)
+    total = int(lengths.sum())
+    if total:
+        values = np.fromiter(chain.from_iterable(sequences), dtype=np.int32, count=total)
+        rows = np.repeat(np.arange(len(sequences)), lengths)
+        starts = np.repeat(np.cumsum(lengths) - lengths, lengths)
+        columns = maxlen - np.repeat(lengths, lengths) + (np.arange(total) - starts)
+        padded[rows, columns] = values
+    return padded
+
+
+class TextEncoder:
+    """
+    Text -> padded int32 token ids with the vocabulary fitted in model_creation.py.
+    Reproduces Keras Tokenizer.texts_to_sequences for num_words (unknown and rare words are
+    dropped, no OOV token) without importing Keras. The training stopwords are stored with the
+    vocabulary, so clean() needs no NLTK at serving time.
+    """
+
+    def __init__(self, word_index: dict, num_words: int, stopwords=()):
+        self.num_words = num_words
+        # Only ids below num_words are ever emitted, so the rest of the vocabulary is not kept
+        self.word_index = {word: index for word, index in word_index.items() if index < num_words}
+        self.stopwords = frozenset(stopwords)
+
+    @classmethod
+    def load(cls, path: str):
+        """
+        Loads the {"num_words": ..., "word_index": {...}, "stopwords": [...]} artifact written by save().
+        """
+        with open(path, encoding='utf-8') as file:
+            data = json.load(file)
+        return cls(data['word_index'], data['num_words'], data.get('stopwords', ()))
+
+    def save(self, path: str):
+        with open(path, 'w', encoding='utf-8') as file:
+            json.dump({"num_words": self.num_words, "word_index": self.word_index,
+                       "stopwords": sorted(self.stopwords)}, file, separators=(',', ':'))
+
+    def clean(self, text: str, title: str = ''):
+        """
+        Raw article text -> the cleaned text the model was trained on (see text_cleaning.clean_article).
+        """
+        return clean_article(title, text, self.stopwords)
+
+    def texts_to_sequences(self, texts):
+        # texts are already cleaned (training frames, or clean() at serving time)
+        index = self.word_index
+        return [[index[word] for word in _TOKEN.findall(text.lower()) if word in index] for text in texts]
+
+    def encode(self, texts, maxlen: int):
+        """
+        Encodes a batch of texts into an (n, maxlen) int32 array ready for the model.
+        """
+        return pad_sequences(self.texts_to_sequences(texts), maxlen)
+
+    def __len__(self):
+        return len(self.word_index)
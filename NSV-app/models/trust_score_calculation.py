@@ -1,7 +1,8 @@
 import logging
-from abc import ABC, abstractmethod
+from abc import ABC
 from functools import wraps
 from aop_wrapper import Aspect
+from scoring_formula import FormulaStrategy, LinearFormulaStrategy
 
 class TrustScore:
     """Class to calculate the trustworthiness of a news article based on various metrics."""
@@ -33,39 +34,36 @@ class TrustScore:
             else "Trust Score not calculated"
         )
 
-class ScoringStrategy(ABC):
-    """Abstract base class for scoring strategy."""
-
-    @abstractmethod
-    def calculate(self, trust_score):
-        pass
-
-class SimpleAverageStrategy(ScoringStrategy):
-    """Strategy for calculating score as a simple average."""
+class ScoringStrategy(FormulaStrategy, ABC):
+    """
+    Abstract base class for scoring strategy. Subclasses declare formula() once and get
+    calculate (one TrustScore) and calculate_batch (columnar arrays) from it.
+    """
 
     @Aspect.log_execution
     @Aspect.measure_time
     @Aspect.handle_exceptions
     def calculate(self, trust_score):
-        # Calculate the simple average of the metrics
-        return (
-            (trust_score.ml_model_prediction +
-             trust_score.source_credibility +
-             trust_score.sentiment_subjectivity +
-             trust_score.content_consistency) / 4
-        )
-
-class WeightedAverageStrategy(ScoringStrategy):
-    """Strategy for calculating score as a weighted average."""
+        return self.score(trust_score)
 
-    @Aspect.log_execution
     @Aspect.measure_time
-    @Aspect.handle_exceptions
-    def calculate(self, trust_score):
-        # Calculate the weighted average based on predefined weights
-        return (
-            (0.6 * trust_score.ml_model_prediction +
-             0.2 * trust_score.source_credibility +
-             0.1 * trust_score.sentiment_subjectivity +
-             0.1 * trust_score.content_consistency)
-        )
+    def calculate_batch(self, components):
+        return super().calculate_batch(components)
+
+class SimpleAverageStrategy(ScoringStrategy, LinearFormulaStrategy):
+    """Strategy for calculating score as a simple average."""
+    WEIGHTS = {
+        'ml_model_prediction': 0.25,
+        'source_credibility': 0.25,
+        'sentiment_subjectivity': 0.25,
+        'content_consistency': 0.25,
+    }
+
+class WeightedAverageStrategy(ScoringStrategy, LinearFormulaStrategy):
+    """Strategy for calculating score as a weighted average."""
+    WEIGHTS = {
+        'ml_model_prediction': 0.6,
+        'source_credibility': 0.2,
+        'sentiment_subjectivity': 0.1,
+        'content_consistency': 0.1,
+    }
@@ -0,0 +1,36 @@
+# Article columns that make up the trust score, in weight-vector order
+TRUST_COMPONENTS = ('ml_model_prediction', 'source_credibility', 'sentiment_subjectivity', 'content_consistency')
+# Everything a weights version stores: one weight per component plus the verified/unverified cut-off
+TRUST_PARAMETERS = TRUST_COMPONENTS + ('verified_threshold',)
+
+# Version 0: the formula the scrape endpoint always used (0.5 ml + 0.3 sentiment + 0.2 consistency)
+DEFAULT_TRUST_WEIGHTS = {
+    'version': 0,
+    'ml_model_prediction': 0.5,
+    'source_credibility': 0.0,
+    'sentiment_subjectivity': 0.3,
+    'content_consistency': 0.2,
+    'verified_threshold': 0.6,
+}
+
+
+def validate_trust_weights(parameters, base=None):
+    """
+    Checks a weights update: known keys only, numeric, non-negative weights with a positive sum,
+    threshold in [0, 1]. Missing keys keep their value in base (the defaults if not given).
+    Returns the complete weights dict, without a version.
+    """
+    unknown = set(parameters) - set(TRUST_PARAMETERS)
+    if unknown:
+        raise ValueError(f"Unknown trust score parameters: {', '.join(sorted(unknown))}.")
+    base = base or DEFAULT_TRUST_WEIGHTS
+    weights = {key: float(base[key]) for key in TRUST_PARAMETERS}
+    for key, value in parameters.items():
+        if isinstance(value, bool) or not isinstance(value, (int, float)):
+            raise ValueError(f"Trust score parameter {key} must be a number.")
+        weights[key] = float(value)
+    if any(weights[key] < 0 for key in TRUST_COMPONENTS) or sum(weights[key] for key in TRUST_COMPONENTS) <= 0:
+        raise ValueError("Trust score weights must be non-negative and not all zero.")
+    if not 0.0 <= weights['verified_threshold'] <= 1.0:
+        raise ValueError("verified_threshold must be between 0 and 1.")
+    return weights
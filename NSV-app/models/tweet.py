@@ -7,13 +7,17 @@ import os
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 from models.tweepy_api import TweepyScraper
 from models.community_notes import get_tweet_info_from_notes
+from models.http_cache import conditional_json, payload_etag
+from models.compression import ResponseCompression
 import logging
 import mop
 
 app = Flask(__name__)
+ResponseCompression(app)
 
 app.config['SQLALCHEMY_DATABASE_URI'] = 'xxxxx'
 app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
+app.config['CACHE_CONTROL'] = os.environ.get('NSV_CACHE_CONTROL', 'public, max-age=60')
 
 
 
@@ -125,8 +129,9 @@ tweepy_scraper = TweepyScraper(BEARER_TOKEN)
 @app.route('/tweets', methods=['GET'])
 def get_all_tweets():
     """Get all tweets."""
-    tweets = Tweet.query.all()
-    return jsonify([tweet.to_dict() for tweet in tweets]), 200
+    # twitter_data has no updated_at column, so the validator is hashed from the payload itself
+    payload = [tweet.to_dict() for tweet in Tweet.query.all()]
+    return conditional_json(lambda: payload, payload_etag(payload))
 
 def retrieve_tweet_by_id(tweet_id):
     """Retrieve a tweet by its ID from the database."""
@@ -144,7 +149,8 @@ def get_tweet(tweet_id):
     """Retrieve a single tweet by its ID."""
     try:
         tweet = validate_tweet_existence(tweet_id)
-        return jsonify(tweet.to_dict()), 200
+        payload = tweet.to_dict()
+        return conditional_json(lambda: payload, payload_etag(payload))
     except ValueError as e:
         return jsonify({"error": str(e)}), 404
 
@@ -0,0 +1,74 @@
+import logging
+import threading
+import time
+
+
+class WarmupRunner:
+    """
+    Runs named warmup steps (load and exercise every model and analyzer) and tracks readiness.
+    A worker reports ready only after every step succeeded, so load balancers can hold traffic
+    back until the first real request no longer pays for loading.
+    """
+
+    def __init__(self):
+        self._steps = []
+        self._lock = threading.Lock()
+        self._thread = None
+        self.ready = False
+        self.running = False
+        self.error = None
+        self.step_times = {}
+
+    def add_step(self, name, step):
+        """
+        Registers a zero-argument callable; steps run in registration order.
+        """
+        self._steps.append((name, step))
+
+    def run(self):
+        """
+        Runs every step synchronously. A failing step leaves the worker not ready.
+        """
+        with self._lock:
+            if self.ready or self.running:
+                return self.ready
+            self.running = True
+            self.error = None
+        try:
+            for name, step in self._steps:
+                start = time.perf_counter()
+                step()
+                self.step_times[name] = round(time.perf_counter() - start, 4)
+                logging.info(f"Warmup step {name} took {self.step_times[name]:.4f} seconds")
+            self.ready = True
+        except Exception as e:
+            self.error = f"{type(e).__name__}: {e}"
+            logging.error(f"Warmup failed: {self.error}")
+        finally:
+            self.running = False
+        return self.ready
+
+    def skip(self):
+        """
+        Reports ready without running the steps: everything then loads on first use.
+        """
+        self.ready = True
+
+    def start_background(self):
+        """
+        Runs the warmup in a daemon thread and returns immediately.
+        """
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive():
+                return self._thread
+            self._thread = threading.Thread(target=self.run, name="warmup", daemon=True)
+            self._thread.start()
+            return self._thread
+
+    def status(self):
+        return {
+            "ready": self.ready,
+            "running": self.running,
+            "error": self.error,
+            "steps": {name: self.step_times.get(name) for name, _ in self._steps},
+        }
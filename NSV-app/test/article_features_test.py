@@ -0,0 +1,62 @@
+import unittest
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from models.article_features import consistency_features, content_consistency, sentiment_subjectivity
+from models.lexicon_matcher import LexiconMatches
+
+
+def legacy_consistency(matches, content, polarity):
+    # check_consistency before the feature store
+    score = 0.3 if matches.has_misinformation_terms else 0.9
+    if matches.has_reputable_sources:
+        score += 0.1
+    if len(content) < 500:
+        score -= 0.1
+    counts = {}
+    for word in content.lower().split():
+        counts[word] = counts.get(word, 0) + 1
+    if any(count > 5 for count in counts.values()):
+        score -= 0.1
+    sentiment = 0.4 if polarity < -0.5 else 1.0 if polarity > 0.5 else 0.8
+    return max(0.0, min((score + sentiment) / 2.0, 1.0))
+
+
+class TestArticleFeatures(unittest.TestCase):
+
+    def setUp(self):
+        self.cases = [
+            (LexiconMatches({}, {}), "short text", 0.1),
+            (LexiconMatches({"hoax": 2}, {"reuters": 1}), "claim " * 6 + "x" * 600, -0.7),
+            (LexiconMatches({}, {"bbc": 3}), "a b c " * 200, 0.9),
+        ]
+
+    def test_consistency_matches_legacy_formula(self):
+        for matches, content, polarity in self.cases:
+            features = consistency_features(matches, content, polarity)
+            self.assertAlmostEqual(float(content_consistency(features)),
+                                   legacy_consistency(matches, content, polarity), places=12)
+
+    def test_columns_match_scalars(self):
+        rows = [consistency_features(*case) for case in self.cases]
+        columns = {key: [row[key] for row in rows] for key in rows[0]}
+        expected = [float(content_consistency(row)) for row in rows]
+        self.assertEqual(list(content_consistency(columns)), expected)
+
+    def test_corroboration_bonus(self):
+        matches, content, polarity = self.cases[0]
+        unchecked = float(content_consistency(consistency_features(matches, content, polarity)))
+        weak = float(content_consistency(consistency_features(matches, content, polarity, corroboration=0.1)))
+        strong = float(content_consistency(consistency_features(matches, content, polarity, corroboration=0.8)))
+        self.assertEqual(unchecked, weak)
+        self.assertAlmostEqual(strong - unchecked, 0.05)
+
+    def test_subjectivity_needs_keyword_sentiment(self):
+        features = consistency_features(*self.cases[0])
+        self.assertTrue(sentiment_subjectivity(features) != sentiment_subjectivity(features))  # NaN
+        features['keyword_sentiment'] = 1.0
+        self.assertAlmostEqual(float(sentiment_subjectivity(features)), 0.3 + 0.7 * 0.55)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -63,7 +63,8 @@ import uuid
 
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
-from models.article import Article, app
+from sqlalchemy import event
+from models.article import Article, app, db
 
 import time
 unique_url = f"https://example.com/{int(time.time())}"
@@ -133,6 +134,25 @@ class FlaskAppTestCase(unittest.TestCase):
         # Assert the article's title matches the title we expect
         self.assertEqual(data['title'], articles[0]['title'])
 
+    def test_get_article_miss_loads_row_in_one_query(self):
+        """A 200 for a single article costs the validator query plus one full-row query."""
+        articles = self.client.get('/articles').get_json()
+        self.assertGreater(len(articles), 0, "No articles found.")
+        db.session.expire_all()
+        statements = []
+
+        def count(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        event.listen(db.engine, 'before_cursor_execute', count)
+        try:
+            response = self.client.get(f"/articles/{articles[0]['article_id']}")
+        finally:
+            event.remove(db.engine, 'before_cursor_execute', count)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.get_json()['content'], articles[0]['content'])
+        self.assertEqual(len(statements), 2, statements)
+
     def test_update_article(self):
         """Test updating an article."""
 
@@ -0,0 +1,58 @@
+import unittest
+import threading
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from models.background_job import BackgroundJob
+
+
+class TestBackgroundJob(unittest.TestCase):
+
+    def test_reports_progress_and_result(self):
+        def job(progress):
+            for scanned in (10, 20):
+                progress(scanned=scanned)
+            return {"scanned": 20}
+
+        runner = BackgroundJob('test-job', job)
+        self.assertTrue(runner.start())
+        runner.join(5)
+        status = runner.status()
+        self.assertFalse(status["running"])
+        self.assertEqual(status["progress"], {"scanned": 20})
+        self.assertEqual(status["result"], {"scanned": 20})
+        self.assertEqual(status["runs"], 1)
+
+    def test_start_while_running_reruns_once(self):
+        release = threading.Event()
+        calls = []
+
+        def job(progress):
+            calls.append(len(calls))
+            if len(calls) == 1:
+                release.wait(5)
+            return {"run": len(calls)}
+
+        runner = BackgroundJob('test-job', job)
+        self.assertTrue(runner.start())
+        self.assertFalse(runner.start())
+        self.assertFalse(runner.start())
+        self.assertTrue(runner.status()["queued"])
+        release.set()
+        runner.join(5)
+        self.assertEqual(len(calls), 2)
+        self.assertEqual(runner.status()["result"], {"run": 2})
+
+    def test_failure_is_reported(self):
+        def job(progress):
+            raise RuntimeError("database gone")
+
+        runner = BackgroundJob('test-job', job)
+        runner.start()
+        runner.join(5)
+        self.assertEqual(runner.status()["error"], "RuntimeError: database gone")
+        self.assertFalse(runner.status()["running"])
+
+
+if __name__ == '__main__':
+    unittest.main()
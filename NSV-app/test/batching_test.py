@@ -0,0 +1,62 @@
+import unittest
+import os
+import sys
+import threading
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from models.batching import MicroBatcher
+
+
+class TestMicroBatcher(unittest.TestCase):
+
+    def test_results_follow_submission_order(self):
+        batcher = MicroBatcher(lambda items: [item * 2 for item in items], max_batch_size=8, max_wait_ms=20)
+        futures = [batcher.submit(i) for i in range(20)]
+        self.assertEqual([future.result(timeout=5) for future in futures], [i * 2 for i in range(20)])
+        batcher.close()
+
+    def test_concurrent_callers_share_batches(self):
+        batch_sizes = []
+
+        def predict_batch(items):
+            batch_sizes.append(len(items))
+            return items
+
+        batcher = MicroBatcher(predict_batch, max_batch_size=16, max_wait_ms=50)
+        barrier = threading.Barrier(16)
+
+        def call(value):
+            barrier.wait()
+            self.assertEqual(batcher.predict(value, timeout=5), value)
+
+        threads = [threading.Thread(target=call, args=(i,)) for i in range(16)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        batcher.close()
+
+        self.assertEqual(sum(batch_sizes), 16)
+        self.assertLess(len(batch_sizes), 16)
+        self.assertLessEqual(max(batch_sizes), 16)
+
+    def test_errors_reach_every_caller(self):
+        def predict_batch(items):
+            raise RuntimeError("model failure")
+
+        batcher = MicroBatcher(predict_batch, max_batch_size=4, max_wait_ms=10)
+        futures = [batcher.submit(i) for i in range(3)]
+        for future in futures:
+            with self.assertRaises(RuntimeError):
+                future.result(timeout=5)
+        batcher.close()
+
+    def test_submit_after_close_raises(self):
+        batcher = MicroBatcher(lambda items: items, max_batch_size=4, max_wait_ms=10)
+        batcher.close()
+        batcher.close()
+        with self.assertRaises(RuntimeError):
+            batcher.submit(1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,45 @@
+import unittest
+import os
+import sys
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from models.cascade import CascadeClassifier
+
+
+class TestCascadeClassifier(unittest.TestCase):
+
+    def setUp(self):
+        self.expensive_calls = []
+
+        def expensive(texts):
+            self.expensive_calls.append(list(texts))
+            return [0.9 for _ in texts]
+
+        cheap_scores = {"sure-fake": 0.05, "unsure": 0.45, "sure-real": 0.95}
+        self.cascade = CascadeClassifier(
+            lambda texts: {"probabilities": [cheap_scores[text] for text in texts], "version": "v1"},
+            expensive, low=0.3, high=0.7)
+
+    def test_only_uncertain_texts_are_escalated(self):
+        result = self.cascade.predict(["sure-fake", "unsure", "sure-real"])
+        self.assertEqual(self.expensive_calls, [["unsure"]])
+        self.assertEqual(result["escalated"], [False, True, False])
+        self.assertEqual(result["probabilities"], [0.05, 0.9, 0.95])
+        self.assertEqual(result["labels"], [0, 1, 1])
+        self.assertEqual(result["version"], "v1")
+
+    def test_confident_batch_skips_expensive_model(self):
+        self.cascade.predict(["sure-fake", "sure-real"])
+        self.assertEqual(self.expensive_calls, [])
+
+    def test_escalation_fraction(self):
+        self.cascade.predict(["sure-fake", "unsure"])
+        self.cascade.predict(["unsure", "sure-real"])
+        self.assertEqual(self.cascade.stats()["escalation_fraction"], 0.5)
+
+    def test_invalid_band(self):
+        with self.assertRaises(ValueError):
+            CascadeClassifier(None, None, low=0.8, high=0.2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,44 @@
+import unittest
+import zlib
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from models.compression import brotli, brotli_compressor, compress_chunks, gzip_compressor
+
+CHUNKS = [b'{"articles": [', b'{"id": 1, "title": "first"},', b'', b'{"id": 2, "title": "second"}', b']}']
+
+
+class TestCompressChunks(unittest.TestCase):
+
+    def check_streams(self, factory, decompressor):
+        consumed = []
+
+        def body():
+            for chunk in CHUNKS:
+                consumed.append(chunk)
+                yield chunk
+
+        received = b''
+        for data in compress_chunks(body(), *factory()):
+            # Everything read from the body so far is already decodable by the client
+            received += decompressor.process(data)
+            self.assertEqual(received, b''.join(consumed))
+        self.assertEqual(len(consumed), len(CHUNKS))
+        self.assertEqual(received, b''.join(CHUNKS))
+
+    def test_gzip_flushes_every_chunk(self):
+        class Gunzip:
+            decoder = zlib.decompressobj(31)
+
+            def process(self, data):
+                return self.decoder.decompress(data)
+
+        self.check_streams(lambda: gzip_compressor(6), Gunzip())
+
+    @unittest.skipIf(brotli is None, "brotli is not installed")
+    def test_brotli_flushes_every_chunk(self):
+        self.check_streams(lambda: brotli_compressor(4), brotli.Decompressor())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,61 @@
+import unittest
+import sys
+import os
+from datetime import date, timedelta
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'models')))
+from corroboration import CorroborationIndex, is_reputable
+
+RATE_DECISION = ("The central bank raised its benchmark interest rate by a quarter point, citing persistent "
+                 "inflation in services and a tight labour market. Officials signalled further increases.")
+FLOODS = ("Heavy rain caused severe floods across the northern region, forcing thousands of residents "
+          "to leave their homes as rivers burst their banks overnight.")
+ELECTION = ("Voters head to the polls on Sunday in a parliamentary election expected to be closely fought "
+            "between the governing coalition and the opposition alliance.")
+
+
+class TestCorroborationIndex(unittest.TestCase):
+
+    def setUp(self):
+        self.today = date(2025, 3, 10)
+        self.index = CorroborationIndex(window_days=3, retention_days=30)
+        self.index.prime([
+            (1, "reuters.com", RATE_DECISION, self.today),
+            (2, "bbc.co.uk", FLOODS, self.today - timedelta(days=1)),
+            (3, "apnews.com", ELECTION, self.today),
+            (4, "bbc.co.uk", RATE_DECISION, self.today - timedelta(days=10)),
+        ])
+
+    def test_finds_similar_article_from_other_domain(self):
+        text = "Central bank raised the benchmark interest rate again as inflation in services stays persistent."
+        results = self.index.query(text, self.today, k=2, exclude_domain="example.com")
+        self.assertEqual(results[0][0], 1)
+        self.assertGreater(results[0][1], 0.3)
+        self.assertTrue(all(similarity <= results[0][1] for _, similarity in results))
+
+    def test_window_and_domain_filters(self):
+        # article 4 has the same text but is outside the window; article 1 is from the excluded domain
+        results = self.index.query(RATE_DECISION, self.today, exclude_domain="reuters.com")
+        self.assertNotIn(4, [article_id for article_id, _ in results])
+        self.assertNotIn(1, [article_id for article_id, _ in results])
+
+    def test_old_shards_are_dropped(self):
+        self.index.add(5, "npr.org", FLOODS, self.today + timedelta(days=25))
+        self.assertEqual(len(self.index), 4)  # article 4's day left the 30 day retention
+        self.assertEqual(self.index.query(RATE_DECISION, self.today - timedelta(days=10)), [])
+
+    def test_future_dates_do_not_evict_real_shards(self):
+        index = CorroborationIndex(window_days=3, retention_days=30)
+        today = date.today()
+        index.add(1, "reuters.com", RATE_DECISION, today - timedelta(days=5))
+        index.add(2, "bbc.co.uk", FLOODS, today + timedelta(days=3650))
+        self.assertEqual(len(index), 2)
+        self.assertEqual(index.query(RATE_DECISION, today - timedelta(days=5))[0][0], 1)
+
+    def test_is_reputable(self):
+        self.assertTrue(is_reputable("bbc.co.uk", {"bbc"}))
+        self.assertFalse(is_reputable("notbbc.com", {"bbc"}))
+        self.assertFalse(is_reputable(None, {"bbc"}))
+
+
+if __name__ == '__main__':
+    unittest.main()
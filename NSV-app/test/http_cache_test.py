@@ -0,0 +1,40 @@
+import unittest
+import sys
+import os
+from datetime import datetime
+from flask import Flask
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from models.http_cache import collection_etag, conditional_json
+
+
+class TestHttpCache(unittest.TestCase):
+
+    def setUp(self):
+        self.rows = [{"id": 1}, {"id": 2}]
+        self.updated_at = datetime(2025, 3, 10, 12, 0, 0)
+        app = Flask(__name__)
+
+        @app.route('/rows')
+        def rows():
+            etag = collection_etag(len(self.rows), max(row["id"] for row in self.rows), self.updated_at)
+            return conditional_json(lambda: self.rows, etag)
+
+        self.client = app.test_client()
+
+    def test_delete_changes_collection_etag(self):
+        etag = self.client.get('/rows').headers['ETag']
+        self.assertEqual(self.client.get('/rows', headers={'If-None-Match': etag}).status_code, 304)
+        self.rows.pop(0)  # max id and max updated_at are unchanged
+        response = self.client.get('/rows', headers={'If-None-Match': etag})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.get_json(), [{"id": 2}])
+
+    def test_collection_ignores_if_modified_since(self):
+        response = self.client.get('/rows')
+        self.assertNotIn('Last-Modified', response.headers)
+        response = self.client.get('/rows', headers={'If-Modified-Since': 'Tue, 10 Mar 2099 12:00:00 GMT'})
+        self.assertEqual(response.status_code, 200)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,33 @@
+import unittest
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from models.keyword_index import keyword_rows, page_arguments, query_terms, MAX_PER_PAGE
+
+
+class TestKeywordIndex(unittest.TestCase):
+
+    def test_query_terms_normalized(self):
+        self.assertEqual(query_terms("Climate  change, the CLIMATE summit", {"the"}), ["climate", "change", "summit"])
+        self.assertEqual(query_terms(None), [])
+
+    def test_keyword_rows_keep_most_frequent(self):
+        keywords = {
+            "rain": {"frequency": 2, "vader_score": -0.1, "sentiment": "Negative"},
+            "flood": {"frequency": 5, "vader_score": -0.4, "sentiment": "Negative"},
+            "x" * 150: {"frequency": 9, "vader_score": 0.0, "sentiment": "Neutral"},
+        }
+        rows = keyword_rows(7, keywords, limit=2)
+        self.assertEqual([row["keyword"] for row in rows], ["flood", "rain"])  # too long for the column: skipped
+        self.assertEqual(rows[0]["article_id"], 7)
+        self.assertEqual(rows[0]["frequency"], 5)
+
+    def test_page_arguments(self):
+        self.assertEqual(page_arguments({}), (1, 20))
+        self.assertEqual(page_arguments({"page": "0", "per_page": "1000"}), (1, MAX_PER_PAGE))
+        with self.assertRaises(ValueError):
+            page_arguments({"page": "two"})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,49 @@
+import unittest
+import json
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from models.latest_cache import LatestArticlesCache
+
+
+def make_article(article_id):
+    return {"article_id": article_id, "title": f"Article {article_id}"}
+
+
+class TestLatestArticlesCache(unittest.TestCase):
+
+    def setUp(self):
+        self.cache = LatestArticlesCache(size=3)
+        self.cache.prime([make_article(3), make_article(2), make_article(1)])
+
+    def test_prime_keeps_newest_first(self):
+        body, _ = self.cache.snapshot()
+        ids = [article["article_id"] for article in json.loads(body)]
+        self.assertTrue(self.cache.primed)
+        self.assertEqual(ids, [3, 2, 1])
+
+    def test_push_evicts_oldest_and_changes_etag(self):
+        _, old_etag = self.cache.snapshot()
+        self.cache.push(make_article(4))
+        body, new_etag = self.cache.snapshot()
+        ids = [article["article_id"] for article in json.loads(body)]
+        self.assertEqual(ids, [4, 3, 2])
+        self.assertNotEqual(old_etag, new_etag)
+
+    def test_snapshot_is_stable_without_changes(self):
+        self.assertEqual(self.cache.snapshot(), self.cache.snapshot())
+
+    def test_update_replaces_in_place(self):
+        self.cache.update({"article_id": 2, "title": "Edited"})
+        articles = json.loads(self.cache.snapshot()[0])
+        self.assertEqual(articles[1]["title"], "Edited")
+
+    def test_remove_requires_refill(self):
+        self.cache.remove(2)
+        ids = [article["article_id"] for article in json.loads(self.cache.snapshot()[0])]
+        self.assertEqual(ids, [3, 1])
+        self.assertFalse(self.cache.primed)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,73 @@
+import unittest
+import json
+import os
+import sys
+import tempfile
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from models.lexicon_matcher import AhoCorasick, Lexicon, LexiconMatcher, normalize_text, tokenize
+
+
+class TestAhoCorasick(unittest.TestCase):
+
+    def test_counts_overlapping_phrases(self):
+        automaton = AhoCorasick([
+            ("fake", ("fake",)),
+            ("fake news", ("fake", "news")),
+            ("news", ("news",)),
+        ])
+        counts = automaton.count(tokenize("Fake news is fake; the news is real."))
+        self.assertEqual(counts["fake"], 2)
+        self.assertEqual(counts["fake news"], 1)
+        self.assertEqual(counts["news"], 2)
+
+    def test_failure_links_recover_partial_matches(self):
+        automaton = AhoCorasick([("a b c", ("a", "b", "c")), ("b d", ("b", "d"))])
+        counts = automaton.count(["a", "b", "d", "a", "b", "c"])
+        self.assertEqual(counts["b d"], 1)
+        self.assertEqual(counts["a b c"], 1)
+
+
+class TestLexiconMatcher(unittest.TestCase):
+
+    def setUp(self):
+        self.matcher = LexiconMatcher()
+
+    def test_word_boundaries(self):
+        # "rau" used to match inside "Bureau" with substring checks
+        matches = self.matcher.scan("Bureau report", "The restaurant opened yesterday.")
+        self.assertFalse(matches.has_misinformation_terms)
+
+    def test_hit_counts_per_term(self):
+        matches = self.matcher.scan("Fake claims", "A fake story, a scam and another scam.")
+        self.assertEqual(matches.misinformation_hits, {"fake": 2, "scam": 2})
+
+    def test_diacritics_are_normalized(self):
+        self.assertEqual(normalize_text("Neadevărat"), "neadevarat")
+        matches = self.matcher.scan("Știre", "Este o informație neadevărată sau neadevărat?")
+        self.assertEqual(matches.misinformation_hits, {"neadevarat": 1})
+
+    def test_reputable_sources(self):
+        matches = self.matcher.scan("Title", "According to Reuters and www.bbc.co.uk, the vote passed.")
+        self.assertEqual(matches.source_hits, {"reuters": 1, "bbc": 1})
+
+    def test_large_lexicon(self):
+        terms = [f"term{i}" for i in range(5000)]
+        matcher = LexiconMatcher(Lexicon(misinformation_terms=terms, reputable_sources=[]))
+        matches = matcher.scan("term42 and term4999 but not term50000")
+        self.assertEqual(matches.misinformation_hits, {"term42": 1, "term4999": 1})
+
+    def test_load_lexicon_from_file(self):
+        with tempfile.NamedTemporaryFile("w", suffix=".json", delete=False, encoding="utf-8") as file:
+            json.dump({"misinformation_terms": ["hoax", "fake news"]}, file)
+        try:
+            lexicon = Lexicon.load(file.name)
+        finally:
+            os.remove(file.name)
+        self.assertEqual(lexicon.misinformation_terms, ["hoax", "fake news"])
+        self.assertIn("reuters", lexicon.reputable_sources)
+        matches = LexiconMatcher(lexicon).scan("This fake news is a hoax")
+        self.assertEqual(matches.misinformation_hits, {"fake news": 1, "hoax": 1})
+
+
+if __name__ == '__main__':
+    unittest.main()
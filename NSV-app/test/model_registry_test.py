@@ -0,0 +1,62 @@
+import unittest
+import os
+import sys
+import tempfile
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from models.model_registry import ModelRegistry, publish, set_current
+
+
+def read_artifact(directory):
+    with open(os.path.join(directory, 'model.txt'), encoding='utf-8') as file:
+        return file.read()
+
+
+class TestModelRegistry(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.root = os.path.join(self.tmp.name, 'versions')
+        for version in ('v1', 'v2'):
+            artifact = os.path.join(self.tmp.name, 'model.txt')
+            with open(artifact, 'w', encoding='utf-8') as file:
+                file.write(f'weights-{version}')
+            publish(self.root, version, [artifact])
+        set_current(self.root, 'v1')
+        self.registry = ModelRegistry(self.root, read_artifact)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_loads_current_version(self):
+        active = self.registry.current()
+        self.assertEqual(active.version, 'v1')
+        self.assertEqual(active.bundle, 'weights-v1')
+
+    def test_swap_keeps_in_flight_reference(self):
+        in_flight = self.registry.current()
+        set_current(self.root, 'v2')
+        self.registry.poll()
+        self.assertEqual(in_flight.bundle, 'weights-v1')
+        self.assertEqual(self.registry.current().bundle, 'weights-v2')
+
+    def test_background_activation(self):
+        self.registry.current()
+        self.registry.activate('v2').join(timeout=5)
+        self.assertEqual(self.registry.version, 'v2')
+
+    def test_checksum_mismatch_keeps_old_version(self):
+        self.registry.current()
+        with open(os.path.join(self.root, 'v2', 'model.txt'), 'a', encoding='utf-8') as file:
+            file.write('tampered')
+        self.assertIsNone(self.registry.activate('v2', background=False))
+        self.assertEqual(self.registry.version, 'v1')
+        self.assertIn('sha256', self.registry.last_error)
+
+    def test_fallback_without_published_version(self):
+        registry = ModelRegistry(os.path.join(self.tmp.name, 'empty'), read_artifact,
+                                 fallback=('unversioned', lambda: 'legacy'))
+        self.assertEqual(registry.current(), ('unversioned', 'legacy'))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,6 +1,7 @@
 import unittest
 from unittest.mock import patch, Mock
-from models.nlp_analyzer import KeywordExtractor, TextBlobSentimentAnalyzer, VaderSentimentAnalyzer, ArticleParser, Monitor
+from models.nlp_analyzer import KeywordExtractor, TextBlobSentimentAnalyzer, VaderSentimentAnalyzer, ArticleParser, Monitor, AnalysisContext, SentimentAnalyzer
+from models.nlp_analyzer import registry
 import logging
 
 # Setting up logging
@@ -107,5 +108,43 @@ class TestMain(unittest.TestCase):
         with self.assertRaises(ValueError):
             self.keyword_extractor.extract_keywords("")
 
+class CountingAnalyzer(SentimentAnalyzer):
+    def __init__(self):
+        self.calls = 0
+
+    def analyze_text(self, text):
+        self.calls += 1
+        return {"sentiment": "Positive", "vader_score": 0.5, "score": 0.5}
+
+
+class TestAnalysisContext(unittest.TestCase):
+    def setUp(self):
+        # A fixed stop-word set, so the test neither loads nor downloads the NLTK corpus
+        self.previous_stopwords = registry.get('stopwords_en') if registry.is_loaded('stopwords_en') else None
+        registry.set('stopwords_en', frozenset({"a", "an", "the", "is", "and"}))
+        self.analyzer = CountingAnalyzer()
+        self.keyword_extractor = KeywordExtractor([self.analyzer])
+
+    def tearDown(self):
+        if self.previous_stopwords is None:
+            registry.unload('stopwords_en')
+        else:
+            registry.set('stopwords_en', self.previous_stopwords)
+
+    def test_sentence_analyzed_once_for_all_words(self):
+        context = self.keyword_extractor.new_context()
+        self.keyword_extractor.extract_keywords("Python language rocks. Python data science wins.", context)
+        self.assertEqual(self.analyzer.calls, 2)
+        self.assertEqual(context.invocations["CountingAnalyzer"], 2)
+
+    def test_results_shared_between_consumers(self):
+        context = AnalysisContext([self.analyzer])
+        first = context.analyze(self.analyzer, "Same document.")
+        second = context.analyze(self.analyzer, "Same document.")
+        self.assertIs(first, second)
+        self.assertEqual(self.analyzer.calls, 1)
+        self.assertEqual(context.report()["CountingAnalyzer"], {"invocations": 1, "lookups": 2})
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,57 @@
+import unittest
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'models')))
+from sqlalchemy import Column, Float, Integer, MetaData, String, Table, create_engine, insert, select
+from article_features import FEATURE_COLUMNS, FEATURE_SCHEMA_VERSION
+from rescoring import recompute_from_features, rescore_articles
+from trust_weights import DEFAULT_TRUST_WEIGHTS
+
+
+class TestRescoring(unittest.TestCase):
+
+    def setUp(self):
+        metadata = MetaData()
+        self.articles = Table('articles', metadata, Column('article_id', Integer, primary_key=True),
+                              Column('ml_model_prediction', Float), Column('source_credibility', Float),
+                              Column('sentiment_subjectivity', Float), Column('content_consistency', Float),
+                              Column('trust_score', Float), Column('status', String),
+                              Column('trust_weights_version', Integer))
+        self.features = Table('article_features', metadata, Column('article_id', Integer, primary_key=True),
+                              Column('schema_version', Integer),
+                              *[Column(key, Float) for key in FEATURE_COLUMNS])
+        self.engine = create_engine('sqlite://')
+        metadata.create_all(self.engine)
+        with self.engine.begin() as connection:
+            connection.execute(insert(self.articles), [
+                {'article_id': i, 'ml_model_prediction': 0.2 * i, 'source_credibility': 0.5} for i in range(1, 4)])
+            connection.execute(insert(self.features), [
+                dict({key: 1.0 for key in FEATURE_COLUMNS}, article_id=i, schema_version=FEATURE_SCHEMA_VERSION,
+                     content_length=100.0 * i, sentiment_polarity=0.1 * i, keyword_sentiment=None if i == 2 else 0.5,
+                     corroboration=None)
+                for i in range(1, 4)])
+
+    def recompute(self):
+        with self.engine.begin() as connection:
+            return recompute_from_features(connection, self.articles, self.features, DEFAULT_TRUST_WEIGHTS)
+
+    def test_recompute_writes_only_changed_rows(self):
+        self.assertEqual(self.recompute()['updated'], 3)
+        result = self.recompute()
+        self.assertEqual(result['scanned'], 3)
+        self.assertEqual(result['updated'], 0)
+        with self.engine.begin() as connection:
+            connection.execute(self.features.update().where(self.features.c.article_id == 1).values(misinformation_hits=0.0))
+        self.assertEqual(self.recompute()['updated'], 1)
+
+    def test_rescore_after_recompute_changes_nothing(self):
+        self.recompute()
+        with self.engine.begin() as connection:
+            result = rescore_articles(connection, self.articles, DEFAULT_TRUST_WEIGHTS)
+            statuses = connection.execute(select(self.articles.c.status)).scalars().all()
+        self.assertEqual(result['updated'], 0)
+        self.assertTrue(all(status in ('verified', 'unverified') for status in statuses))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,53 @@
+import unittest
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from models.simhash import SimHashIndex, hamming, simhash, to_signed, to_unsigned
+
+WIRE_STORY = (
+    "The central bank raised its benchmark interest rate by a quarter point on Wednesday, citing "
+    "persistent inflation in services and a labour market that remains tight despite slowing growth. "
+    "Officials signalled that further increases were possible if price pressures did not ease, while "
+    "noting that the full effect of earlier moves had yet to be felt across the economy. Markets had "
+    "largely expected the decision, and bond yields were little changed after the announcement. "
+    "The governor told reporters that the committee had discussed a larger move but judged that a "
+    "gradual approach would limit the risk to employment. Two members voted to keep rates on hold, "
+    "arguing that lending to households and small firms had already fallen sharply this year. The "
+    "bank also published new forecasts showing inflation returning to its two percent target only "
+    "in the second half of next year, later than it had projected three months ago. Analysts said "
+    "the statement left the door open to a pause at the next meeting if wage growth cooled."
+)
+
+
+class TestSimHash(unittest.TestCase):
+
+    def test_near_duplicate_is_close(self):
+        copy = WIRE_STORY.replace("on Wednesday", "on Wednesday, officials said")
+        other = "A new species of frog was discovered in the rainforest by a team of biologists this spring."
+        self.assertLessEqual(hamming(simhash(WIRE_STORY), simhash(copy)), 3)
+        self.assertGreater(hamming(simhash(WIRE_STORY), simhash(other)), 3)
+
+    def test_signed_round_trip(self):
+        fingerprint = (1 << 63) | 12345
+        self.assertLess(to_signed(fingerprint), 0)
+        self.assertEqual(to_unsigned(to_signed(fingerprint)), fingerprint)
+
+    def test_index_finds_within_distance(self):
+        index = SimHashIndex(min_similarity=0.95)
+        self.assertEqual(index.max_distance, 3)
+        base = simhash(WIRE_STORY)
+        index.prime([(1, base), (2, base ^ 0xFFFF)])
+        self.assertTrue(index.primed)
+
+        match = index.query(base ^ 0b101)  # 2 bits apart
+        self.assertEqual(match[0], 1)
+        self.assertAlmostEqual(match[1], 1 - 2 / 64)
+        self.assertIsNone(index.query(base ^ 0xFF00FF))
+
+        index.remove(1)
+        self.assertIsNone(index.query(base))
+        self.assertEqual(len(index), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
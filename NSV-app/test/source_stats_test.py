@@ -0,0 +1,79 @@
+import unittest
+import statistics
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from models import source_stats
+
+
+class TestSourceStats(unittest.TestCase):
+
+    def setUp(self):
+        self.articles = [
+            ("https://www.reuters.com/a", 1, 0.8, "verified"),
+            ("https://reuters.com/b", 0, 0.3, "unverified"),
+            ("http://reuters.com:443/c", 1, 0.7, "verified"),
+            ("https://www.reuters.com/d", 1, 0.9, "verified"),
+        ]
+
+    def build(self, articles):
+        stats = source_stats.empty_stats("reuters.com")
+        for article in articles:
+            domain, values, unverified = source_stats.contribution(*article)
+            self.assertEqual(domain, "reuters.com")
+            source_stats.apply(stats, values, unverified, 1)
+        return stats
+
+    def test_incremental_matches_batch(self):
+        stats = self.build(self.articles)
+        trust = [article[2] for article in self.articles]
+        self.assertEqual(stats["article_count"], 4)
+        self.assertEqual(stats["unverified_count"], 1)
+        self.assertAlmostEqual(stats["trust_mean"], statistics.mean(trust))
+        self.assertAlmostEqual(source_stats.variance(stats, "trust_score"), statistics.variance(trust))
+
+    def test_remove_undoes_add(self):
+        stats = self.build(self.articles)
+        _, values, unverified = source_stats.contribution(*self.articles[1])
+        source_stats.apply(stats, values, unverified, -1)
+        expected = self.build([article for i, article in enumerate(self.articles) if i != 1])
+        for key in expected:
+            if key != "domain":
+                self.assertAlmostEqual(stats[key], expected[key])
+
+    def test_credibility_shrinks_towards_prior(self):
+        self.assertEqual(source_stats.credibility(None), source_stats.CREDIBILITY_PRIOR)
+        one = self.build(self.articles[:1])
+        many = self.build(self.articles[:1] * 50)
+        self.assertLess(abs(source_stats.credibility(one) - source_stats.CREDIBILITY_PRIOR),
+                        abs(source_stats.credibility(many) - source_stats.CREDIBILITY_PRIOR))
+        self.assertAlmostEqual(source_stats.credibility(many), (50 * 0.8 + 5 * 0.5) / 55)
+
+    def test_record_change_creates_missing_row(self):
+        from sqlalchemy import Column, Float, Integer, MetaData, String, Table, create_engine, insert, select
+        metadata = MetaData()
+        table = Table('source_stats', metadata, Column('domain', String, primary_key=True),
+                      *[Column(key, Integer if key.endswith('_count') else Float, nullable=False)
+                        for key in source_stats.empty_stats('') if key != 'domain'])
+        engine = create_engine('sqlite://')
+        metadata.create_all(engine)
+        added = [source_stats.contribution(*article) for article in self.articles]
+        with engine.begin() as connection:
+            # A row inserted concurrently before ours must not make the insert fail
+            connection.execute(insert(table).values(**source_stats.empty_stats('reuters.com')))
+            for contribution in added[:2]:
+                source_stats.record_change(connection, table, after=contribution)
+            source_stats.record_change(connection, table, after=source_stats.contribution("https://bbc.co.uk/a", 1, 0.5, "verified"))
+            rows = {row['domain']: dict(row) for row in connection.execute(select(table)).mappings()}
+        self.assertEqual(rows['reuters.com']['article_count'], 2)
+        self.assertEqual(rows['bbc.co.uk']['article_count'], 1)
+        self.assertAlmostEqual(rows['reuters.com']['trust_mean'], self.build(self.articles[:2])['trust_mean'])
+
+    def test_domain_of(self):
+        self.assertEqual(source_stats.domain_of("https://WWW.BBC.co.uk/news"), "bbc.co.uk")
+        self.assertEqual(source_stats.domain_of("bbc.co.uk"), "bbc.co.uk")
+        self.assertIsNone(source_stats.domain_of(""))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,48 @@
+import unittest
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+import numpy as np
+from models.strategy_eval import normalize_url, sweep, weight_grid
+
+
+class TestStrategyEval(unittest.TestCase):
+
+    def setUp(self):
+        # ml, source, sentiment, consistency
+        self.components = np.array([[1.0, 0.0, 0.5, 0.5], [0.0, 0.0, 0.5, 0.5], [1.0, 1.0, 1.0, 1.0]])
+        self.verified = np.array([True, True, False])
+
+    def test_grid_sums_to_one(self):
+        grid = list(weight_grid(0.5))
+        self.assertEqual(len(grid), 10)
+        for weights in grid:
+            self.assertAlmostEqual(sum(weights.values()), 1.0)
+
+    def test_sweep_matches_scalar_scoring(self):
+        candidates = [
+            {"ml_model_prediction": 1.0, "source_credibility": 0.0, "sentiment_subjectivity": 0.0,
+             "content_consistency": 0.0, "verified_threshold": 0.5},
+            {"ml_model_prediction": 0.0, "source_credibility": 0.0, "sentiment_subjectivity": 0.5,
+             "content_consistency": 0.5, "verified_threshold": 0.6},
+        ]
+        results = sweep(self.components, candidates, self.verified, labels={0: 1, 1: 0}, block_elements=3)
+        self.assertEqual(len(results), 2)
+
+        first, second = results
+        self.assertEqual(first["verified"], 2)
+        self.assertEqual(first["flips_to_verified"], 1)
+        self.assertEqual(first["flips_to_unverified"], 1)
+        self.assertEqual(first["note_agreement"], 1.0)
+        self.assertAlmostEqual(first["mean"], 2 / 3)
+
+        self.assertEqual(second["verified"], 1)
+        self.assertEqual(second["flips_to_unverified"], 2)
+        self.assertEqual(second["note_agreement"], 0.5)
+
+    def test_normalize_url(self):
+        self.assertEqual(normalize_url("https://www.Example.com/news/a/"), normalize_url("http://example.com/news/a"))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,65 @@
+import unittest
+import os
+import sys
+import tempfile
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', 'model_prep')))
+from models.text_encoder import TextEncoder, pad_sequences
+
+RAW_ARTICLES = [
+    "WASHINGTON (Reuters) - The U.S. Senate isn't voting on the fake-news bill, officials said.",
+    "Fake   NEWS: the election was\tstolen!! Don't believe it's over",
+    "no dateline here, just the news about an election",
+]
+
+
+class TestTextEncoder(unittest.TestCase):
+
+    def setUp(self):
+        self.encoder = TextEncoder({"news": 1, "fake": 2, "election": 3, "rare": 7}, num_words=5)
+
+    def test_pad_sequences_matches_keras_defaults(self):
+        padded = pad_sequences([[1, 2], [3, 4, 5, 6], []], maxlen=3)
+        self.assertEqual(padded.dtype.name, "int32")
+        self.assertEqual(padded.tolist(), [[0, 1, 2], [4, 5, 6], [0, 0, 0]])
+
+    def test_encode_drops_unknown_and_rare_words(self):
+        encoded = self.encoder.encode(["Fake NEWS about the election!", "rare words only"], maxlen=4)
+        self.assertEqual(encoded.tolist(), [[0, 2, 1, 3], [0, 0, 0, 0]])
+
+    def test_punctuation_splits_words_like_training(self):
+        self.assertEqual(self.encoder.texts_to_sequences(["fake-news"]), [[2, 1]])
+
+    def test_save_and_load_round_trip(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "tokenizer_vocab.json")
+            self.encoder.save(path)
+            loaded = TextEncoder.load(path)
+        self.assertEqual(loaded.num_words, 5)
+        self.assertEqual(loaded.word_index, {"news": 1, "fake": 2, "election": 3})
+
+    def test_stopwords_round_trip(self):
+        encoder = TextEncoder({"news": 1}, num_words=5, stopwords={"the", "a"})
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "tokenizer_vocab.json")
+            encoder.save(path)
+            self.assertEqual(TextEncoder.load(path).stopwords, {"the", "a"})
+
+    def test_serving_matches_training_token_ids(self):
+        import pandas as pd
+        from preprocessing import preprocess
+
+        stop = {"the", "a", "an", "on", "was", "it's", "don't", "isn't", "just", "about", "s", "t"}
+        frame = pd.DataFrame({"title": [""] * len(RAW_ARTICLES), "text": RAW_ARTICLES, "target": "FAKE"})
+        training_texts = list(preprocess(frame, stop)["final_news"])
+        word_index = {word: index for index, word in enumerate(sorted({w for t in training_texts for w in t.split()}), 1)}
+        encoder = TextEncoder(word_index, num_words=100, stopwords=stop)
+
+        served = encoder.texts_to_sequences([encoder.clean(text) for text in RAW_ARTICLES])
+        self.assertEqual(served, encoder.texts_to_sequences(training_texts))
+        self.assertNotIn(word_index.get("washington"), served[0])  # dateline dropped
+        self.assertIn(word_index["s"], served[0])  # "U.S." -> "u s" after stopword removal, as in training
+
+
+if __name__ == '__main__':
+    unittest.main()
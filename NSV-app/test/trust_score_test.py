@@ -1,5 +1,5 @@
 import unittest
-from ..models.trust_score_calculation import TrustScore, SimpleAverageStrategy, WeightedAverageStrategy
+from ..models.trust_score_calculation import TrustScore, ScoringStrategy, SimpleAverageStrategy, WeightedAverageStrategy
 
 class TestTrustScore(unittest.TestCase):
 
@@ -40,6 +40,49 @@ class TestTrustScore(unittest.TestCase):
         result = trust_score.display_score()
         self.assertEqual(result, "Calculated Trust Score: 47.67")
 
+    def test_calculate_batch_matches_scalar(self):
+        rows = [(0.7, 80, 50, 60), (0.1, 0.2, 0.3, 0.4), (1.0, 0.0, 0.5, 0.25)]
+        columns = {
+            "ml_model_prediction": [row[0] for row in rows],
+            "source_credibility": [row[1] for row in rows],
+            "sentiment_subjectivity": [row[2] for row in rows],
+            "content_consistency": [row[3] for row in rows],
+        }
+        for strategy in (SimpleAverageStrategy(), WeightedAverageStrategy()):
+            expected = []
+            for row in rows:
+                trust_score = TrustScore(strategy)
+                (trust_score.ml_model_prediction, trust_score.source_credibility,
+                 trust_score.sentiment_subjectivity, trust_score.content_consistency) = row
+                expected.append(trust_score.calculate_score())
+
+            for scores in (strategy.calculate_batch(rows), strategy.calculate_batch(columns)):
+                self.assertEqual(len(scores), len(rows))
+                for score, expected_score in zip(scores, expected):
+                    self.assertAlmostEqual(score, expected_score, places=6)
+
+    def test_custom_formula_strategy(self):
+        class DifferenceStrategy(ScoringStrategy):
+            def formula(self, ml_model_prediction, source_credibility, sentiment_subjectivity, content_consistency):
+                return content_consistency - sentiment_subjectivity
+
+        trust_score = TrustScore(DifferenceStrategy())
+        trust_score.sentiment_subjectivity = 0.25
+        trust_score.content_consistency = 0.75
+        self.assertAlmostEqual(trust_score.calculate_score(), 0.5)
+        scores = DifferenceStrategy().calculate_batch([[0.0, 0.0, 0.25, 0.75], [0.0, 0.0, 0.5, float('nan')]])
+        self.assertAlmostEqual(scores[0], 0.5)
+        self.assertAlmostEqual(scores[1], -0.5)
+
+    def test_strategy_without_formula_cannot_be_instantiated(self):
+        class IncompleteStrategy(ScoringStrategy):
+            pass
+
+        with self.assertRaises(TypeError):
+            ScoringStrategy()
+        with self.assertRaises(TypeError):
+            IncompleteStrategy()
+
 
 if __name__ == '__main__':
     unittest.main()
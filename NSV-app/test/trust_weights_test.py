@@ -0,0 +1,33 @@
+import unittest
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from models.trust_weights import DEFAULT_TRUST_WEIGHTS, TRUST_PARAMETERS, validate_trust_weights
+
+
+class TestValidateTrustWeights(unittest.TestCase):
+
+    def test_merges_over_base(self):
+        weights = validate_trust_weights({"source_credibility": 0.1}, base=DEFAULT_TRUST_WEIGHTS)
+        self.assertEqual(set(weights), set(TRUST_PARAMETERS))
+        self.assertEqual(weights["source_credibility"], 0.1)
+        self.assertEqual(weights["ml_model_prediction"], DEFAULT_TRUST_WEIGHTS["ml_model_prediction"])
+
+    def test_rejects_unknown_parameter(self):
+        with self.assertRaises(ValueError):
+            validate_trust_weights({"weight_factor": 1.2}, base=DEFAULT_TRUST_WEIGHTS)
+
+    def test_rejects_negative_weight_and_bad_threshold(self):
+        with self.assertRaises(ValueError):
+            validate_trust_weights({"content_consistency": -0.2}, base=DEFAULT_TRUST_WEIGHTS)
+        with self.assertRaises(ValueError):
+            validate_trust_weights({"verified_threshold": 1.5}, base=DEFAULT_TRUST_WEIGHTS)
+
+    def test_rejects_all_zero_weights(self):
+        zeros = {key: 0 for key in TRUST_PARAMETERS if key != "verified_threshold"}
+        with self.assertRaises(ValueError):
+            validate_trust_weights(zeros, base=DEFAULT_TRUST_WEIGHTS)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -149,6 +149,23 @@ class TestGetTweetById(unittest.TestCase):
         self.assertEqual(data['tweet_id'], '1786492191503753256')
         self.assertEqual(data['content'], 'A message from President Shafik. https://t.co/zd8i2DE4wp')
 
+    @patch('models.tweet.Tweet.query')
+    def test_get_tweet_revalidation_returns_304(self, mock_query):
+        """A repeat read with the returned ETag is answered with 304 and no body."""
+        mock_tweet = Tweet(id=1, url="https://x.com/i/web/status/1", content="Cached tweet",
+                           author_name="Author", author_username="author", tweet_id="1",
+                           tweet_created_at=datetime(2024, 5, 3, 20, 25, 4))
+        mock_query.get.return_value = mock_tweet
+
+        first = self.client.get('/tweets/1')
+        self.assertEqual(first.status_code, 200)
+        self.assertIn('Cache-Control', first.headers)
+        etag = first.headers['ETag']
+
+        second = self.client.get('/tweets/1', headers={'If-None-Match': etag})
+        self.assertEqual(second.status_code, 304)
+        self.assertEqual(second.data, b'')
+
 
 class TestValidateHttpMethod(unittest.TestCase):
 
@@ -73,9 +73,13 @@ class TestAdmin(unittest.TestCase):
         
     def test_edit_trustscore_parameters(self):
         """Test editing trust score parameters"""
-        new_params = {"threshold": 0.8, "weight_factor": 1.2}
-        result = self.test_admin.edit_trustscore_parameters(new_params)
+        result = self.test_admin.edit_trustscore_parameters({"verified_threshold": 0.8})
         self.assertTrue(result["success"])
+        self.assertEqual(result["new_parameters"]["verified_threshold"], 0.8)
+
+    def test_edit_trustscore_parameters_rejects_unknown_keys(self):
+        result = self.test_admin.edit_trustscore_parameters({"threshold": 0.8, "weight_factor": 1.2})
+        self.assertFalse(result["success"])
 
 
 class TestUserFactory(unittest.TestCase):
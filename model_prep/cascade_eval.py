@@ -0,0 +1,67 @@
+"""
+Offline latency/accuracy trade-off of cascade mode on a labelled dataset.
+
+Both models score every article once (timed); each uncertainty band is then evaluated from those
+scores: accuracy, escalated fraction and the expected per-article latency
+cheap_ms + escalated_fraction * lstm_ms. "tfidf only" and "lstm only" are the two ends of the trade-off.
+
+Usage: python model_prep/cascade_eval.py --dataset model_prep/news.csv --model fake_news_model.tflite
+       [--vocab tokenizer_vocab.json] [--limit 2000] [--bands 0.45:0.55 0.4:0.6 0.3:0.7]
+"""
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+import model_config
+from evaluation import accuracy, load_labelled_csv
+from model_testing import predict_news_batch
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'NSV-app', 'models')))
+from ml_model import MLModel
+
+
+def timed(score, texts, batch_size):
+    start = time.perf_counter()
+    probabilities = np.concatenate([np.asarray(score(texts[i:i + batch_size]), dtype=float)
+                                    for i in range(0, len(texts), batch_size)])
+    return probabilities, 1000 * (time.perf_counter() - start) / len(texts)
+
+
+def evaluate_band(cheap, lstm, labels, low, high):
+    escalated = (cheap >= low) & (cheap <= high)
+    return accuracy(labels, np.where(escalated, lstm, cheap)), float(np.mean(escalated))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--dataset', default='news.csv')
+    parser.add_argument('--model', required=True, help='LSTM as .tflite or .h5')
+    parser.add_argument('--vocab', default=model_config.TOKENIZER_VOCAB_FILE)
+    parser.add_argument('--limit', type=int)
+    parser.add_argument('--batch-size', type=int, default=1, help='articles per call (1 = request-like latency)')
+    parser.add_argument('--bands', nargs='+', default=['0.45:0.55', '0.4:0.6', '0.35:0.65', '0.3:0.7', '0.2:0.8'])
+    args = parser.parse_args()
+
+    texts, labels = load_labelled_csv(args.dataset, args.limit)
+    lstm_model = MLModel()
+    lstm_model.load_tokenizer(args.vocab)
+    lstm_model.load_model(args.model)
+
+    cheap, cheap_ms = timed(lambda batch: predict_news_batch(batch, parallel=False)["probabilities"], texts, args.batch_size)
+    lstm, lstm_ms = timed(lstm_model.predict_probabilities, texts, args.batch_size)
+
+    print(f'{len(texts)} articles, tfidf {cheap_ms:.2f} ms/article, lstm {lstm_ms:.2f} ms/article')
+    print(f'{"mode":<16} {"accuracy":>9} {"escalated":>10} {"ms/article":>11}')
+    print(f'{"tfidf only":<16} {accuracy(labels, cheap):>9.4f} {0.0:>10.2%} {cheap_ms:>11.2f}')
+    for band in args.bands:
+        low, high = (float(value) for value in band.split(':'))
+        band_accuracy, fraction = evaluate_band(cheap, lstm, labels, low, high)
+        print(f'{f"cascade {low}-{high}":<16} {band_accuracy:>9.4f} {fraction:>10.2%} {cheap_ms + fraction * lstm_ms:>11.2f}')
+    print(f'{"lstm only":<16} {accuracy(labels, lstm):>9.4f} {1.0:>10.2%} {lstm_ms:>11.2f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,89 @@
+"""
+Training input for model_creation.py: the cleaned frame of preprocessing.load_training_data -> tf.data.
+
+The CSVs are read and cleaned once (the result is cached as Parquet, see preprocessing.py) and the
+whole cleaned frame is held in memory; the vocabulary is fitted on it and the train/validation/test
+splits replay its rows through tf.data.Dataset.from_generator. Only the encoding is streamed: rows are
+tokenized, padded and batched inside tf.data with parallel map and prefetch, so the encoded int32
+matrix is never materialized, and encoded rows are cached to a file so later epochs skip the generator.
+"""
+import os
+from collections import Counter
+
+import model_config
+from preprocessing import CACHE_DIR, CLEANING_CONFIG, input_hash
+
+SHUFFLE_BUFFER = 10000
+TEST_SPLIT = 0.2
+SPLITS = ('train', 'validation', 'test')
+
+
+def split_of(row, test=TEST_SPLIT, validation=model_config.VALIDATION_SPLIT):
+    # A hash of the row position picks the split, so the same frame always splits the same way
+    bucket = (row * 2654435761 % 2 ** 32) / 2 ** 32
+    if bucket < test:
+        return 'test'
+    if bucket < test + (1 - test) * validation:
+        return 'validation'
+    return 'train'
+
+
+def fit_word_index(texts):
+    """
+    Equivalent of Keras Tokenizer.fit_on_texts on the cleaned texts: words ranked by count,
+    ties in order of first appearance, indices from 1.
+    """
+    counts = Counter()
+    for text in texts:
+        counts.update(text.split())
+    ranked = sorted(counts.items(), key=lambda item: item[1], reverse=True)
+    return {word: index for index, (word, _) in enumerate(ranked, start=1)}
+
+
+def dataset_cache_key(paths, encoder, maxlen=model_config.MAX_SEQUENCE_LENGTH):
+    """Key of the encoded-row file cache: the input CSVs, the cleaning and the encoding."""
+    return input_hash(paths, dict(CLEANING_CONFIG, num_words=encoder.num_words, maxlen=maxlen, vocabulary=len(encoder)))
+
+
+def make_datasets(data, encoder, maxlen=model_config.MAX_SEQUENCE_LENGTH, batch_size=model_config.BATCH_SIZE,
+                  cache_key=None):
+    """
+    {"train", "validation", "test"} tf.data datasets of (int32 [batch, maxlen], int8 [batch]) batches
+    from a cleaned (final_news, target) frame. Encoded rows are cached to files named after cache_key, if given.
+    """
+    import tensorflow as tf
+
+    words = list(encoder.word_index)
+    table = tf.lookup.StaticHashTable(
+        tf.lookup.KeyValueTensorInitializer(tf.constant(words, dtype=tf.string),
+                                            tf.constant([encoder.word_index[word] for word in words], dtype=tf.int32)),
+        default_value=0)
+    texts, targets = data['final_news'].to_numpy(), data['target'].to_numpy()
+    positions = {split: [] for split in SPLITS}
+    for row in range(len(data)):
+        positions[split_of(row)].append(row)
+
+    def rows(split):
+        def generator():
+            for row in positions[split]:
+                yield texts[row], targets[row]
+        return generator
+
+    def encode(text, target):
+        # Same result as TextEncoder.encode: known words only, pre-truncated and pre-padded to maxlen
+        ids = table.lookup(tf.strings.split(text))
+        ids = tf.boolean_mask(ids, ids > 0)[-maxlen:]
+        return tf.ensure_shape(tf.pad(ids, [[maxlen - tf.size(ids), 0]]), [maxlen]), target
+
+    datasets = {}
+    for split in SPLITS:
+        dataset = tf.data.Dataset.from_generator(rows(split), output_signature=(
+            tf.TensorSpec(shape=(), dtype=tf.string), tf.TensorSpec(shape=(), dtype=tf.int8)))
+        dataset = dataset.map(encode, num_parallel_calls=tf.data.AUTOTUNE)
+        if cache_key:
+            os.makedirs(CACHE_DIR, exist_ok=True)
+            dataset = dataset.cache(os.path.join(CACHE_DIR, f'tfdata-{cache_key}-{split}'))
+        if split == 'train':
+            dataset = dataset.shuffle(SHUFFLE_BUFFER, reshuffle_each_iteration=True)
+        datasets[split] = dataset.batch(batch_size).prefetch(tf.data.AUTOTUNE)
+    return datasets
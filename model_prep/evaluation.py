@@ -0,0 +1,60 @@
+import random
+
+import numpy as np
+
+
+def load_labelled_csv(path, limit=None, seed=18):
+    """
+    news.csv layout (dataset_preproces.py): title, text and target FAKE/TRUE. Returns texts and labels (1 = real).
+    """
+    import pandas as pd
+
+    data = pd.read_csv(path)
+    if limit is not None and limit < len(data):
+        data = data.sample(n=limit, random_state=seed)
+    texts = (data['title'].fillna('') + ' ' + data['text'].fillna('')).tolist()
+    labels = (data['target'] != 'FAKE').astype(int).to_numpy()
+    return texts, labels
+
+
+def generated_corpus(count, fake_text, real_text, sentences_per_document=8, seed=18):
+    """
+    Labelled documents built by resampling the sentences of one fake and one real sample text.
+    Only good for timing and for catching gross regressions: it is far easier than real data.
+    """
+    rng = random.Random(seed)
+    pools = [fake_text.split('. '), real_text.split('. ')]
+    texts, labels = [], []
+    for i in range(count):
+        label = i % 2
+        texts.append('. '.join(rng.choice(pools[label]) for _ in range(sentences_per_document)))
+        labels.append(label)
+    return texts, np.asarray(labels)
+
+
+def accuracy(labels, probabilities, threshold=0.5):
+    return float(np.mean((np.asarray(probabilities) >= threshold) == np.asarray(labels)))
+
+
+def roc_auc(labels, scores):
+    """
+    Area under the ROC curve via the rank-sum (Mann-Whitney) statistic, ties counted as half.
+    """
+    labels = np.asarray(labels)
+    scores = np.asarray(scores, dtype=float)
+    positives = int(labels.sum())
+    negatives = len(labels) - positives
+    if positives == 0 or negatives == 0:
+        return None
+    order = np.argsort(scores, kind='mergesort')
+    ranks = np.empty(len(scores))
+    sorted_scores = scores[order]
+    start = 0
+    while start < len(scores):
+        end = start
+        while end + 1 < len(scores) and sorted_scores[end + 1] == sorted_scores[start]:
+            end += 1
+        ranks[order[start:end + 1]] = (start + end) / 2 + 1
+        start = end + 1
+    return float((ranks[labels == 1].sum() - positives * (positives + 1) / 2) / (positives * negatives))
+
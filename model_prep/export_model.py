@@ -0,0 +1,98 @@
+import argparse
+import os
+import sys
+
+import numpy as np
+
+import model_config
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'NSV-app', 'models')))
+from lite_model import LiteModel
+
+
+def export_tflite(model, output_path, quantize=False):
+    """
+    Converts a Keras model (or a path to one) to a TFLite flatbuffer.
+    quantize=True applies dynamic-range quantization: weights are stored as int8 and
+    dequantized on the fly, activations stay float32.
+    """
+    import tensorflow as tf
+
+    if isinstance(model, str):
+        model = tf.keras.models.load_model(model)
+    converter = tf.lite.TFLiteConverter.from_keras_model(model)
+    # Builtin ops only: the Bidirectional LSTM lowers to fused sequence-LSTM kernels, so the
+    # standalone runtime can serve it without the TensorFlow (Flex) delegate
+    converter.target_spec.supported_ops = [tf.lite.OpsSet.TFLITE_BUILTINS]
+    if quantize:
+        converter.optimizations = [tf.lite.Optimize.DEFAULT]
+    flatbuffer = converter.convert()
+    with open(output_path, 'wb') as file:
+        file.write(flatbuffer)
+    print(f'Exported {output_path} ({len(flatbuffer) / 1024:.0f} KB, quantize={quantize})')
+    return output_path
+
+
+def parity_sequences(count, maxlen, vocab_size, seed=18):
+    """
+    Synthetic padded token sequences with realistic length spread, for when no encoded test set is given.
+    """
+    rng = np.random.default_rng(seed)
+    sequences = np.zeros((count, maxlen), dtype=np.int32)
+    for row, length in enumerate(rng.integers(1, maxlen + 1, size=count)):
+        sequences[row, maxlen - length:] = rng.integers(1, vocab_size, size=length)
+    return sequences
+
+
+def check_parity(keras_model, lite_path, sequences, batch_size=model_config.BATCH_SIZE):
+    """
+    Runs the Keras and TFLite models on the same sequences.
+    Returns the label agreement rate (0.5 threshold) and the max/mean absolute score difference.
+    """
+    import tensorflow as tf
+
+    if isinstance(keras_model, str):
+        keras_model = tf.keras.models.load_model(keras_model)
+    lite_model = LiteModel(lite_path)
+    expected = keras_model.predict(sequences, batch_size=batch_size, verbose=0).ravel()
+    actual = np.concatenate([lite_model.predict_on_batch(sequences[start:start + batch_size]).ravel()
+                             for start in range(0, len(sequences), batch_size)])
+    difference = np.abs(expected - actual)
+    return {
+        "agreement": float(np.mean((expected >= 0.5) == (actual >= 0.5))),
+        "max_abs_diff": float(difference.max()),
+        "mean_abs_diff": float(difference.mean()),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Export fake_news_model.h5 to TFLite and check parity.')
+    parser.add_argument('model', nargs='?', default='fake_news_model.h5')
+    parser.add_argument('--output', default=model_config.LITE_MODEL_FILE)
+    parser.add_argument('--quantize', action='store_true', help='dynamic-range int8 weight quantization')
+    parser.add_argument('--sequences', help='.npy file of padded token sequences (e.g. the encoded test split)')
+    parser.add_argument('--samples', type=int, default=2000, help='synthetic parity samples without --sequences')
+    parser.add_argument('--min-agreement', type=float, default=model_config.PARITY_MIN_AGREEMENT)
+    args = parser.parse_args()
+
+    import tensorflow as tf
+
+    keras_model = tf.keras.models.load_model(args.model)
+    export_tflite(keras_model, args.output, quantize=args.quantize)
+
+    if args.sequences:
+        sequences = np.load(args.sequences).astype(np.int32)
+    else:
+        maxlen = keras_model.input_shape[1]
+        vocab_size = next(layer.input_dim for layer in keras_model.layers
+                          if isinstance(layer, tf.keras.layers.Embedding))
+        sequences = parity_sequences(args.samples, maxlen, vocab_size)
+    report = check_parity(keras_model, args.output, sequences)
+    print(f'Parity on {len(sequences)} samples: agreement {report["agreement"]:.4f}, '
+          f'max |diff| {report["max_abs_diff"]:.5f}, mean |diff| {report["mean_abs_diff"]:.5f}')
+    if report["agreement"] < args.min_agreement:
+        sys.exit(f'Label agreement {report["agreement"]:.4f} is below {args.min_agreement}; not shipping {args.output}.')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,132 @@
+import argparse
+import json
+import os
+
+import numpy as np
+
+
+class GloveStore:
+    """
+    GloVe word vectors as one contiguous float32 matrix plus a vocabulary.
+    The matrix is memory-mapped, so loading is instant and pages are shared between workers.
+    """
+
+    def __init__(self, vectors, words):
+        self.vectors = vectors
+        self.words = words
+        self._index = None
+
+    @classmethod
+    def load(cls, prefix, mmap=True):
+        """
+        Loads <prefix>.npy (the matrix) and <prefix>.vocab (one word per line, row order).
+        """
+        vectors = np.load(prefix + '.npy', mmap_mode='r' if mmap else None)
+        with open(prefix + '.vocab', encoding='utf-8') as file:
+            words = file.read().split('\n')
+        if words and words[-1] == '':
+            words.pop()
+        return cls(vectors, words)
+
+    @property
+    def index(self):
+        if self._index is None:
+            self._index = {word: row for row, word in enumerate(self.words)}
+        return self._index
+
+    @property
+    def dim(self):
+        return self.vectors.shape[1]
+
+    def __len__(self):
+        return len(self.words)
+
+    def __contains__(self, word):
+        return word in self.index
+
+    def get(self, word, default=None):
+        """
+        Dict-style lookup, so the store can stand in for the old word_to_vector dict.
+        """
+        row = self.index.get(word)
+        return default if row is None else self.vectors[row]
+
+    def gather(self, word_to_index, num_rows):
+        """
+        Builds an embedding matrix (num_rows x dim) in one fancy-indexing gather.
+        Rows of words without a vector, and word indices >= num_rows, stay zero.
+        """
+        index = self.index
+        targets, rows = [], []
+        for word, i in word_to_index.items():
+            row = index.get(word)
+            if i < num_rows and row is not None:
+                targets.append(i)
+                rows.append(row)
+        embedding_matrix = np.zeros((num_rows, self.dim), dtype=np.float32)
+        if rows:
+            rows = np.asarray(rows, dtype=np.int64)
+            order = np.argsort(rows)  # sequential reads from the memory map
+            embedding_matrix[np.asarray(targets, dtype=np.int64)[order]] = self.vectors[rows[order]]
+        return embedding_matrix
+
+
+def store_prefix(embedding_file):
+    """
+    glove.6B.50d.txt -> glove.6B.50d (the .npy / .vocab pair lives next to the text file).
+    """
+    root, extension = os.path.splitext(embedding_file)
+    return root if extension == '.txt' else embedding_file
+
+
+def read_vocabulary(path):
+    """
+    Reads a vocabulary to prune to: a JSON word -> index mapping (tokenizer word_index)
+    or a JSON list, or a text file with one word per line.
+    """
+    with open(path, encoding='utf-8') as file:
+        if path.endswith('.json'):
+            data = json.load(file)
+            return set(data.get('word_index', data) if isinstance(data, dict) else data)
+        return {line.strip() for line in file if line.strip()}
+
+
+def convert_glove(embedding_file, prefix=None, vocabulary=None):
+    """
+    One-time conversion of a GloVe text file to the binary store.
+    With a vocabulary, only those words are kept (e.g. the tokenizer's vocabulary).
+    """
+    prefix = prefix or store_prefix(embedding_file)
+    words, vectors = [], []
+    with open(embedding_file, encoding='utf-8') as f:
+        for line in f:
+            word, _, values = line.rstrip().partition(' ')
+            if vocabulary is not None and word not in vocabulary:
+                continue
+            words.append(word)
+            vectors.append(np.asarray(values.split(), dtype=np.float32))
+    matrix = np.vstack(vectors) if vectors else np.zeros((0, 0), dtype=np.float32)
+    np.save(prefix + '.npy', matrix)
+    with open(prefix + '.vocab', 'w', encoding='utf-8') as file:
+        file.write('\n'.join(words) + '\n')
+    print(f'Converted {len(words)} word vectors to {prefix}.npy / {prefix}.vocab')
+    return prefix
+
+
+def load_glove(embedding_file, mmap=True):
+    """
+    Loads the binary store for embedding_file, converting the text file once if needed.
+    """
+    prefix = store_prefix(embedding_file)
+    if not os.path.exists(prefix + '.npy'):
+        convert_glove(embedding_file, prefix)
+    return GloveStore.load(prefix, mmap=mmap)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Convert a GloVe text file to a memory-mapped binary store.')
+    parser.add_argument('embedding_file')
+    parser.add_argument('--prefix', help='output prefix, defaults to the text file name without .txt')
+    parser.add_argument('--vocab', help='prune to this vocabulary (tokenizer JSON or one word per line)')
+    args = parser.parse_args()
+    convert_glove(args.embedding_file, args.prefix, read_vocabulary(args.vocab) if args.vocab else None)
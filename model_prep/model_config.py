@@ -5,4 +5,19 @@ MAX_VOCAB_SIZE = 20000
 EMBEDDING_DIM = 50
 VALIDATION_SPLIT = 0.2
 BATCH_SIZE = 32
-EPOCHS = 10
\ No newline at end of file
+EPOCHS = 10
+
+# Micro-batching of MLModel predictions (see MLModel.enable_batching)
+MAX_BATCH_SIZE = 32
+MAX_BATCH_WAIT_MS = 5
+
+# TFLite export of fake_news_model.h5 (see export_model.py)
+LITE_MODEL_FILE = 'fake_news_model.tflite'
+PARITY_MIN_AGREEMENT = 0.99
+
+# Fitted tokenizer vocabulary written by model_creation.py and loaded by MLModel.load_tokenizer
+TOKENIZER_VOCAB_FILE = 'tokenizer_vocab.json'
+
+# Cascade (see model_testing.news_cascade): the LSTM re-scores articles whose cheap P(real) is in [low, high]
+CASCADE_LOW = 0.35
+CASCADE_HIGH = 0.65
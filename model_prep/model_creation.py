@@ -1,95 +1,42 @@
-import pandas as pd
 import numpy as np
-import itertools
-import seaborn as sns
-import nltk, re, string
-from string import punctuation
-from nltk.corpus import stopwords
-from sklearn import metrics
-import matplotlib.pyplot as plt
-from wordcloud import WordCloud,STOPWORDS
-from sklearn.metrics import classification_report,confusion_matrix,accuracy_score,roc_auc_score
-from sklearn.model_selection import train_test_split
-from tensorflow.keras.preprocessing.text import Tokenizer
-from tensorflow.keras.preprocessing.sequence import pad_sequences
-from tensorflow.keras.models import Sequential, Model
-from tensorflow.keras.layers import Embedding, LSTM, Dense, Conv1D, MaxPooling1D, Bidirectional, GlobalMaxPool1D, Input, Dropout
-from tensorflow.keras.models import load_model
+from sklearn.metrics import accuracy_score
+from tensorflow.keras.models import Model
+from tensorflow.keras.layers import Embedding, LSTM, Dense, Bidirectional, GlobalMaxPool1D, Input
 
 import model_config
 import os 
+import sys
+from glove_store import load_glove
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'NSV-app', 'models'))
+from text_encoder import TextEncoder
+from data_pipeline import dataset_cache_key, fit_word_index, make_datasets
+from preprocessing import load_stopwords, load_training_data
 
 #nltk.download('stopwords')
 
-data = pd.read_csv('model_prep/news.csv')
-#print(data.head())
+# The CSVs are read and cleaned once, and the cleaned frame is cached (see preprocessing.py);
+# the vocabulary and the tf.data splits (see data_pipeline.py) are both built from that frame
+paths = ['model_prep/news.csv']
+data = load_training_data(paths)
 
-def extract_text(text):
-    regex = re.search(r"(?<=\(Reuters\)\s\-\s).*",text)
-    if regex:
-        return regex.group(0)
-    return text
-
-data['text_processed'] = data['text'].apply(extract_text)
-data.drop(['Unnamed: 0'], axis=1, inplace=True)
-
-#print(data.head())
-
-data['final_news'] = data['title'] + ' ' + data['text_processed']
-
-#print(data.head())
-
-data = data.drop(['title', 'text', 'text_processed'], axis=1)
-
-#print(data.head())
-
-stop = stopwords.words('english')
-def clean_text(text):
-    text = text.lower()
-    text = ' '.join(word for word in text.split() if word not in stop)
-    text = re.sub(r'[^a-z]',' ',text)
-    return text
-
-data['final_news'] = data['final_news'].apply(clean_text)
-
-#print(data.head())
-
-data['target'] = data['target'].apply(lambda x: 0 if x == 'FAKE' else 1)
-
-#print(data.head())  
-
-y = data['target'].values
-X = data.drop(['target'], axis=1)
-
-#print(X.shape, y.shape)
-
-word_to_vector = {} 
-with open(model_config.EMBEDDING_FILE, encoding='utf-8') as f:
-    for line in f:
-        values = line.split()
-        word = values[0]
-        vec = np.asarray(values[1:], dtype='float32')
-        word_to_vector[word] = vec
+# Memory-mapped binary store, converted from the GloVe text file on first use
+word_to_vector = load_glove(model_config.EMBEDDING_FILE)
         
 #print('Found %s word vectors.' % len(word_to_vector))
 
-tokenizer = Tokenizer(num_words=model_config.MAX_VOCAB_SIZE)
-tokenizer.fit_on_texts(list(X['final_news']))
-X = tokenizer.texts_to_sequences(list(X['final_news']))
-X = pad_sequences(X, maxlen=model_config.MAX_SEQUENCE_LENGTH)
-#print(X.shape)
+# Same word ranking as Tokenizer.fit_on_texts
+word_to_index = fit_word_index(data['final_news'])
+# Training encodes with the same vocabulary artifact that MLModel serves with; it also carries
+# the stopwords, so serving cleans raw text exactly like preprocessing.py
+encoder = TextEncoder(word_to_index, model_config.MAX_VOCAB_SIZE, load_stopwords())
+encoder.save(model_config.TOKENIZER_VOCAB_FILE)
+datasets = make_datasets(data, encoder, cache_key=dataset_cache_key(paths, encoder))
 
-word_to_index = tokenizer.word_index
 #print('Found %s unique tokens.' % len(word_to_index))   
 
 # get the embedding matrix for the words we have in the dataset
 number_of_words = min(model_config.MAX_VOCAB_SIZE, len(word_to_index) + 1)
-embedding_matrix = np.zeros((number_of_words, model_config.EMBEDDING_DIM))
-for word, i in word_to_index.items():
-    if i < model_config.MAX_VOCAB_SIZE:
-        embedding_vector = word_to_vector.get(word)
-        if embedding_vector is not None:
-            embedding_matrix[i] = embedding_vector
+embedding_matrix = word_to_vector.gather(word_to_index, number_of_words)
             
 embedding_layer = Embedding(number_of_words, model_config.EMBEDDING_DIM, weights=[embedding_matrix], input_length=model_config.MAX_SEQUENCE_LENGTH, trainable=False)
 
@@ -104,14 +51,19 @@ model = Model(input_, output)
 model.compile(loss='binary_crossentropy', optimizer='adam', metrics=['accuracy'])
 model.summary()
 
-X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=0.20, random_state=18)
+prediciton = model.fit(datasets['train'], epochs=model_config.EPOCHS, validation_data=datasets['validation'])
 
-prediciton = model.fit(X_train, y_train, batch_size=model_config.BATCH_SIZE, epochs=model_config.EPOCHS, validation_split=model_config.VALIDATION_SPLIT)
-
-pred_test = model.predict(X_test)
+pred_test = model.predict(datasets['test'])
+y_test = np.concatenate([labels.numpy() for _, labels in datasets['test']])
 
 print(pred_test)
 print('Accuracy: ', accuracy_score(y_test, pred_test.round()))
 
 model.save('fake_news_model.h5')
 
+# Lean serving artifact: MLModel loads .tflite files without importing TensorFlow
+from export_model import export_tflite, check_parity
+export_tflite(model, model_config.LITE_MODEL_FILE)
+X_parity = np.concatenate([sequences.numpy() for sequences, _ in datasets['test'].take(2000 // model_config.BATCH_SIZE)])
+print('TFLite parity: ', check_parity(model, model_config.LITE_MODEL_FILE, X_parity))
+
@@ -1,58 +1,169 @@
-from tensorflow.keras.models import load_model
-import pandas as pd
 import numpy as np
 import sys
-import itertools
-import seaborn as sns
-import nltk, re, string
+import re
 import os 
-from string import punctuation
-from nltk.corpus import stopwords
-from sklearn import metrics
-import matplotlib.pyplot as plt
-from wordcloud import WordCloud,STOPWORDS
-from sklearn.metrics import classification_report,confusion_matrix,accuracy_score,roc_auc_score
-from sklearn.model_selection import train_test_split
-from tensorflow.keras.preprocessing.text import Tokenizer
-from tensorflow.keras.preprocessing.sequence import pad_sequences
-from tensorflow.keras.models import Sequential, Model
-from tensorflow.keras.layers import Embedding, LSTM, Dense, Conv1D, MaxPooling1D, Bidirectional, GlobalMaxPool1D, Input, Dropout
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), ".")))
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../NSV-app/models")))
 import model_config
-from nltk.stem import WordNetLemmatizer
-from nltk.corpus import stopwords
+from resource_registry import registry
+from model_registry import ModelRegistry
+from cascade import CascadeClassifier
 import pickle
+from functools import lru_cache
+from concurrent.futures import ProcessPoolExecutor
 
+# Nothing heavy is loaded at import: the pickles, stopwords and WordNet are read on first use or in warmup
+MODEL_DIR = os.path.dirname(os.path.abspath(__file__))
 
-loaded_model = pickle.load(open("model_prep/model.pkl", 'rb'))
-vector = pickle.load(open("model_prep/vector.pkl", 'rb'))
 
+def _load_pickle(path):
+    with open(path, 'rb') as file:
+        return pickle.load(file)
 
-def fake_news_det(news):
-    lemmatizer = WordNetLemmatizer()
-    stpwrds = set(stopwords.words('english'))
-    corpus = []
-    review = news
-    review = re.sub(r'[^a-zA-Z\s]', '', review)
+
+def _load_bundle(directory):
+    """
+    One model version: the classifier and the vectorizer it was trained with.
+    """
+    return {
+        "model": _load_pickle(os.path.join(directory, 'model.pkl')),
+        "vectorizer": _load_pickle(os.path.join(directory, 'vector.pkl')),
+    }
+
+
+# NSV_MODEL_ROOT holds versioned artifacts (see model_registry.py); without a published version
+# the pickles next to this file are served as version "unversioned"
+model_registry = ModelRegistry(
+    os.environ.get('NSV_MODEL_ROOT', os.path.join(MODEL_DIR, 'versions')),
+    _load_bundle,
+    fallback=('unversioned', lambda: _load_bundle(MODEL_DIR)),
+    on_swap=lambda active: registry.set('news_model', active),
+)
+registry.register('news_model', model_registry.current)
+
+# The label the model uses for fake news; predict_news returns 1 for real news
+FAKE_LABEL = 1
+# Batches at least this large are preprocessed in a process pool
+PARALLEL_THRESHOLD = 64
+
+# After non-letters are removed, these are the only word_tokenize splits a plain split() misses
+_TREEBANK_CONTRACTIONS = re.compile(r'\b(can)(not)\b|\b(gim)(me)\b|\b(gon)(na)\b|\b(got)(ta)\b|\b(lem)(me)\b|\b(wan)(na)(?=\s)')
+_executor = None
+
+
+@lru_cache(maxsize=100000)
+def _lemmatize(word):
+    return registry.get('wordnet_lemmatizer').lemmatize(word)
+
+
+def _split_contraction(match):
+    return ' '.join(group for group in match.groups() if group)
+
+
+def preprocess_news(news):
+    """
+    Cleans one document the way the vectorizer was trained: letters only, lowercase,
+    no stopwords, lemmatized. Tokenization matches nltk.word_tokenize on this input.
+    """
+    review = re.sub(r'[^a-zA-Z\s]', '', news)
     review = review.lower()
-    review = nltk.word_tokenize(review)
-    corpus = []
-    for y in review :
-        if y not in stpwrds :
-            corpus.append(lemmatizer.lemmatize(y))
-    input_data = [' '.join(corpus)]
-    vectorized_input_data = vector.transform(input_data)
-    prediction = loaded_model.predict(vectorized_input_data)
+    review = _TREEBANK_CONTRACTIONS.sub(_split_contraction, review)
+    stpwrds = registry.get('stopwords_en')
+    return ' '.join(_lemmatize(word) for word in review.split() if word not in stpwrds)
+
+
+def _get_executor():
+    global _executor
+    if _executor is None:
+        # Load the NLTK assets before the pool forks, so workers inherit them
+        registry.warmup(['stopwords_en', 'wordnet_lemmatizer'])
+        _executor = ProcessPoolExecutor()
+    return _executor
+
+
+def preprocess_news_batch(texts, parallel=None):
+    """
+    Preprocesses many documents; large batches are spread over a process pool.
+    """
+    if parallel is None:
+        parallel = len(texts) >= PARALLEL_THRESHOLD
+    if not parallel:
+        return [preprocess_news(text) for text in texts]
+    chunksize = max(1, len(texts) // (4 * (os.cpu_count() or 1)))
+    return list(_get_executor().map(preprocess_news, texts, chunksize=chunksize))
+
+
+def _real_news_probabilities(loaded_model, features):
+    """
+    Probability that each document is real news. The PassiveAggressiveClassifier has no
+    predict_proba, so its decision margin is squashed with a logistic function: the value
+    orders documents by confidence but is not a calibrated probability.
+    """
+    classes = list(loaded_model.classes_)
+    if hasattr(loaded_model, 'predict_proba'):
+        fake_probabilities = loaded_model.predict_proba(features)[:, classes.index(FAKE_LABEL)]
+    else:
+        margins = loaded_model.decision_function(features)
+        # decision_function is positive towards classes_[1]
+        if classes[1] != FAKE_LABEL:
+            margins = -margins
+        fake_probabilities = 1.0 / (1.0 + np.exp(-margins))
+    return 1.0 - fake_probabilities
+
+
+def predict_news_batch(texts, parallel=None):
+    """
+    Scores many documents with one vectorizer transform and one model call.
+    Returns {"labels": 1 for real / 0 for fake (as predict_news), "probabilities": P(real),
+    "version": the model version that scored them}.
+    """
+    corpus = preprocess_news_batch(list(texts), parallel)
+    # Read the active version once: a hot-swap mid-batch must not mix vectorizer and model versions
+    active = model_registry.current()
+    features = active.bundle["vectorizer"].transform(corpus)
+    predictions = active.bundle["model"].predict(features)
+    return {
+        "labels": (predictions != FAKE_LABEL).astype(int),
+        "probabilities": _real_news_probabilities(active.bundle["model"], features),
+        "version": active.version,
+    }
+
+
+def _load_lstm_model():
+    from ml_model import MLModel
+    model = MLModel()
+    model.load_tokenizer(os.environ.get('NSV_CASCADE_VOCAB', os.path.join(MODEL_DIR, model_config.TOKENIZER_VOCAB_FILE)))
+    model.load_model(os.environ['NSV_CASCADE_MODEL'])
+    return model
+
+
+def lstm_real_news_probabilities(texts):
+    return registry.get('lstm_model').predict_probabilities(texts)
+
+
+# NSV_CASCADE_MODEL (a .tflite or .h5 LSTM) enables cascade mode: the TF-IDF model scores every
+# article and the LSTM is consulted only for articles inside the uncertainty band
+news_cascade = None
+if os.environ.get('NSV_CASCADE_MODEL'):
+    registry.register('lstm_model', _load_lstm_model)
+    news_cascade = CascadeClassifier(
+        lambda texts: predict_news_batch(texts, parallel=False),
+        lstm_real_news_probabilities,
+        float(os.environ.get('NSV_CASCADE_LOW', model_config.CASCADE_LOW)),
+        float(os.environ.get('NSV_CASCADE_HIGH', model_config.CASCADE_HIGH)),
+    )
+
+
+def fake_news_det(news):
+    bundle = model_registry.current().bundle
+    vectorized_input_data = bundle["vectorizer"].transform([preprocess_news(news)])
+    prediction = bundle["model"].predict(vectorized_input_data)
      
     return prediction
 
 def predict_news(text):
     
-    prediction = fake_news_det(text)
-    if prediction == 1:
-        return 0
-    else:
-        return 1
+    return int(predict_news_batch([text], parallel=False)["labels"][0])
 
 
 fake_news = "Washington, D.C. — Vice President Kamala Harris continued to get the worst of the exchanges as a heated argument with a talking cactus toy entered its third hour this afternoon. The cactus seemed to have an immediate retort for everything the Vice President said, confounding Harris' intellect as she steadily lost control of the dispute. So, you think there's great significance to the passage of time, huh cactus? asked the Vice President. So, you think there's great significance to the passage of time, huh cactus? replied the cactus. Why are you calling me a cactus? I'm the Vice President! cried Harris. Why are you calling me a cactus? I'm the Vice President! retorted the cactus. But you are a cactus! said the cactus, still calm and collected as ever. The debate continued to rage on, with the cactus firmly remaining in control as the hours rolled by. Aides tried to intervene, but Harris remained determined as ever to best the succulent. At publishing time, Harris and the cactus had descended into a lengthy loop of shouting I'm the real Vice President! at each other. Gen Z keeps pulling up to new jobs, no cap. Here are their top qualifications."
@@ -0,0 +1,101 @@
+"""
+Training-data preprocessing for model_creation.py, parallel and cached on disk.
+
+Rows are cleaned one by one with text_cleaning.clean_article (the function serving uses; stopwords
+are set lookups), optionally split over a process pool (--workers). The cleaned frame (final_news, target) is written to a Parquet file keyed by a hash of the input
+CSVs and CLEANING_CONFIG, so re-training with unchanged data goes straight to tokenization.
+
+Usage: python model_prep/preprocessing.py model_prep/news.csv [--workers 4] [--no-cache]
+"""
+import argparse
+import hashlib
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import pandas as pd
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'NSV-app', 'models')))
+from text_cleaning import DATELINE, clean_article, load_stopwords
+
+CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '.cache')
+
+# Bump "version" whenever the cleaning (text_cleaning.py) changes, so stale caches are not reused
+CLEANING_CONFIG = {
+    "version": 2,
+    "reuters_prefix": DATELINE,
+    "stopwords": "nltk:english",
+    "keep": "[a-z]",
+}
+
+
+def input_hash(paths, config=CLEANING_CONFIG):
+    digest = hashlib.sha256(json.dumps(config, sort_keys=True).encode('utf-8'))
+    for path in paths:
+        with open(path, 'rb') as file:
+            for chunk in iter(lambda: file.read(1 << 20), b''):
+                digest.update(chunk)
+    return digest.hexdigest()[:16]
+
+
+def _clean_chunk(args):
+    # Row by row with the serving-side text_cleaning.clean_article, so training and serving cannot drift apart;
+    # set lookups per token also beat one big stopword regex over the column
+    titles, texts, stop = args
+    return pd.Series([clean_article(title, text, stop) for title, text in zip(titles, texts)],
+                     index=titles.index, dtype=object)
+
+
+def preprocess(data, stop, workers=None):
+    """
+    Frame with final_news (cleaned title + body) and target (0 fake, 1 real).
+    workers > 1 splits the rows over a process pool.
+    """
+    titles = data['title'].fillna('').astype(str)
+    texts = data['text'].fillna('').astype(str)
+    if workers and workers > 1 and len(data) > workers:
+        bounds = [len(data) * i // workers for i in range(workers + 1)]
+        chunks = [(titles.iloc[start:end], texts.iloc[start:end], stop) for start, end in zip(bounds, bounds[1:])]
+        with ProcessPoolExecutor(workers) as executor:
+            final_news = pd.concat(list(executor.map(_clean_chunk, chunks)))
+    else:
+        final_news = _clean_chunk((titles, texts, stop))
+    return pd.DataFrame({
+        'final_news': final_news.to_numpy(),
+        'target': (data['target'] != 'FAKE').astype('int8').to_numpy(),
+    })
+
+
+def load_training_data(paths, workers=None, use_cache=True):
+    """
+    Reads and preprocesses the labelled CSVs, reusing the cached result when inputs and config are unchanged.
+    """
+    paths = [paths] if isinstance(paths, str) else list(paths)
+    cache_path = os.path.join(CACHE_DIR, f'news-{input_hash(paths)}.parquet')
+    if use_cache and os.path.exists(cache_path):
+        print(f'Loaded preprocessed data from {cache_path}')
+        return pd.read_parquet(cache_path)
+
+    start = time.perf_counter()
+    data = pd.concat([pd.read_csv(path) for path in paths], ignore_index=True)
+    processed = preprocess(data, load_stopwords(), workers)
+    print(f'Preprocessed {len(processed)} rows in {time.perf_counter() - start:.1f} seconds')
+
+    if use_cache:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        try:
+            processed.to_parquet(cache_path, index=False)
+        except ImportError as e:
+            print(f'Not caching preprocessed data ({e})')
+    return processed
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Preprocess (and cache) the labelled training CSVs.')
+    parser.add_argument('paths', nargs='+')
+    parser.add_argument('--workers', type=int, default=os.cpu_count())
+    parser.add_argument('--no-cache', action='store_true')
+    args = parser.parse_args()
+    print(load_training_data(args.paths, args.workers, use_cache=not args.no_cache).head())